@@ -0,0 +1,348 @@
+"""
+Authentication service shared by every auth URL family
+- AuthService: validation, availability checks, registration, login,
+  logout and token verification over one connection pool, one password
+  hashing pool and one session token issuer
+- create_auth_blueprint(): the HTTP endpoints, registered by backend.py
+  under both /api/* and /api/auth/*
+"""
+
+import re
+
+from flask import Blueprint, request, jsonify
+
+from password_hasher import PasswordHasherBusy
+
+USER_TYPES = ('admin', 'recruiter', 'candidate')
+
+# field -> Users column for availability checks
+AVAILABILITY_COLUMNS = {'username': 'Username', 'email': 'EmailId'}
+
+
+# ============ VALIDATION FUNCTIONS ============
+def validate_email(email):
+    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    return re.match(pattern, email) is not None
+
+def validate_phone(phone):
+    phone_clean = re.sub(r'[\s\-()]', '', phone)
+    return len(phone_clean) == 10 and phone_clean.isdigit()
+
+def validate_password(password):
+    return len(password) >= 6
+
+def validate_username(username):
+    return (3 <= len(username) <= 50 and
+            re.match(r'^[a-zA-Z0-9_]+$', username) is not None)
+
+
+class AuthError(Exception):
+    """A rejected auth request - message and HTTP status for the client"""
+
+    def __init__(self, message, status):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+class AuthService:
+    """User registration, login and sessions"""
+
+    def __init__(self, get_connection, password_hasher, session_tokens, availability_filter):
+        self._get_connection = get_connection
+        self.password_hasher = password_hasher
+        self.session_tokens = session_tokens
+        self.availability_filter = availability_filter
+
+    def taken(self, values):
+        """
+        {field: bool} for {field: value} pairs. Values the availability filter
+        rules out are answered without SQL; possible hits share one query.
+        """
+        taken = {field: False for field in values}
+        possible = {field: value for field, value in values.items()
+                    if value and self.availability_filter.might_exist(field, value)}
+        if possible:
+            columns = ', '.join(
+                f"SUM(CASE WHEN {AVAILABILITY_COLUMNS[field]} = ? THEN 1 ELSE 0 END)" for field in possible
+            )
+            where = ' OR '.join(f"{AVAILABILITY_COLUMNS[field]} = ?" for field in possible)
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(f"SELECT {columns} FROM Users WHERE {where}",
+                               list(possible.values()) * 2)
+                row = cursor.fetchone()
+                cursor.close()
+            for field, count in zip(possible, row):
+                taken[field] = bool(count)
+        return taken
+
+    def register(self, user_type, username, first_name, last_name, password, email_id, phone_number):
+        """Validate and insert a new user - raises AuthError"""
+        if not all([user_type, username, first_name, last_name, password, email_id, phone_number]):
+            raise AuthError('All fields are required', 400)
+        if user_type not in USER_TYPES:
+            raise AuthError('Invalid user type', 400)
+        if not validate_username(username):
+            raise AuthError('Invalid username format', 400)
+        if not validate_email(email_id):
+            raise AuthError('Invalid email format', 400)
+        if not validate_phone(phone_number):
+            raise AuthError('Invalid phone number', 400)
+        if not validate_password(password):
+            raise AuthError('Password must be at least 6 characters', 400)
+
+        # Hash password on the hashing pool (before checking out a DB connection)
+        hashed_password = self.password_hasher.hash(password)
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            # Check if username or email already exists
+            cursor.execute(
+                "SELECT Username, EmailId FROM Users WHERE Username = ? OR EmailId = ?",
+                (username, email_id)
+            )
+            existing = cursor.fetchone()
+
+            if existing:
+                raise AuthError('Username already taken' if existing[0] == username else 'Email already registered', 409)
+
+            cursor.execute("""
+                INSERT INTO Users (Username, FirstName, LastName, Password, EmailId, PhoneNumber, UserType)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (username, first_name, last_name, hashed_password, email_id, phone_number, user_type))
+
+            # Claim resumes saved under this email before the account existed
+            cursor.execute("""
+                UPDATE Resumes SET UserID = (SELECT UserId FROM Users WHERE EmailId = ?)
+                WHERE UserID IS NULL
+                  AND ResumeID IN (SELECT ResumeID FROM PersonalInformation WHERE Email = ?)
+            """, (email_id, email_id))
+
+            conn.commit()
+            cursor.close()
+
+        self.availability_filter.add(username, email_id)
+
+    def login(self, username, password):
+        """(user dict, token, expires_at) for valid credentials - raises AuthError"""
+        if not username or not password:
+            raise AuthError('Username and password required', 400)
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT UserId, Username, FirstName, LastName, Password, EmailId, UserType
+                FROM Users
+                WHERE Username = ?
+            """, (username,))
+            user = cursor.fetchone()
+            cursor.close()
+
+        if not user:
+            print(f"❌ User not found: {username}")
+            raise AuthError('Invalid username or password', 401)
+
+        user_id, db_username, first_name, last_name, hashed_password, email, user_type = user
+
+        if not self.password_hasher.verify(password, hashed_password):
+            print(f"❌ Invalid password for: {username}")
+            raise AuthError('Invalid username or password', 401)
+
+        # Upgrade hashes made with a different cost factor (off the request path)
+        if self.password_hasher.needs_rehash(hashed_password):
+            self.password_hasher.rehash_in_background(
+                password, lambda new_hash: self._store_password_hash(user_id, hashed_password, new_hash)
+            )
+
+        token, expires_at = self.session_tokens.issue(user_id, user_type)
+        return {
+            'userId': user_id,
+            'username': db_username,
+            'firstName': first_name,
+            'lastName': last_name,
+            'email': email,
+            'userType': user_type
+        }, token, expires_at
+
+    def logout(self, token):
+        """Revoke a session token; False if it was not valid anyway"""
+        return self.session_tokens.revoke(token)
+
+    def verify(self, token):
+        """Claims of a valid session token, else None (no DB lookup)"""
+        return self.session_tokens.verify(token)
+
+    def _store_password_hash(self, user_id, old_hash, new_hash):
+        """Replace a user's password hash unless it changed in the meantime"""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE Users SET Password = ? WHERE UserId = ? AND Password = ?",
+                (new_hash, user_id, old_hash)
+            )
+            conn.commit()
+            cursor.close()
+        print(f"🔑 Password hash upgraded for user {user_id}")
+
+
+def request_session_token():
+    """Session token from 'Authorization: Bearer ...' or the JSON body's 'token'"""
+    auth = request.headers.get('Authorization', '')
+    if auth.startswith('Bearer '):
+        return auth[7:].strip()
+    data = request.get_json(silent=True)
+    token = data.get('token') if isinstance(data, dict) else None
+    return token if isinstance(token, str) else None
+
+
+def auth_busy_response(error):
+    """503 for logins/registrations the password hashing pool can't take right now"""
+    print(f"⚠️  Auth request shed: {error}")
+    response = jsonify({'success': False, 'message': 'Server busy, please try again in a moment'})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
+
+def create_auth_blueprint(service):
+    """Auth endpoints backed by `service`; register once per URL prefix"""
+    bp = Blueprint('auth', __name__)
+
+    @bp.route('/check-username', methods=['POST'])
+    def check_username():
+        """Check if username already exists"""
+        try:
+            data = request.get_json()
+            username = data.get('username', '').strip()
+
+            if not username:
+                return jsonify({'exists': False}), 200
+
+            return jsonify({'exists': service.taken({'username': username})['username']}), 200
+        except Exception as e:
+            print(f"❌ Check username error: {e}")
+            return jsonify({'exists': False}), 500
+
+    @bp.route('/check-email', methods=['POST'])
+    def check_email():
+        """Check if email already exists"""
+        try:
+            data = request.get_json()
+            email = data.get('emailId', '').strip()
+
+            if not email:
+                return jsonify({'exists': False}), 200
+
+            return jsonify({'exists': service.taken({'email': email})['email']}), 200
+        except Exception as e:
+            print(f"❌ Check email error: {e}")
+            return jsonify({'exists': False}), 500
+
+    @bp.route('/check-availability', methods=['POST'])
+    def check_availability():
+        """
+        Check username and/or emailId in one call (at most one query):
+        {"username": "...", "emailId": "..."} -> {"username": {"exists": ...}, "emailId": {...}}
+        """
+        try:
+            data = request.get_json() or {}
+            values = {}
+            if 'username' in data:
+                values['username'] = (data.get('username') or '').strip()
+            if 'emailId' in data:
+                values['email'] = (data.get('emailId') or '').strip()
+
+            taken = service.taken(values)
+            result = {'success': True}
+            if 'username' in taken:
+                result['username'] = {'exists': taken['username']}
+            if 'email' in taken:
+                result['emailId'] = {'exists': taken['email']}
+            return jsonify(result), 200
+        except Exception as e:
+            print(f"❌ Check availability error: {e}")
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+    @bp.route('/register', methods=['POST'])
+    def register():
+        """Register new user WITH userType"""
+        try:
+            data = request.get_json()
+            username = data.get('username', '').strip()
+            user_type = data.get('userType', '').strip()
+
+            print(f"\n📝 Registration attempt: {username} as {user_type}")
+            service.register(
+                user_type, username,
+                data.get('firstName', '').strip(),
+                data.get('lastName', '').strip(),
+                data.get('password', ''),
+                data.get('emailId', '').strip(),
+                data.get('phoneNumber', '').strip()
+            )
+
+            print(f"✅ User registered successfully: {username} as {user_type}")
+            return jsonify({'success': True, 'message': 'Registration successful'}), 201
+
+        except AuthError as e:
+            if e.status == 409:
+                print(f"❌ Registration failed: {e.message}")
+            return jsonify({'success': False, 'message': e.message}), e.status
+        except PasswordHasherBusy as e:
+            return auth_busy_response(e)
+        except Exception as e:
+            print(f"❌ Registration error: {e}")
+            return jsonify({'success': False, 'message': f'Server error: {str(e)}'}), 500
+
+    @bp.route('/login', methods=['POST'])
+    def login():
+        """Login user - returns userType for frontend routing"""
+        try:
+            data = request.get_json()
+            username = data.get('username', '').strip()
+
+            print(f"\n🔐 Login attempt: {username}")
+            user, token, expires_at = service.login(username, data.get('password', ''))
+
+            print(f"✅ Login successful: {username} ({user['userType']})")
+            return jsonify({
+                'success': True,
+                'message': 'Login successful',
+                'token': token,
+                'expiresAt': expires_at,
+                'user': user
+            }), 200
+
+        except AuthError as e:
+            return jsonify({'success': False, 'message': e.message}), e.status
+        except PasswordHasherBusy as e:
+            return auth_busy_response(e)
+        except Exception as e:
+            print(f"❌ Login error: {e}")
+            return jsonify({'success': False, 'message': f'Server error: {str(e)}'}), 500
+
+    @bp.route('/logout', methods=['POST'])
+    def logout():
+        """Logout user (revokes the session token if one is sent)"""
+        token = request_session_token()
+        if token and service.logout(token):
+            print("👋 Session token revoked")
+        return jsonify({'success': True, 'message': 'Logged out successfully'}), 200
+
+    @bp.route('/verify', methods=['POST'])
+    def verify_session():
+        """Verify a session token - signature, expiry and revocation, no DB lookup"""
+        token = request_session_token()
+        claims = service.verify(token) if token else None
+        if not claims:
+            return jsonify({'valid': False}), 200
+
+        return jsonify({
+            'valid': True,
+            'userId': claims['uid'],
+            'userType': claims['typ'],
+            'expiresAt': claims['exp']
+        }), 200
+
+    return bp
@@ -0,0 +1,132 @@
+"""
+In-memory prefilter for username/email availability checks
+- Bloom filters of every taken username and email (normalized the way
+  SQL Server's case-insensitive collation compares them)
+- A miss means "definitely available" and needs no query; only possible
+  hits are confirmed against Users
+- Built at startup or on first use, updated by register(), and rebuilt in
+  the background every `refresh_interval` seconds to pick up users
+  created elsewhere
+"""
+
+import hashlib
+import math
+import threading
+import time
+
+FIELDS = ('username', 'email')
+
+
+def normalize(value):
+    return (value or '').strip().casefold()
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (double hashing on one blake2b digest)"""
+
+    def __init__(self, capacity, error_rate=0.01):
+        capacity = max(1, capacity)
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, key):
+        for pos in self._positions(key):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key):
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class AvailabilityFilter:
+    """Bloom filters of taken usernames and emails"""
+
+    def __init__(self, get_connection, error_rate=0.01, refresh_interval=300, min_capacity=1024):
+        self._get_connection = get_connection
+        self.error_rate = error_rate
+        self.refresh_interval = refresh_interval
+        self.min_capacity = min_capacity
+        self._filters = None          # {'username': BloomFilter, 'email': BloomFilter}
+        self._loaded_at = 0
+        self._recent = []             # (field, key) added while a rebuild was reading
+        self._rebuilding = False
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()   # one initial build at a time
+
+    def load(self, cursor):
+        """(Re)build both filters from the Users table"""
+        with self._lock:
+            self._recent = []
+        cursor.execute("SELECT Username, EmailId FROM Users")
+        rows = cursor.fetchall()
+
+        # Twice the current users keeps the error rate until the next rebuild
+        capacity = max(self.min_capacity, 2 * len(rows))
+        filters = {field: BloomFilter(capacity, self.error_rate) for field in FIELDS}
+        for username, email in rows:
+            if username:
+                filters['username'].add(normalize(username))
+            if email:
+                filters['email'].add(normalize(email))
+
+        with self._lock:
+            for field, key in self._recent:
+                filters[field].add(key)
+            self._filters = filters
+            self._loaded_at = time.time()
+        print(f"🧂 Availability filter loaded: {len(rows)} users, {capacity} capacity")
+
+    def add(self, username, email):
+        """Record a newly registered user (call after commit)"""
+        with self._lock:
+            for field, value in (('username', username), ('email', email)):
+                if value:
+                    self._recent.append((field, normalize(value)))
+                    if self._filters:
+                        self._filters[field].add(normalize(value))
+
+    def ensure_loaded(self):
+        """Build the filters on first use (e.g. when not started via __main__)"""
+        if self._filters is None:
+            with self._load_lock:
+                if self._filters is None:
+                    with self._get_connection() as conn:
+                        cursor = conn.cursor()
+                        self.load(cursor)
+                        cursor.close()
+
+    def might_exist(self, field, value):
+        """False only if `value` is definitely not taken; True means ask the database"""
+        try:
+            self.ensure_loaded()
+        except Exception as e:
+            print(f"⚠️  Availability filter load failed: {e}")
+            return True
+        filters = self._filters
+        if time.time() - self._loaded_at >= self.refresh_interval:
+            self._schedule_refresh()
+        return normalize(value) in filters[field]
+
+    def _schedule_refresh(self):
+        with self._lock:
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+        threading.Thread(target=self._background_refresh, name='availability-refresh', daemon=True).start()
+
+    def _background_refresh(self):
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                self.load(cursor)
+                cursor.close()
+        except Exception as e:
+            print(f"⚠️  Availability filter refresh failed: {e}")
+        finally:
+            self._rebuilding = False
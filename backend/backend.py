@@ -6,21 +6,121 @@ UNIFIED BACKEND FOR RESUME BUILDER & JOB PORTAL
 - Analytics and admin dashboard
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context
 from flask_cors import CORS
-import pyodbc
-import bcrypt
-import re
+import atexit
+import base64
+import binascii
+import json
+import os
 from datetime import datetime
+from decimal import Decimal
+
+from auth_service import AuthService, create_auth_blueprint, request_session_token
+from availability import AvailabilityFilter
+from cache import TTLCache
+from counters import CounterBuffer
+from db_pool import ConnectionPool
+from geo_index import GeoIndex, PLACE_TYPES
+import job_import
+from master_cache import MasterDataCache
+from master_data import MasterDataSnapshot
+import matching
+from models import Resume
+from password_hasher import PasswordHasher
+from schema import ensure_schema_once
+from search_index import JobSearchIndex, tokenize
+from session_tokens import SessionTokens, load_or_create_secret
+from skills import SkillNormalizer, renormalize
+import rollups
 
 app = Flask(__name__)
-CORS(app)
+CORS(app, expose_headers=['X-Total-Count'])
 
 # ============ DATABASE CONNECTION ============
 class Config:
     DB_SERVER = 'localhost\\SQLEXPRESS'
     DB_NAME = 'ResumeBuilderDB'
     
+    # Connection pool settings
+    POOL_MIN_SIZE = 2             # Connections opened at startup
+    POOL_MAX_SIZE = 10            # Hard cap on concurrent connections
+    POOL_CHECKOUT_TIMEOUT = 10    # Seconds to wait for a free connection
+    POOL_MAX_LIFETIME = 1800      # Recycle connections older than this (seconds)
+    POOL_HEALTH_CHECK_AFTER = 30  # Ping connections idle longer than this (seconds)
+    SCHEMA_RETRY_INTERVAL = 30    # Seconds between migration attempts while the DB is unreachable
+    
+    # Session tokens (HMAC-signed, verified without a DB lookup). Set
+    # SECRET_KEY in the environment; without it a generated key is kept in
+    # SECRET_KEY_FILE, which only processes on this machine share
+    SECRET_KEY = os.environ.get('SECRET_KEY')
+    SECRET_KEY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.secret_key')
+    SESSION_TOKEN_TTL = 12 * 3600       # Seconds a login stays valid
+    SESSION_REVOCATION_MAX = 10000      # Logged-out tokens remembered until they expire
+    
+    # Username/email availability prefilter (Bloom filters)
+    AVAILABILITY_ERROR_RATE = 0.01         # False-positive rate (those are confirmed in SQL)
+    AVAILABILITY_REFRESH_INTERVAL = 300    # Seconds between rebuilds from the Users table
+    
+    # Password hashing (bcrypt on a dedicated worker pool)
+    PASSWORD_BCRYPT_ROUNDS = 12    # Cost factor; older hashes are upgraded on login
+    PASSWORD_HASH_WORKERS = 2      # Max CPU cores auth traffic may take
+    PASSWORD_HASH_MAX_QUEUE = 32   # Hash/verify calls in flight before new ones get a 503
+    PASSWORD_HASH_TIMEOUT = 5      # Seconds a request waits for its hash
+    
+    # Bulk resume import
+    BULK_IMPORT_CHUNK_SIZE = 100      # Resumes committed per transaction
+    BULK_IMPORT_MAX_CHUNK_SIZE = 1000
+    
+    # User list pagination
+    USER_PAGE_DEFAULT_LIMIT = 50
+    USER_PAGE_MAX_LIMIT = 500
+    
+    # Resume list pagination
+    RESUME_PAGE_DEFAULT_LIMIT = 50
+    RESUME_PAGE_MAX_LIMIT = 500
+    
+    # Job list/search pagination
+    JOB_PAGE_DEFAULT_LIMIT = 20
+    JOB_PAGE_MAX_LIMIT = 200
+    
+    # Bulk job import (CSV/NDJSON feeds)
+    JOB_IMPORT_CHUNK_SIZE = 500       # Jobs committed per transaction
+    JOB_IMPORT_MAX_CHUNK_SIZE = 5000
+    
+    # Resume <-> job matching (needs numpy + scipy)
+    MATCH_SKILL_WEIGHT = 0.7
+    MATCH_EXPERIENCE_WEIGHT = 0.2
+    MATCH_COURSE_WEIGHT = 0.1
+    MATCH_REFRESH_INTERVAL = 60   # Min seconds between rebuilds after data changes
+    MATCH_DEFAULT_K = 20
+    MATCH_MAX_K = 200
+    
+    # Resume detail fetch: 'batch' (1 round trip) or 'sequential' (5 round trips)
+    RESUME_DETAIL_STRATEGY = 'batch'
+    RESUME_BATCH_MAX_IDS = 10000  # Max ids per /api/resumes/batch request
+    
+    # View/download counter write-behind buffer
+    COUNTER_FLUSH_INTERVAL = 5     # Seconds between flushes
+    COUNTER_FLUSH_THRESHOLD = 500  # Flush early once this many resumes are pending
+    
+    # Analytics
+    ANALYTICS_CACHE_TTL = 300              # Seconds analytics results stay fresh
+    ANALYTICS_STALE_TTL = 600              # Extra seconds a stale overview may be served while refreshing
+    EXPERIENCE_BUCKET_EDGES = [2, 5, 10]   # Upper bounds (years, inclusive) of each bucket
+    EXPERIENCE_BUCKET_NAMES = ['Entry Level', 'Mid Level', 'Senior', 'Expert']
+    EXPERIENCE_MAX_EDGES = 20              # Most bucket bounds a client may send
+    TIMELINE_MAX_DAYS = 3650               # Longest window /api/analytics/timeline serves
+    
+    # Master data lists (sectors, courses, skills, locations, companies)
+    MASTER_DATA_TTL = 300   # Seconds before the snapshot is re-read even without changes
+    
+    # Geo lookups (DB locations + the userform seed files for GEO_SEED_COUNTRY)
+    GEO_SEED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'userform', 'data')
+    GEO_SEED_COUNTRY = 'India'
+    GEO_AUTOCOMPLETE_DEFAULT_LIMIT = 10
+    GEO_AUTOCOMPLETE_MAX_LIMIT = 50
+    
     @staticmethod
     def get_connection_string():
         return (
@@ -30,49 +130,138 @@ class Config:
             f"Trusted_Connection=yes;"
         )
 
+db_pool = ConnectionPool(
+    Config.get_connection_string,
+    min_size=Config.POOL_MIN_SIZE,
+    max_size=Config.POOL_MAX_SIZE,
+    checkout_timeout=Config.POOL_CHECKOUT_TIMEOUT,
+    max_lifetime=Config.POOL_MAX_LIFETIME,
+    health_check_after=Config.POOL_HEALTH_CHECK_AFTER
+)
+atexit.register(db_pool.close_all)
+
+# bcrypt runs here, not on the request threads, so a login burst can't
+# starve the resume and job endpoints
+password_hasher = PasswordHasher(
+    rounds=Config.PASSWORD_BCRYPT_ROUNDS,
+    workers=Config.PASSWORD_HASH_WORKERS,
+    max_queue=Config.PASSWORD_HASH_MAX_QUEUE,
+    timeout=Config.PASSWORD_HASH_TIMEOUT
+)
+atexit.register(password_hasher.shutdown)
+
+# Signed login tokens - /api/verify checks them in memory
+if not Config.SECRET_KEY:
+    print(f"⚠️  SECRET_KEY is not set - signing session tokens with the generated key in "
+          f"{Config.SECRET_KEY_FILE}. Set SECRET_KEY when running on more than one machine.")
+session_tokens = SessionTokens(
+    Config.SECRET_KEY or load_or_create_secret(Config.SECRET_KEY_FILE),
+    ttl=Config.SESSION_TOKEN_TTL,
+    max_revoked=Config.SESSION_REVOCATION_MAX
+)
+
 def get_db_connection():
-    """Create and return database connection"""
+    """
+    Check out a pooled database connection.
+    Use as `with get_db_connection() as conn:` so the connection is
+    returned to the pool on every exit path.
+    """
     try:
-        conn = pyodbc.connect(Config.get_connection_string())
-        return conn
+        return db_pool.connection()
     except Exception as e:
         print(f"❌ Database connection error: {e}")
         raise
 
-# ============ VALIDATION FUNCTIONS ============
-def validate_email(email):
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+# Taken usernames/emails - availability checks only query Users on a possible hit
+availability_filter = AvailabilityFilter(
+    get_db_connection,
+    error_rate=Config.AVAILABILITY_ERROR_RATE,
+    refresh_interval=Config.AVAILABILITY_REFRESH_INTERVAL
+)
+
+# Cached analytics results - cleared whenever resumes or jobs change
+analytics_cache = TTLCache(ttl=Config.ANALYTICS_CACHE_TTL, stale_ttl=Config.ANALYTICS_STALE_TTL)
+
+# Buffered view/download counters (flushed before the pool closes at exit).
+# A flush moves counts from "pending" into the table, so the cached
+# overview totals are dropped to keep views/downloads from going backwards.
+counter_buffer = CounterBuffer(
+    get_db_connection,
+    flush_interval=Config.COUNTER_FLUSH_INTERVAL,
+    max_pending=Config.COUNTER_FLUSH_THRESHOLD,
+    on_flush=lambda views, downloads: analytics_cache.invalidate(ANALYTICS_OVERVIEW_KEY),
+    before_commit=rollups.bump_counters
+)
+atexit.register(counter_buffer.stop)
+
+# Keyword search over open jobs - loaded at startup (or on first search)
+# and kept current by create_job/delete_job
+job_search_index = JobSearchIndex()
 
-def validate_phone(phone):
-    phone_clean = re.sub(r'[\s\-()]', '', phone)
-    return len(phone_clean) == 10 and phone_clean.isdigit()
+# Name -> ID cache for companies, sectors, courses and locations
+master_cache = MasterDataCache()
 
-def validate_password(password):
-    return len(password) >= 6
+# Versioned snapshot of the master lists served by the GET endpoints -
+# invalidated whenever master rows are created or renamed
+master_data = MasterDataSnapshot(get_db_connection, ttl=Config.MASTER_DATA_TTL)
 
-def validate_username(username):
-    return (3 <= len(username) <= 50 and 
-            re.match(r'^[a-zA-Z0-9_]+$', username) is not None)
+# Location tree, pincode hash and autocomplete trie - rebuilt from the
+# snapshot whenever its version changes
+geo_index = GeoIndex(Config.GEO_SEED_DIR, seed_country=Config.GEO_SEED_COUNTRY)
+
+# Canonical skill names/IDs shared by the job and resume write paths
+skill_normalizer = SkillNormalizer()
+
+# Skill-vector matching between resumes and open jobs - rebuilt in the
+# background after resumes or jobs change
+matching_engine = matching.MatchingEngine(
+    get_db_connection,
+    skill_weight=Config.MATCH_SKILL_WEIGHT,
+    experience_weight=Config.MATCH_EXPERIENCE_WEIGHT,
+    course_weight=Config.MATCH_COURSE_WEIGHT,
+    refresh_interval=Config.MATCH_REFRESH_INTERVAL
+)
+
+# ============================================================
+# SCHEMA
+# ============================================================
+
+def prepare_database(conn):
+    """Once per process, after the migrations"""
+    # Rebuild recent rollups in case rows were written outside the API (or
+    # DailyRollups was just created for an existing database)
+    cursor = conn.cursor()
+    rollups.compact(cursor, days=Config.TIMELINE_MAX_DAYS)
+    conn.commit()
+    cursor.close()
+
+@app.before_request
+def apply_schema():
+    """Apply the schema migrations before the first request, however the app was started"""
+    try:
+        ensure_schema_once(get_db_connection, prepare_database,
+                           retry_interval=Config.SCHEMA_RETRY_INTERVAL)
+    except Exception as e:
+        print(f"⚠️  Schema migration failed, retrying in {Config.SCHEMA_RETRY_INTERVAL}s: {e}")
 
 # ============================================================
 # HEALTH CHECK
 # ============================================================
 
 @app.route('/api/health', methods=['GET'])
+@app.route('/api/auth/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM Users")
-        user_count = cursor.fetchone()[0]
-        cursor.execute("SELECT COUNT(*) FROM Resumes")
-        resume_count = cursor.fetchone()[0]
-        cursor.execute("SELECT COUNT(*) FROM Jobs")
-        job_count = cursor.fetchone()[0]
-        cursor.close()
-        conn.close()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM Users")
+            user_count = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM Resumes")
+            resume_count = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM Jobs")
+            job_count = cursor.fetchone()[0]
+            cursor.close()
         
         return jsonify({
             'status': 'OK',
@@ -81,6 +270,7 @@ def health_check():
             'total_users': user_count,
             'total_resumes': resume_count,
             'total_jobs': job_count,
+            'pool': db_pool.stats(),
             'timestamp': datetime.now().isoformat()
         }), 200
     except Exception as e:
@@ -92,213 +282,13 @@ def health_check():
 # ============================================================
 # AUTHENTICATION ENDPOINTS
 # ============================================================
+# Served by auth_service under both /api/* and /api/auth/* (the URLs of the
+# former standalone auth_api.py), sharing this process's pools
 
-@app.route('/api/check-username', methods=['POST'])
-def check_username():
-    """Check if username already exists"""
-    try:
-        data = request.get_json()
-        username = data.get('username', '').strip()
-        
-        if not username:
-            return jsonify({'exists': False}), 200
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM Users WHERE Username = ?", (username,))
-        count = cursor.fetchone()[0]
-        cursor.close()
-        conn.close()
-        
-        return jsonify({'exists': count > 0}), 200
-    except Exception as e:
-        print(f"❌ Check username error: {e}")
-        return jsonify({'exists': False}), 500
-
-@app.route('/api/check-email', methods=['POST'])
-def check_email():
-    """Check if email already exists"""
-    try:
-        data = request.get_json()
-        email = data.get('emailId', '').strip()
-        
-        if not email:
-            return jsonify({'exists': False}), 200
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM Users WHERE EmailId = ?", (email,))
-        count = cursor.fetchone()[0]
-        cursor.close()
-        conn.close()
-        
-        return jsonify({'exists': count > 0}), 200
-    except Exception as e:
-        print(f"❌ Check email error: {e}")
-        return jsonify({'exists': False}), 500
-
-# ============================================================
-# UPDATED AUTHENTICATION ENDPOINTS (Replace in your Flask app)
-# ============================================================
-
-@app.route('/api/register', methods=['POST'])
-def register():
-    """Register new user WITH userType"""
-    try:
-        data = request.get_json()
-        
-        # Get all fields including userType
-        user_type = data.get('userType', '').strip()  # NEW: Get userType
-        username = data.get('username', '').strip()
-        first_name = data.get('firstName', '').strip()
-        last_name = data.get('lastName', '').strip()
-        password = data.get('password', '')
-        email_id = data.get('emailId', '').strip()
-        phone_number = data.get('phoneNumber', '').strip()
-        
-        print(f"\n📝 Registration attempt: {username} as {user_type}")
-        
-        # Validate all fields INCLUDING userType
-        if not all([user_type, username, first_name, last_name, password, email_id, phone_number]):
-            return jsonify({'success': False, 'message': 'All fields are required'}), 400
-        
-        # Validate userType
-        if user_type not in ['admin', 'recruiter', 'candidate']:
-            return jsonify({'success': False, 'message': 'Invalid user type'}), 400
-        
-        if not validate_username(username):
-            return jsonify({'success': False, 'message': 'Invalid username format'}), 400
-        
-        if not validate_email(email_id):
-            return jsonify({'success': False, 'message': 'Invalid email format'}), 400
-        
-        if not validate_phone(phone_number):
-            return jsonify({'success': False, 'message': 'Invalid phone number'}), 400
-        
-        if not validate_password(password):
-            return jsonify({'success': False, 'message': 'Password must be at least 6 characters'}), 400
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Check if username or email already exists
-        cursor.execute(
-            "SELECT Username, EmailId FROM Users WHERE Username = ? OR EmailId = ?",
-            (username, email_id)
-        )
-        existing = cursor.fetchone()
-        
-        if existing:
-            cursor.close()
-            conn.close()
-            msg = 'Username already taken' if existing[0] == username else 'Email already registered'
-            print(f"❌ Registration failed: {msg}")
-            return jsonify({'success': False, 'message': msg}), 409
-        
-        # Hash password
-        hashed_password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
-        
-        # Insert new user WITH UserType
-        cursor.execute("""
-            INSERT INTO Users (Username, FirstName, LastName, Password, EmailId, PhoneNumber, UserType)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (username, first_name, last_name, hashed_password.decode('utf-8'), email_id, phone_number, user_type))
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
-        
-        print(f"✅ User registered successfully: {username} as {user_type}")
-        return jsonify({'success': True, 'message': 'Registration successful'}), 201
-        
-    except Exception as e:
-        print(f"❌ Registration error: {e}")
-        return jsonify({'success': False, 'message': f'Server error: {str(e)}'}), 500
-
-
-@app.route('/api/login', methods=['POST'])
-def login():
-    """Login user - returns userType for frontend routing"""
-    try:
-        data = request.get_json()
-        username = data.get('username', '').strip()
-        password = data.get('password', '')
-        
-        print(f"\n🔐 Login attempt: {username}")
-        
-        if not username or not password:
-            return jsonify({'success': False, 'message': 'Username and password required'}), 400
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # Get user from database INCLUDING UserType
-        cursor.execute("""
-            SELECT UserId, Username, FirstName, LastName, Password, EmailId, UserType
-            FROM Users 
-            WHERE Username = ?
-        """, (username,))
-        
-        user = cursor.fetchone()
-        cursor.close()
-        conn.close()
-        
-        if not user:
-            print(f"❌ User not found: {username}")
-            return jsonify({'success': False, 'message': 'Invalid username or password'}), 401
-        
-        user_id, db_username, first_name, last_name, hashed_password, email, user_type = user
-        
-        # Verify password
-        if not bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8')):
-            print(f"❌ Invalid password for: {username}")
-            return jsonify({'success': False, 'message': 'Invalid username or password'}), 401
-        
-        print(f"✅ Login successful: {username} ({user_type})")
-        
-        # Return user data WITH userType for frontend routing
-        return jsonify({
-            'success': True,
-            'message': 'Login successful',
-            'user': {
-                'userId': user_id,
-                'username': db_username,
-                'firstName': first_name,
-                'lastName': last_name,
-                'email': email,
-                'userType': user_type  # CRITICAL: Frontend needs this for redirect
-            }
-        }), 200
-        
-    except Exception as e:
-        print(f"❌ Login error: {e}")
-        return jsonify({'success': False, 'message': f'Server error: {str(e)}'}), 500
-
-@app.route('/api/logout', methods=['POST'])
-def logout():
-    """Logout user"""
-    return jsonify({'success': True, 'message': 'Logged out successfully'}), 200
-
-@app.route('/api/verify', methods=['POST'])
-def verify_session():
-    """Verify if user session is valid"""
-    try:
-        data = request.get_json()
-        user_id = data.get('userId')
-        
-        if not user_id:
-            return jsonify({'valid': False}), 200
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT Username FROM Users WHERE UserId = ?", (user_id,))
-        user = cursor.fetchone()
-        cursor.close()
-        conn.close()
-        
-        return jsonify({'valid': user is not None}), 200
-    except Exception:
-        return jsonify({'valid': False}), 200
+auth_service = AuthService(get_db_connection, password_hasher, session_tokens, availability_filter)
+auth_blueprint = create_auth_blueprint(auth_service)
+app.register_blueprint(auth_blueprint, url_prefix='/api')
+app.register_blueprint(auth_blueprint, url_prefix='/api/auth', name='auth_legacy')
 
 # ============================================================
 # USER MANAGEMENT ENDPOINTS
@@ -306,13 +296,24 @@ def verify_session():
 
 @app.route('/api/get-all-users', methods=['GET'])
 def get_all_users():
-    """Get all registered users with statistics"""
+    """
+    Get registered users with their resume counts, newest first.
+    Optional query parameters (same as /api/get-resumes):
+      limit=N         page size (capped at Config.USER_PAGE_MAX_LIMIT)
+      cursor=...      next_cursor from the previous page (keyset pagination)
+      includeTotal=1  add an X-Total-Count header
+    Without limit/cursor every user is returned, as before.
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT 
+        cursor_token = request.args.get('cursor', '').strip()
+        limit = request.args.get('limit', type=int)
+        paginate = limit is not None or bool(cursor_token)
+        if paginate:
+            limit = max(1, min(limit or Config.USER_PAGE_DEFAULT_LIMIT, Config.USER_PAGE_MAX_LIMIT))
+        
+        # Resume counts come from an IX_Resumes_UserID seek per returned user
+        query = f"""
+            SELECT {'TOP (?) ' if paginate else ''}
                 u.UserId,
                 u.Username,
                 u.FirstName,
@@ -320,16 +321,45 @@ def get_all_users():
                 u.EmailId,
                 u.PhoneNumber,
                 u.CreatedDate,
-                COUNT(r.ResumeID) as ResumeCount
+                rc.ResumeCount,
+                ISNULL(u.CreatedDate, CAST(0 AS DATETIME)) AS SortDate
             FROM Users u
-            LEFT JOIN Resumes r ON u.EmailId = (SELECT Email FROM PersonalInformation WHERE ResumeID = r.ResumeID)
-            GROUP BY u.UserId, u.Username, u.FirstName, u.LastName, u.EmailId, u.PhoneNumber, u.CreatedDate
-            ORDER BY u.CreatedDate DESC
-        """)
+            OUTER APPLY (SELECT COUNT(*) AS ResumeCount FROM Resumes r WHERE r.UserID = u.UserId) rc
+        """
+        params = [limit + 1] if paginate else []
+        
+        if cursor_token:
+            try:
+                after_date, after_id = decode_resume_cursor(cursor_token)
+            except ValueError as e:
+                return jsonify({'success': False, 'error': str(e)}), 400
+            query += """
+                WHERE ISNULL(u.CreatedDate, CAST(0 AS DATETIME)) < CAST(? AS DATETIME)
+                   OR (ISNULL(u.CreatedDate, CAST(0 AS DATETIME)) = CAST(? AS DATETIME) AND u.UserId < ?)
+            """
+            params.extend([after_date, after_date, after_id])
+        
+        # Users without a CreatedDate sort last (as 1900-01-01) so the keyset never holds NULL
+        query += " ORDER BY SortDate DESC, u.UserId DESC"
+        
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            
+            total = None
+            if request.args.get('includeTotal') in ('1', 'true'):
+                cursor.execute("SELECT COUNT(*) FROM Users")
+                total = cursor.fetchone()[0]
+            cursor.close()
         
-        rows = cursor.fetchall()
-        users = []
+        next_cursor = None
+        if paginate and len(rows) > limit:
+            rows = rows[:limit]
+            # Same (CreatedDate, id) keyset shape as the resume list
+            next_cursor = encode_resume_cursor(rows[-1][8], rows[-1][0])
         
+        users = []
         for row in rows:
             users.append({
                 'userId': row[0],
@@ -344,16 +374,17 @@ def get_all_users():
                 'status': 'Active'
             })
         
-        cursor.close()
-        conn.close()
-        
         print(f"📋 Retrieved {len(users)} users from database")
         
-        return jsonify({
+        response = jsonify({
             'success': True,
             'count': len(users),
-            'users': users
-        }), 200
+            'users': users,
+            'next_cursor': next_cursor
+        })
+        if total is not None:
+            response.headers['X-Total-Count'] = str(total)
+        return response, 200
         
     except Exception as e:
         print(f"❌ Error getting users: {e}")
@@ -361,37 +392,51 @@ def get_all_users():
 
 @app.route('/api/get-user/<int:user_id>', methods=['GET'])
 def get_user_details(user_id):
-    """Get detailed information about a specific user"""
+    """
+    Get detailed information about a specific user and their resumes
+    (newest first; optional ?limit= and ?offset= page the resume list)
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        limit = request.args.get('limit', type=int)
+        offset = max(0, request.args.get('offset', 0, type=int))
+        if limit is not None:
+            limit = max(1, min(limit, Config.RESUME_PAGE_MAX_LIMIT))
         
-        cursor.execute("""
-            SELECT 
-                UserId, Username, FirstName, LastName, EmailId, PhoneNumber, CreatedDate
-            FROM Users
-            WHERE UserId = ?
-        """, (user_id,))
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
         
-        user = cursor.fetchone()
+            cursor.execute("""
+                SELECT 
+                    UserId, Username, FirstName, LastName, EmailId, PhoneNumber, CreatedDate,
+                    (SELECT COUNT(*) FROM Resumes r WHERE r.UserID = u.UserId)
+                FROM Users u
+                WHERE UserId = ?
+            """, (user_id,))
+        
+            user = cursor.fetchone()
+        
+            if not user:
+                return jsonify({'success': False, 'error': 'User not found'}), 404
+        
+            # Get user's resumes (IX_Resumes_UserID)
+            query = """
+                SELECT r.ResumeID, r.ResumeTitle, r.CreatedDate
+                FROM Resumes r
+                WHERE r.UserID = ?
+                ORDER BY r.CreatedDate DESC, r.ResumeID DESC
+            """
+            params = [user_id]
+            if limit is not None or offset:
+                query += " OFFSET ? ROWS"
+                params.append(offset)
+                if limit is not None:
+                    query += " FETCH NEXT ? ROWS ONLY"
+                    params.append(limit)
+            cursor.execute(query, params)
+        
+            resumes = cursor.fetchall()
         
-        if not user:
             cursor.close()
-            conn.close()
-            return jsonify({'success': False, 'error': 'User not found'}), 404
-        
-        # Get user's resumes
-        cursor.execute("""
-            SELECT r.ResumeID, r.ResumeTitle, r.CreatedDate
-            FROM Resumes r
-            INNER JOIN PersonalInformation p ON r.ResumeID = p.ResumeID
-            WHERE p.Email = ?
-        """, (user[4],))
-        
-        resumes = cursor.fetchall()
-        
-        cursor.close()
-        conn.close()
         
         user_data = {
             'userId': user[0],
@@ -401,6 +446,7 @@ def get_user_details(user_id):
             'email': user[4],
             'phone': user[5],
             'createdDate': str(user[6]) if user[6] else None,
+            'resumeCount': user[7],
             'resumes': [
                 {
                     'id': r[0],
@@ -420,81 +466,115 @@ def get_user_details(user_id):
 # ANALYTICS ENDPOINTS
 # ============================================================
 
-@app.route('/api/analytics/overview', methods=['GET'])
-def get_analytics_overview():
-    """Get comprehensive analytics overview"""
-    try:
-        conn = get_db_connection()
+ANALYTICS_OVERVIEW_KEY = 'overview'
+
+def compute_analytics_overview():
+    """
+    All overview figures in one round trip: scalar totals, then top
+    locations and skills, resumes per status and the most viewed and
+    downloaded resumes
+    """
+    with get_db_connection() as conn:
         cursor = conn.cursor()
-        
-        # Total statistics
-        cursor.execute("SELECT COUNT(*) FROM Resumes")
-        total_resumes = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT COUNT(*) FROM Users")
-        total_users = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT SUM(ISNULL(visitor_count, 0)) FROM Resumes")
-        total_views = cursor.fetchone()[0] or 0
-        
-        cursor.execute("SELECT SUM(ISNULL(download_count, 0)) FROM Resumes")
-        total_downloads = cursor.fetchone()[0] or 0
-        
-        cursor.execute("SELECT COUNT(*) FROM Jobs")
-        total_jobs = cursor.fetchone()[0]
-        
-        # Recent activity (last 7 days)
-        cursor.execute("""
-            SELECT COUNT(*) FROM Resumes 
-            WHERE CreatedDate >= DATEADD(day, -7, GETDATE())
-        """)
-        recent_resumes = cursor.fetchone()[0]
-        
-        cursor.execute("""
-            SELECT COUNT(*) FROM Jobs 
-            WHERE PostedDate >= DATEADD(day, -7, GETDATE())
-        """)
-        recent_jobs = cursor.fetchone()[0]
-        
-        # Location distribution
         cursor.execute("""
+            SET NOCOUNT ON;
+            
+            SELECT 
+                r.TotalResumes, u.TotalUsers, r.TotalViews, r.TotalDownloads,
+                j.TotalJobs, r.RecentResumes, j.RecentJobs
+            FROM (
+                SELECT 
+                    COUNT(*) AS TotalResumes,
+                    SUM(ISNULL(visitor_count, 0)) AS TotalViews,
+                    SUM(ISNULL(download_count, 0)) AS TotalDownloads,
+                    SUM(CASE WHEN CreatedDate >= DATEADD(day, -7, GETDATE()) THEN 1 ELSE 0 END) AS RecentResumes
+                FROM Resumes
+            ) r
+            CROSS JOIN (SELECT COUNT(*) AS TotalUsers FROM Users) u
+            CROSS JOIN (
+                SELECT 
+                    COUNT(*) AS TotalJobs,
+                    SUM(CASE WHEN PostedDate >= DATEADD(day, -7, GETDATE()) THEN 1 ELSE 0 END) AS RecentJobs
+                FROM Jobs
+            ) j;
+            
             SELECT TOP 10 Location, COUNT(*) as count
             FROM PersonalInformation
             WHERE Location IS NOT NULL
             GROUP BY Location
-            ORDER BY count DESC
-        """)
-        locations = [{'location': row[0], 'count': row[1]} for row in cursor.fetchall()]
-        
-        # Skills distribution (top 10)
-        cursor.execute("""
+            ORDER BY count DESC;
+            
             SELECT TOP 10 SkillName, COUNT(*) as count
             FROM Skills
             GROUP BY SkillName
-            ORDER BY count DESC
+            ORDER BY count DESC;
+            
+            SELECT ISNULL(Status, 'Active'), COUNT(*) as count
+            FROM Resumes
+            GROUP BY ISNULL(Status, 'Active')
+            ORDER BY count DESC;
+            
+            SELECT TOP 5 r.ResumeID, p.FullName, p.Email, ISNULL(r.visitor_count, 0)
+            FROM Resumes r
+            LEFT JOIN PersonalInformation p ON p.ResumeID = r.ResumeID
+            ORDER BY ISNULL(r.visitor_count, 0) DESC, r.ResumeID DESC;
+            
+            SELECT TOP 5 r.ResumeID, p.FullName, p.Email, ISNULL(r.download_count, 0)
+            FROM Resumes r
+            LEFT JOIN PersonalInformation p ON p.ResumeID = r.ResumeID
+            ORDER BY ISNULL(r.download_count, 0) DESC, r.ResumeID DESC;
         """)
-        skills = [{'skill': row[0], 'count': row[1]} for row in cursor.fetchall()]
         
+        totals = cursor.fetchone()
+        cursor.nextset()
+        locations = [{'location': row[0], 'count': row[1]} for row in cursor.fetchall()]
+        cursor.nextset()
+        skills = [{'skill': row[0], 'count': row[1]} for row in cursor.fetchall()]
+        cursor.nextset()
+        statuses = [{'status': row[0], 'count': row[1]} for row in cursor.fetchall()]
+        top = {}
+        for key in ('viewed', 'downloaded'):
+            cursor.nextset()
+            top[key] = [{'id': row[0], 'name': row[1], 'email': row[2], 'count': row[3]}
+                        for row in cursor.fetchall()]
         cursor.close()
-        conn.close()
+    
+    return {
+        'totals': {
+            'resumes': totals[0],
+            'users': totals[1],
+            'views': totals[2] or 0,
+            'downloads': totals[3] or 0,
+            'jobs': totals[4]
+        },
+        'recent': {
+            'resumes_last_7_days': totals[5] or 0,
+            'jobs_last_7_days': totals[6] or 0
+        },
+        'locations': locations,
+        'skills': skills,
+        'statuses': statuses,
+        'top_viewed': top['viewed'],
+        'top_downloaded': top['downloaded']
+    }
+
+@app.route('/api/analytics/overview', methods=['GET'])
+def get_analytics_overview():
+    """Get comprehensive analytics overview (cached, stale-while-revalidate)"""
+    try:
+        overview = analytics_cache.get_or_refresh(ANALYTICS_OVERVIEW_KEY, compute_analytics_overview)
+        
+        # Include buffered view/download increments not yet flushed
+        pending_views, pending_downloads = counter_buffer.pending_totals()
+        analytics = dict(overview, totals=dict(
+            overview['totals'],
+            views=overview['totals']['views'] + pending_views,
+            downloads=overview['totals']['downloads'] + pending_downloads
+        ))
         
         return jsonify({
             'success': True,
-            'analytics': {
-                'totals': {
-                    'resumes': total_resumes,
-                    'users': total_users,
-                    'views': total_views,
-                    'downloads': total_downloads,
-                    'jobs': total_jobs
-                },
-                'recent': {
-                    'resumes_last_7_days': recent_resumes,
-                    'jobs_last_7_days': recent_jobs
-                },
-                'locations': locations,
-                'skills': skills
-            }
+            'analytics': analytics
         }), 200
         
     except Exception as e:
@@ -503,33 +583,34 @@ def get_analytics_overview():
 
 @app.route('/api/analytics/timeline', methods=['GET'])
 def get_timeline_analytics():
-    """Get resume creation timeline for last 30 days"""
+    """
+    Get an activity timeline from the DailyRollups table.
+    ?days=30                     window size (max Config.TIMELINE_MAX_DAYS)
+    ?granularity=day|week|month  bucket size
+    ?metric=resumes_created|jobs_posted|views|downloads
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT 
-                CAST(CreatedDate AS DATE) as date,
-                COUNT(*) as count
-            FROM Resumes
-            WHERE CreatedDate >= DATEADD(day, -30, GETDATE())
-            GROUP BY CAST(CreatedDate AS DATE)
-            ORDER BY date
-        """)
-        
-        timeline = [
-            {
-                'date': str(row[0]),
-                'count': row[1]
-            } for row in cursor.fetchall()
-        ]
-        
-        cursor.close()
-        conn.close()
+        days = request.args.get('days', 30, type=int)
+        granularity = request.args.get('granularity', 'day')
+        metric = request.args.get('metric', rollups.RESUMES_CREATED)
+        
+        if not 1 <= days <= Config.TIMELINE_MAX_DAYS:
+            return jsonify({'success': False, 'error': f'days must be between 1 and {Config.TIMELINE_MAX_DAYS}'}), 400
+        if granularity not in rollups.GRANULARITIES:
+            return jsonify({'success': False, 'error': f'granularity must be one of {", ".join(rollups.GRANULARITIES)}'}), 400
+        if metric not in rollups.METRICS:
+            return jsonify({'success': False, 'error': f'metric must be one of {", ".join(rollups.METRICS)}'}), 400
+        
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            timeline = rollups.read_series(cursor, metric, days, granularity)
+            cursor.close()
         
         return jsonify({
             'success': True,
+            'metric': metric,
+            'granularity': granularity,
+            'days': days,
             'timeline': timeline
         }), 200
         
@@ -537,10 +618,245 @@ def get_timeline_analytics():
         print(f"❌ Error getting timeline: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+def experience_bucket_labels(edges):
+    """Human readable labels for buckets bounded by `edges` (years)"""
+    bounds = [0] + list(edges)
+    labels = [f"{lo:g}-{hi:g} yrs" for lo, hi in zip(bounds, bounds[1:])]
+    labels.append(f"{bounds[-1]:g}+ yrs")
+    if list(edges) == Config.EXPERIENCE_BUCKET_EDGES:
+        labels = [f"{name} ({label})" for name, label in zip(Config.EXPERIENCE_BUCKET_NAMES, labels)]
+    return labels
+
+def compute_experience_distribution(edges):
+    """Bucket every resume by total work experience in a single aggregate query"""
+    bucket_case = "CASE " + " ".join(
+        f"WHEN Years <= ? THEN {i}" for i in range(len(edges))
+    ) + f" ELSE {len(edges)} END"
+    
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            WITH ResumeExperience AS (
+                SELECT 
+                    r.ResumeID,
+                    ISNULL(SUM(DATEDIFF(month, w.DateOfJoin, w.LastWorkingDate)), 0) / 12.0 AS Years
+                FROM Resumes r
+                LEFT JOIN WorkExperience w ON w.ResumeID = r.ResumeID
+                GROUP BY r.ResumeID
+            )
+            SELECT Bucket, COUNT(*) AS count
+            FROM (SELECT {bucket_case} AS Bucket FROM ResumeExperience) b
+            GROUP BY Bucket
+        """, list(edges))
+        counts = dict(cursor.fetchall())
+        cursor.close()
+    
+    return [
+        {'label': label, 'count': counts.get(i, 0)}
+        for i, label in enumerate(experience_bucket_labels(edges))
+    ]
+
+@app.route('/api/analytics/experience-distribution', methods=['GET'])
+def get_experience_distribution():
+    """
+    Count resumes per total-experience bucket.
+    ?edges=2,5,10 sets the bucket upper bounds in years
+    (default Config.EXPERIENCE_BUCKET_EDGES). Only the default bucketing
+    is cached; custom edges are computed per request.
+    """
+    try:
+        raw_edges = request.args.get('edges', '').strip()
+        if raw_edges:
+            try:
+                edges = [float(e) for e in raw_edges.split(',') if e.strip()]
+            except ValueError:
+                return jsonify({'success': False, 'error': 'edges must be numbers'}), 400
+            if not edges or edges != sorted(set(edges)) or edges[0] <= 0:
+                return jsonify({'success': False, 'error': 'edges must be positive and strictly increasing'}), 400
+            if len(edges) > Config.EXPERIENCE_MAX_EDGES:
+                return jsonify({'success': False, 'error': f'at most {Config.EXPERIENCE_MAX_EDGES} edges allowed'}), 400
+        else:
+            edges = Config.EXPERIENCE_BUCKET_EDGES
+        
+        # Cache keys stay bounded: arbitrary client edges never enter the cache
+        if edges == Config.EXPERIENCE_BUCKET_EDGES:
+            buckets = analytics_cache.get_or_set(
+                ('experience-distribution', tuple(edges)),
+                lambda: compute_experience_distribution(edges)
+            )
+        else:
+            buckets = compute_experience_distribution(edges)
+        
+        response = jsonify({
+            'success': True,
+            'edges': edges,
+            'buckets': buckets,
+            'total': sum(b['count'] for b in buckets)
+        })
+        response.headers['Cache-Control'] = f'private, max-age={Config.ANALYTICS_CACHE_TTL}'
+        return response, 200
+        
+    except Exception as e:
+        print(f"❌ Error getting experience distribution: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 # ============================================================
 # RESUME ENDPOINTS
 # ============================================================
 
+# Child tables of a resume: INSERT statement for each, in save order
+RESUME_CHILD_INSERTS = {
+    'WorkExperience': """
+        INSERT INTO WorkExperience 
+        (ResumeID, CompanyName, JobRole, DateOfJoin, LastWorkingDate, Experience, CreatedDate, UpdatedDate)
+        VALUES (?, ?, ?, ?, ?, ?, GETDATE(), GETDATE())
+    """,
+    'Education': """
+        INSERT INTO Education 
+        (ResumeID, College, University, Course, Year, CGPA, CreatedDate, UpdatedDate)
+        VALUES (?, ?, ?, ?, ?, ?, GETDATE(), GETDATE())
+    """,
+    'Projects': """
+        INSERT INTO Projects 
+        (ResumeID, ProjectTitle, ProjectLink, Organization, Description, CreatedDate, UpdatedDate)
+        VALUES (?, ?, ?, ?, ?, GETDATE(), GETDATE())
+    """,
+    'Skills': """
+        INSERT INTO Skills (ResumeID, SkillType, SkillName, CreatedDate, UpdatedDate)
+        VALUES (?, ?, ?, GETDATE(), GETDATE())
+    """,
+    'Certifications': """
+        INSERT INTO Certifications (ResumeID, CertificationName, CreatedDate, UpdatedDate)
+        VALUES (?, ?, GETDATE(), GETDATE())
+    """,
+    'Interests': """
+        INSERT INTO Interests (ResumeID, InterestName, CreatedDate, UpdatedDate)
+        VALUES (?, ?, GETDATE(), GETDATE())
+    """
+}
+
+def calculate_experience_text(start_date, end_date):
+    """Format the span between two YYYY-MM-DD dates as 'X year(s) Y month(s)'"""
+    if not start_date or not end_date:
+        return ""
+    try:
+        start = datetime.strptime(start_date, '%Y-%m-%d')
+        end = datetime.strptime(end_date, '%Y-%m-%d')
+    except (ValueError, TypeError) as e:
+        print(f"   ⚠️  Warning: Could not parse dates: {e}")
+        return ""
+    months = (end.year - start.year) * 12 + (end.month - start.month)
+    return f"{months // 12} year(s) {months % 12} month(s)"
+
+def build_resume_child_rows(resume_id, data):
+    """Build the parameter rows for every resume child table - {table: [row, ...]}"""
+    rows = {table: [] for table in RESUME_CHILD_INSERTS}
+    
+    for exp in data.get('experience', []):
+        if exp and exp.get('company'):
+            rows['WorkExperience'].append((
+                resume_id,
+                exp.get('company'),
+                exp.get('jobRole'),
+                exp.get('startDate'),
+                exp.get('endDate'),
+                calculate_experience_text(exp.get('startDate'), exp.get('endDate'))
+            ))
+    
+    for edu in data.get('education', []):
+        if edu and edu.get('college'):
+            year_val = None
+            cgpa_val = None
+            
+            try:
+                if edu.get('year'):
+                    year_val = int(edu.get('year'))
+            except (ValueError, TypeError) as e:
+                print(f"   ⚠️  Warning: Invalid year value: {e}")
+            
+            try:
+                if edu.get('cgpa'):
+                    cgpa_val = float(edu.get('cgpa'))
+            except (ValueError, TypeError) as e:
+                print(f"   ⚠️  Warning: Invalid CGPA value: {e}")
+            
+            rows['Education'].append((
+                resume_id,
+                edu.get('college'),
+                edu.get('university'),
+                edu.get('course'),
+                year_val,
+                cgpa_val
+            ))
+    
+    for proj in data.get('projects', []):
+        if proj and proj.get('title'):
+            rows['Projects'].append((
+                resume_id,
+                proj.get('title'),
+                proj.get('link', ''),
+                proj.get('company', ''),
+                proj.get('description', '')
+            ))
+    
+    # Skills are stored under their canonical names, once per type
+    for skill_type, key in (('Personal', 'personalSkills'),
+                            ('Professional', 'professionalSkills'),
+                            ('Technical', 'technicalSkills')):
+        for skill in skill_normalizer.canonical_list(data.get(key, [])):
+            rows['Skills'].append((resume_id, skill_type, skill))
+    
+    rows['Certifications'] = [(resume_id, cert) for cert in data.get('certifications', []) if cert]
+    rows['Interests'] = [(resume_id, hobby) for hobby in data.get('hobbies', []) if hobby]
+    
+    return rows
+
+def insert_resume(cursor, data, user_id=None):
+    """
+    Insert a complete resume using the given cursor (caller commits).
+    Each child table is written with a single fast_executemany batch,
+    so a resume costs at most 8 round trips however rich it is.
+    The owner is user_id, else the user registered with the resume's email.
+    Returns (resume_id, {table: rows_inserted}).
+    """
+    cursor.execute("""
+        INSERT INTO Resumes (ResumeTitle, Status, CreatedDate, UpdatedDate, visitor_count, download_count, UserID)
+        OUTPUT INSERTED.ResumeID
+        VALUES (?, 'Active', GETDATE(), GETDATE(), 0, 0,
+                COALESCE(?, (SELECT TOP 1 UserId FROM Users WHERE EmailId = ? ORDER BY UserId)))
+    """, (f"{data.get('name', 'Untitled')} - Resume", user_id, data.get('email')))
+    resume_id = cursor.fetchone()[0]
+    
+    cursor.execute("""
+        INSERT INTO PersonalInformation 
+        (ResumeID, FullName, Email, PhoneNumber, DateOfBirth, Location, 
+         PhotoPath, LinkedInURL, GitHubURL, CareerObjective, CreatedDate, UpdatedDate)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, GETDATE(), GETDATE())
+    """, (
+        resume_id,
+        data.get('name'),
+        data.get('email'),
+        data.get('phone'),
+        data.get('dob'),
+        data.get('location'),
+        data.get('photo', ''),
+        data.get('linkedin', ''),
+        data.get('github', ''),
+        data.get('objective')
+    ))
+    
+    skill_normalizer.ensure_loaded(cursor)
+    child_rows = build_resume_child_rows(resume_id, data)
+    cursor.fast_executemany = True
+    try:
+        for table, rows in child_rows.items():
+            if rows:
+                cursor.executemany(RESUME_CHILD_INSERTS[table], rows)
+    finally:
+        cursor.fast_executemany = False
+    
+    return resume_id, {table: len(rows) for table, rows in child_rows.items()}
+
 @app.route('/api/save-resume', methods=['POST'])
 def save_resume():
     """Save a complete resume to the database"""
@@ -550,201 +866,22 @@ def save_resume():
         print("="*70)
         
         data = request.json
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # 1. INSERT INTO RESUMES TABLE
-        print("📝 Step 1: Creating Resume record...")
-        cursor.execute("""
-            INSERT INTO Resumes (ResumeTitle, Status, CreatedDate, UpdatedDate, visitor_count, download_count)
-            OUTPUT INSERTED.ResumeID
-            VALUES (?, 'Active', GETDATE(), GETDATE(), 0, 0)
-        """, (f"{data.get('name', 'Untitled')} - Resume",))
-        
-        resume_id = cursor.fetchone()[0]
-        print(f"   ✅ Resume created with ID: {resume_id}")
-        
-        # 2. INSERT INTO PERSONAL INFORMATION TABLE
-        print("📝 Step 2: Saving Personal Information...")
-        cursor.execute("""
-            INSERT INTO PersonalInformation 
-            (ResumeID, FullName, Email, PhoneNumber, DateOfBirth, Location, 
-             PhotoPath, LinkedInURL, GitHubURL, CareerObjective, CreatedDate, UpdatedDate)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, GETDATE(), GETDATE())
-        """, (
-            resume_id,
-            data.get('name'),
-            data.get('email'),
-            data.get('phone'),
-            data.get('dob'),
-            data.get('location'),
-            data.get('photo', ''),
-            data.get('linkedin', ''),
-            data.get('github', ''),
-            data.get('objective')
-        ))
-        print("   ✅ Personal information saved")
-        
-        # 3. INSERT WORK EXPERIENCE
-        experience_list = data.get('experience', [])
-        if experience_list:
-            print(f"📝 Step 3: Saving {len(experience_list)} Work Experience entries...")
-            for exp in experience_list:
-                if exp and exp.get('company'):
-                    experience_text = ""
-                    if exp.get('startDate') and exp.get('endDate'):
-                        try:
-                            start = datetime.strptime(exp['startDate'], '%Y-%m-%d')
-                            end = datetime.strptime(exp['endDate'], '%Y-%m-%d')
-                            months = (end.year - start.year) * 12 + (end.month - start.month)
-                            years = months // 12
-                            months = months % 12
-                            experience_text = f"{years} year(s) {months} month(s)"
-                        except (ValueError, TypeError) as e:
-                            print(f"   ⚠️  Warning: Could not parse dates: {e}")
-                            experience_text = ""
-                    
-                    cursor.execute("""
-                        INSERT INTO WorkExperience 
-                        (ResumeID, CompanyName, JobRole, DateOfJoin, LastWorkingDate, Experience, CreatedDate, UpdatedDate)
-                        VALUES (?, ?, ?, ?, ?, ?, GETDATE(), GETDATE())
-                    """, (
-                        resume_id,
-                        exp.get('company'),
-                        exp.get('jobRole'),
-                        exp.get('startDate'),
-                        exp.get('endDate'),
-                        experience_text
-                    ))
-            print(f"   ✅ Saved {len(experience_list)} experience entries")
-        else:
-            print("   ⏭️  Step 3: No work experience to save")
-        
-        # 4. INSERT EDUCATION
-        education_list = data.get('education', [])
-        if education_list:
-            print(f"📝 Step 4: Saving {len(education_list)} Education entries...")
-            for edu in education_list:
-                if edu and edu.get('college'):
-                    year_val = None
-                    cgpa_val = None
-                    
-                    try:
-                        if edu.get('year'):
-                            year_val = int(edu.get('year'))
-                    except (ValueError, TypeError) as e:
-                        print(f"   ⚠️  Warning: Invalid year value: {e}")
-                    
-                    try:
-                        if edu.get('cgpa'):
-                            cgpa_val = float(edu.get('cgpa'))
-                    except (ValueError, TypeError) as e:
-                        print(f"   ⚠️  Warning: Invalid CGPA value: {e}")
-                    
-                    cursor.execute("""
-                        INSERT INTO Education 
-                        (ResumeID, College, University, Course, Year, CGPA, CreatedDate, UpdatedDate)
-                        VALUES (?, ?, ?, ?, ?, ?, GETDATE(), GETDATE())
-                    """, (
-                        resume_id,
-                        edu.get('college'),
-                        edu.get('university'),
-                        edu.get('course'),
-                        year_val,
-                        cgpa_val
-                    ))
-            print(f"   ✅ Saved {len(education_list)} education entries")
-        else:
-            print("   ⏭️  Step 4: No education to save")
-        
-        # 5. INSERT PROJECTS
-        projects_list = data.get('projects', [])
-        if projects_list:
-            print(f"📝 Step 5: Saving {len(projects_list)} Project entries...")
-            for proj in projects_list:
-                if proj and proj.get('title'):
-                    cursor.execute("""
-                        INSERT INTO Projects 
-                        (ResumeID, ProjectTitle, ProjectLink, Organization, Description, CreatedDate, UpdatedDate)
-                        VALUES (?, ?, ?, ?, ?, GETDATE(), GETDATE())
-                    """, (
-                        resume_id,
-                        proj.get('title'),
-                        proj.get('link', ''),
-                        proj.get('company', ''),
-                        proj.get('description', '')
-                    ))
-            print(f"   ✅ Saved {len(projects_list)} project entries")
-        else:
-            print("   ⏭️  Step 5: No projects to save")
-        
-        # 6. INSERT SKILLS
-        personal_skills = data.get('personalSkills', [])
-        professional_skills = data.get('professionalSkills', [])
-        technical_skills = data.get('technicalSkills', [])
-        
-        total_skills = len(personal_skills) + len(professional_skills) + len(technical_skills)
-        
-        if total_skills > 0:
-            print(f"📝 Step 6: Saving {total_skills} Skills...")
-            
-            for skill in personal_skills:
-                if skill:
-                    cursor.execute("""
-                        INSERT INTO Skills (ResumeID, SkillType, SkillName, CreatedDate, UpdatedDate)
-                        VALUES (?, 'Personal', ?, GETDATE(), GETDATE())
-                    """, (resume_id, skill))
-            
-            for skill in professional_skills:
-                if skill:
-                    cursor.execute("""
-                        INSERT INTO Skills (ResumeID, SkillType, SkillName, CreatedDate, UpdatedDate)
-                        VALUES (?, 'Professional', ?, GETDATE(), GETDATE())
-                    """, (resume_id, skill))
-            
-            for skill in technical_skills:
-                if skill:
-                    cursor.execute("""
-                        INSERT INTO Skills (ResumeID, SkillType, SkillName, CreatedDate, UpdatedDate)
-                        VALUES (?, 'Technical', ?, GETDATE(), GETDATE())
-                    """, (resume_id, skill))
-            
-            print(f"   ✅ Saved {total_skills} skills")
-        else:
-            print("   ⏭️  Step 6: No skills to save")
-        
-        # 7. INSERT CERTIFICATIONS
-        certifications_list = data.get('certifications', [])
-        if certifications_list:
-            print(f"📝 Step 7: Saving {len(certifications_list)} Certifications...")
-            for cert in certifications_list:
-                if cert:
-                    cursor.execute("""
-                        INSERT INTO Certifications (ResumeID, CertificationName, CreatedDate, UpdatedDate)
-                        VALUES (?, ?, GETDATE(), GETDATE())
-                    """, (resume_id, cert))
-            print(f"   ✅ Saved {len(certifications_list)} certifications")
-        else:
-            print("   ⏭️  Step 7: No certifications to save")
-        
-        # 8. INSERT HOBBIES/INTERESTS
-        hobbies_list = data.get('hobbies', [])
-        if hobbies_list:
-            print(f"📝 Step 8: Saving {len(hobbies_list)} Interests/Hobbies...")
-            for hobby in hobbies_list:
-                if hobby:
-                    cursor.execute("""
-                        INSERT INTO Interests (ResumeID, InterestName, CreatedDate, UpdatedDate)
-                        VALUES (?, ?, GETDATE(), GETDATE())
-                    """, (resume_id, hobby))
-            print(f"   ✅ Saved {len(hobbies_list)} hobbies")
-        else:
-            print("   ⏭️  Step 8: No hobbies to save")
+        # Owner from the session token when the builder sends one
+        token = request_session_token()
+        claims = session_tokens.verify(token) if token else None
+        
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            resume_id, counts = insert_resume(cursor, data, claims['uid'] if claims else None)
+            rollups.bump(cursor, rollups.RESUMES_CREATED)
+            conn.commit()
+            cursor.close()
+        analytics_cache.invalidate()
+        matching_engine.invalidate()
         
-        # Commit all changes
-        conn.commit()
-        cursor.close()
-        conn.close()
+        for table, count in counts.items():
+            if count:
+                print(f"   ✅ Saved {count} {table} entries")
         
         print("="*70)
         print(f"✅ RESUME SAVED SUCCESSFULLY! (ID: {resume_id})")
@@ -763,118 +900,347 @@ def save_resume():
             "error": str(e)
         }), 500
 
+@app.route('/api/resumes/bulk', methods=['POST'])
+def bulk_import_resumes():
+    """
+    Bulk import resumes from a streamed NDJSON body.
+    Each line is one save-resume payload. Records are validated with the
+    Resume model and committed in chunks (?chunkSize=, default
+    Config.BULK_IMPORT_CHUNK_SIZE). The response is streamed NDJSON with one
+    result per input line and a final summary line.
+    """
+    chunk_size = request.args.get('chunkSize', Config.BULK_IMPORT_CHUNK_SIZE, type=int)
+    chunk_size = max(1, min(chunk_size, Config.BULK_IMPORT_MAX_CHUNK_SIZE))
+    stream = request.stream
+    
+    def result_line(line_no, resume_id=None, error=None):
+        if error:
+            return json.dumps({'line': line_no, 'success': False, 'error': error}) + '\n'
+        return json.dumps({'line': line_no, 'success': True, 'resume_id': resume_id}) + '\n'
+    
+    def flush(conn, cursor, pending, totals):
+        """Commit one chunk; on failure retry its records one by one"""
+        try:
+            ids = [insert_resume(cursor, data)[0] for _, data in pending]
+            rollups.bump(cursor, rollups.RESUMES_CREATED, len(ids))
+            conn.commit()
+            totals['imported'] += len(ids)
+            for (line_no, _), resume_id in zip(pending, ids):
+                yield result_line(line_no, resume_id)
+            return
+        except Exception as e:
+            conn.rollback()
+            print(f"   ⚠️  Bulk chunk failed ({e}), retrying {len(pending)} records individually")
+        
+        for line_no, data in pending:
+            try:
+                resume_id = insert_resume(cursor, data)[0]
+                rollups.bump(cursor, rollups.RESUMES_CREATED)
+                conn.commit()
+                totals['imported'] += 1
+                yield result_line(line_no, resume_id)
+            except Exception as e:
+                conn.rollback()
+                totals['failed'] += 1
+                yield result_line(line_no, error=str(e))
+    
+    def generate():
+        totals = {'imported': 0, 'failed': 0}
+        pending = []
+        
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            
+            for line_no, raw_line in enumerate(stream, 1):
+                line = raw_line.strip()
+                if not line:
+                    continue
+                
+                try:
+                    data = json.loads(line)
+                except ValueError as e:
+                    totals['failed'] += 1
+                    yield result_line(line_no, error=f'Invalid JSON: {e}')
+                    continue
+                
+                if not isinstance(data, dict):
+                    totals['failed'] += 1
+                    yield result_line(line_no, error='Each line must be a JSON object')
+                    continue
+                
+                errors = Resume.from_dict(data).validate()
+                if errors:
+                    totals['failed'] += 1
+                    yield result_line(line_no, error='; '.join(errors))
+                    continue
+                
+                pending.append((line_no, data))
+                if len(pending) >= chunk_size:
+                    yield from flush(conn, cursor, pending, totals)
+                    pending = []
+            
+            if pending:
+                yield from flush(conn, cursor, pending, totals)
+            cursor.close()
+        
+        if totals['imported']:
+            analytics_cache.invalidate()
+            matching_engine.invalidate()
+        print(f"📦 Bulk import finished: {totals['imported']} imported, {totals['failed']} failed")
+        yield json.dumps({'summary': totals}) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+# Projectable resume list fields: API name -> (SQL expression, formatter)
+RESUME_LIST_FIELDS = {
+    'id': ('r.ResumeID', None),
+    'title': ('r.ResumeTitle', None),
+    'status': ('r.Status', None),
+    'name': ('p.FullName', None),
+    'email': ('p.Email', None),
+    'phone': ('p.PhoneNumber', None),
+    'location': ('p.Location', None),
+    'created_at': ('r.CreatedDate', lambda v: str(v) if v else None),
+    'updated_at': ('r.UpdatedDate', lambda v: str(v) if v else None),
+    'visitor_count': ('ISNULL(r.visitor_count, 0)', lambda v: int(v) if v is not None else 0),
+    'download_count': ('ISNULL(r.download_count, 0)', lambda v: int(v) if v is not None else 0)
+}
+
+def encode_resume_cursor(created_date, resume_id):
+    """Opaque keyset cursor for the (CreatedDate, ResumeID) sort position"""
+    raw = json.dumps([created_date.isoformat(sep=' ', timespec='milliseconds'), resume_id])
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+def decode_resume_cursor(cursor_token):
+    """Inverse of encode_resume_cursor - raises ValueError if malformed"""
+    try:
+        created_date, resume_id = json.loads(base64.urlsafe_b64decode(cursor_token.encode('ascii')))
+        datetime.fromisoformat(created_date)
+        return created_date, int(resume_id)
+    except (TypeError, ValueError, binascii.Error) as e:
+        raise ValueError(f'Invalid cursor: {e}')
+
 @app.route('/api/get-resumes', methods=['GET'])
 def get_all_resumes():
-    """Get list of all saved resumes"""
+    """
+    Get list of saved resumes, newest first.
+    Optional query parameters:
+      limit=N         page size (capped at Config.RESUME_PAGE_MAX_LIMIT)
+      cursor=...      next_cursor from the previous page (keyset pagination)
+      fields=a,b,c    only return these fields
+      includeTotal=1  add an X-Total-Count header
+    Without limit/cursor every resume is returned, as before.
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        fields = request.args.get('fields', '').strip()
+        if fields:
+            fields = [f.strip() for f in fields.split(',') if f.strip()]
+            unknown = [f for f in fields if f not in RESUME_LIST_FIELDS]
+            if unknown:
+                return jsonify({"success": False, "error": f"Unknown fields: {', '.join(unknown)}"}), 400
+        else:
+            fields = list(RESUME_LIST_FIELDS)
+        
+        cursor_token = request.args.get('cursor', '').strip()
+        limit = request.args.get('limit', type=int)
+        paginate = limit is not None or bool(cursor_token)
+        if paginate:
+            limit = max(1, min(limit or Config.RESUME_PAGE_DEFAULT_LIMIT, Config.RESUME_PAGE_MAX_LIMIT))
+        
+        # ResumeID and CreatedDate always lead the select list: they drive the keyset
+        columns = ['r.ResumeID', 'r.CreatedDate'] + [RESUME_LIST_FIELDS[f][0] for f in fields]
+        query = f"SELECT {'TOP (?) ' if paginate else ''}{', '.join(columns)} FROM Resumes r"
+        params = [limit + 1] if paginate else []
+        
+        if any(RESUME_LIST_FIELDS[f][0].startswith('p.') for f in fields):
+            query += " LEFT JOIN PersonalInformation p ON r.ResumeID = p.ResumeID"
+        
+        if cursor_token:
+            try:
+                after_date, after_id = decode_resume_cursor(cursor_token)
+            except ValueError as e:
+                return jsonify({"success": False, "error": str(e)}), 400
+            query += """
+                WHERE r.CreatedDate < CAST(? AS DATETIME)
+                   OR (r.CreatedDate = CAST(? AS DATETIME) AND r.ResumeID < ?)
+            """
+            params.extend([after_date, after_date, after_id])
+        
+        query += " ORDER BY r.CreatedDate DESC, r.ResumeID DESC"
+        
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            
+            total = None
+            if request.args.get('includeTotal') in ('1', 'true'):
+                cursor.execute("SELECT COUNT(*) FROM Resumes")
+                total = cursor.fetchone()[0]
+            cursor.close()
         
-        cursor.execute("""
-            SELECT 
-                r.ResumeID,
-                r.ResumeTitle,
-                r.Status,
-                p.FullName,
-                p.Email,
-                p.PhoneNumber,
-                p.Location,
-                r.CreatedDate,
-                r.UpdatedDate,
-                ISNULL(r.visitor_count, 0) as visitor_count,
-                ISNULL(r.download_count, 0) as download_count
-            FROM Resumes r
-            LEFT JOIN PersonalInformation p ON r.ResumeID = p.ResumeID
-            ORDER BY r.CreatedDate DESC
-        """)
+        next_cursor = None
+        if paginate and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_resume_cursor(rows[-1][1], rows[-1][0])
         
-        rows = cursor.fetchall()
         resumes = []
-        
         for row in rows:
-            resumes.append({
-                "id": row[0],
-                "title": row[1],
-                "status": row[2],
-                "name": row[3],
-                "email": row[4],
-                "phone": row[5],
-                "location": row[6],
-                "created_at": str(row[7]) if row[7] else None,
-                "updated_at": str(row[8]) if row[8] else None,
-                "visitor_count": int(row[9]) if row[9] is not None else 0,
-                "download_count": int(row[10]) if row[10] is not None else 0
-            })
-        
-        cursor.close()
-        conn.close()
+            resume = {}
+            for field, value in zip(fields, row[2:]):
+                formatter = RESUME_LIST_FIELDS[field][1]
+                resume[field] = formatter(value) if formatter else value
+            add_pending_counts(resume, row[0])
+            resumes.append(resume)
         
         print(f"📋 Retrieved {len(resumes)} resumes from database")
         
-        return jsonify({
+        response = jsonify({
             "success": True,
             "count": len(resumes),
-            "resumes": resumes
-        }), 200
+            "resumes": resumes,
+            "next_cursor": next_cursor
+        })
+        if total is not None:
+            response.headers['X-Total-Count'] = str(total)
+        return response, 200
         
     except Exception as e:
         print(f"❌ Error getting resumes: {e}")
         return jsonify({"success": False, "error": str(e)}), 500
 
-@app.route('/api/get-resume/<int:resume_id>', methods=['GET'])
-def get_resume_details(resume_id):
-    """Get complete details of a single resume"""
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+RESUME_DETAIL_HEADER_SQL = """
+    SELECT 
+        r.ResumeID, r.ResumeTitle, r.Status, r.CreatedDate, r.UpdatedDate,
+        ISNULL(r.visitor_count, 0) as visitor_count,
+        ISNULL(r.download_count, 0) as download_count,
+        p.FullName, p.Email, p.PhoneNumber, p.DateOfBirth, p.Location,
+        p.LinkedInURL, p.GitHubURL, p.CareerObjective
+    FROM Resumes r
+    LEFT JOIN PersonalInformation p ON r.ResumeID = p.ResumeID
+"""
 
-        cursor.execute("""
-            SELECT 
-                r.ResumeID, r.ResumeTitle, r.Status, r.CreatedDate, r.UpdatedDate,
-                ISNULL(r.visitor_count, 0) as visitor_count,
-                ISNULL(r.download_count, 0) as download_count,
-                p.FullName, p.Email, p.PhoneNumber, p.DateOfBirth, p.Location,
-                p.LinkedInURL, p.GitHubURL, p.CareerObjective
-            FROM Resumes r
-            LEFT JOIN PersonalInformation p ON r.ResumeID = p.ResumeID
-            WHERE r.ResumeID = ?
-        """, (resume_id,))
-        
-        row = cursor.fetchone()
-        if not row:
-            cursor.close()
-            conn.close()
-            return jsonify({"success": False, "error": "Resume not found"}), 404
-        
-        resume = {
-            "id": row[0], "title": row[1], "status": row[2],
-            "created_at": str(row[3]) if row[3] else None,
-            "updated_at": str(row[4]) if row[4] else None,
-            "visitor_count": int(row[5]), "download_count": int(row[6]),
-            "name": row[7], "email": row[8], "phone": row[9],
-            "dob": str(row[10]) if row[10] else None,
-            "location": row[11], "linkedin": row[12], "github": row[13],
-            "objective": row[14],
-            "experience": [], "education": [], "projects": [], "skills": []
-        }
+# Child sections of a resume detail: (key, SELECT with ResumeID first, row mapper)
+RESUME_DETAIL_SECTIONS = [
+    ('experience',
+     "SELECT ResumeID, CompanyName, JobRole, DateOfJoin, LastWorkingDate FROM WorkExperience",
+     lambda r: {"company": r[1], "role": r[2], "start": str(r[3]), "end": str(r[4])}),
+    ('education',
+     "SELECT ResumeID, College, Course, Year, CGPA FROM Education",
+     lambda r: {"college": r[1], "course": r[2], "year": r[3], "cgpa": r[4]}),
+    ('projects',
+     "SELECT ResumeID, ProjectTitle, ProjectLink, Description FROM Projects",
+     lambda r: {"title": r[1], "link": r[2], "desc": r[3]}),
+    ('skills',
+     "SELECT ResumeID, SkillName, SkillType FROM dbo.Skills",
+     lambda r: {"name": r[1], "type": r[2]})
+]
 
-        # Fetch Experience
-        cursor.execute("SELECT CompanyName, JobRole, DateOfJoin, LastWorkingDate FROM WorkExperience WHERE ResumeID = ?", (resume_id,))
-        resume["experience"] = [{"company": r[0], "role": r[1], "start": str(r[2]), "end": str(r[3])} for r in cursor.fetchall()]
+def add_pending_counts(resume, resume_id):
+    """Add buffered, not yet flushed view/download increments to a resume dict"""
+    views, downloads = counter_buffer.pending(resume_id)
+    if 'visitor_count' in resume:
+        resume['visitor_count'] += views
+    if 'download_count' in resume:
+        resume['download_count'] += downloads
+    return resume
 
-        # Fetch Education
-        cursor.execute("SELECT College, Course, Year, CGPA FROM Education WHERE ResumeID = ?", (resume_id,))
-        resume["education"] = [{"college": r[0], "course": r[1], "year": r[2], "cgpa": r[3]} for r in cursor.fetchall()]
+def resume_header_to_dict(row):
+    """Map a RESUME_DETAIL_HEADER_SQL row to the API resume shape (empty sections)"""
+    return {
+        "id": row[0], "title": row[1], "status": row[2],
+        "created_at": str(row[3]) if row[3] else None,
+        "updated_at": str(row[4]) if row[4] else None,
+        "visitor_count": int(row[5]), "download_count": int(row[6]),
+        "name": row[7], "email": row[8], "phone": row[9],
+        "dob": str(row[10]) if row[10] else None,
+        "location": row[11], "linkedin": row[12], "github": row[13],
+        "objective": row[14],
+        "experience": [], "education": [], "projects": [], "skills": []
+    }
 
-        # Fetch Projects
-        cursor.execute("SELECT ProjectTitle, ProjectLink, Description FROM Projects WHERE ResumeID = ?", (resume_id,))
-        resume["projects"] = [{"title": r[0], "link": r[1], "desc": r[2]} for r in cursor.fetchall()]
+def fetch_resume_detail_sequential(cursor, resume_id):
+    """One query per section (5 round trips). Returns None if not found."""
+    cursor.execute(RESUME_DETAIL_HEADER_SQL + " WHERE r.ResumeID = ?", (resume_id,))
+    row = cursor.fetchone()
+    if not row:
+        return None
+    
+    resume = resume_header_to_dict(row)
+    for key, sql, mapper in RESUME_DETAIL_SECTIONS:
+        cursor.execute(sql + " WHERE ResumeID = ?", (resume_id,))
+        resume[key] = [mapper(r) for r in cursor.fetchall()]
+    return resume
 
-        # Fetch Skills - WITH EXPLICIT SCHEMA
-        cursor.execute("SELECT SkillName, SkillType FROM dbo.Skills WHERE ResumeID = ?", (resume_id,))
-        resume["skills"] = [{"name": r[0], "type": r[1]} for r in cursor.fetchall()]    
-        cursor.close()
-        conn.close()
+def fetch_resume_detail_batch(cursor, resume_id):
+    """
+    All five queries sent as one batch and read back with nextset()
+    (1 round trip). Returns None if not found.
+    """
+    statements = [RESUME_DETAIL_HEADER_SQL + " WHERE r.ResumeID = ?"]
+    statements += [sql + " WHERE ResumeID = ?" for _, sql, _ in RESUME_DETAIL_SECTIONS]
+    cursor.execute(
+        "SET NOCOUNT ON;\n" + ";\n".join(statements),
+        [resume_id] * len(statements)
+    )
+    
+    row = cursor.fetchone()
+    resume = resume_header_to_dict(row) if row else None
+    for key, _, mapper in RESUME_DETAIL_SECTIONS:
+        cursor.nextset()
+        rows = cursor.fetchall()
+        if resume:
+            resume[key] = [mapper(r) for r in rows]
+    return resume
+
+def fetch_resume_details_many(cursor, resume_ids):
+    """
+    Fetch many complete resumes with set-based queries - {ResumeID: resume}.
+    Each chunk of ids is one batch (header + sections via nextset()), sized
+    so the repeated IN lists stay under SQL Server's parameter limit.
+    """
+    statement_count = 1 + len(RESUME_DETAIL_SECTIONS)
+    resumes = {}
+    for chunk in chunked(list(dict.fromkeys(resume_ids)), SQL_PARAM_CHUNK // statement_count):
+        in_clause = f"IN ({', '.join('?' * len(chunk))})"
+        statements = [RESUME_DETAIL_HEADER_SQL + f" WHERE r.ResumeID {in_clause}"]
+        statements += [sql + f" WHERE ResumeID {in_clause}" for _, sql, _ in RESUME_DETAIL_SECTIONS]
+        cursor.execute("SET NOCOUNT ON;\n" + ";\n".join(statements), chunk * statement_count)
+        
+        for row in cursor.fetchall():
+            resumes[row[0]] = resume_header_to_dict(row)
+        for key, _, mapper in RESUME_DETAIL_SECTIONS:
+            cursor.nextset()
+            for r in cursor.fetchall():
+                if r[0] in resumes:
+                    resumes[r[0]][key].append(mapper(r))
+    return resumes
+
+RESUME_DETAIL_STRATEGIES = {
+    'sequential': fetch_resume_detail_sequential,
+    'batch': fetch_resume_detail_batch
+}
+
+@app.route('/api/get-resume/<int:resume_id>', methods=['GET'])
+def get_resume_details(resume_id):
+    """
+    Get complete details of a single resume.
+    ?strategy=batch|sequential overrides Config.RESUME_DETAIL_STRATEGY.
+    """
+    try:
+        strategy = request.args.get('strategy', Config.RESUME_DETAIL_STRATEGY)
+        fetch_detail = RESUME_DETAIL_STRATEGIES.get(strategy)
+        if not fetch_detail:
+            return jsonify({"success": False, "error": f"Unknown strategy: {strategy}"}), 400
+        
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            resume = fetch_detail(cursor, resume_id)
+            cursor.close()
+        
+        if not resume:
+            return jsonify({"success": False, "error": "Resume not found"}), 404
+        add_pending_counts(resume, resume_id)
         
         print(f"📄 Resume {resume_id} details fetched.")
         return jsonify({"success": True, "resume": resume}), 200
@@ -883,27 +1249,84 @@ def get_resume_details(resume_id):
         print(f"❌ Error getting resume details: {e}")
         return jsonify({"success": False, "error": str(e)}), 500
 
-@app.route('/api/increment-view/<int:resume_id>', methods=['POST'])
-def increment_view_count(resume_id):
-    """Increment visitor count for a resume"""
+@app.route('/api/resumes/batch', methods=['GET', 'POST'])
+def get_resumes_batch():
+    """
+    Get complete details of many resumes in one request.
+    GET  /api/resumes/batch?ids=1,2,3
+    POST /api/resumes/batch  {"ids": [1, 2, 3]}   (for large id sets)
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        if request.method == 'POST':
+            raw_ids = (request.get_json(silent=True) or {}).get('ids', [])
+        else:
+            raw_ids = [i for i in request.args.get('ids', '').split(',') if i.strip()]
+        
+        try:
+            resume_ids = [int(i) for i in raw_ids]
+        except (TypeError, ValueError):
+            return jsonify({"success": False, "error": "ids must be integers"}), 400
+        
+        if len(resume_ids) > Config.RESUME_BATCH_MAX_IDS:
+            return jsonify({
+                "success": False,
+                "error": f"At most {Config.RESUME_BATCH_MAX_IDS} ids per request"
+            }), 400
+        
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            found = fetch_resume_details_many(cursor, resume_ids)
+            cursor.close()
+        
+        resumes = [add_pending_counts(found[i], i) for i in dict.fromkeys(resume_ids) if i in found]
+        missing = [i for i in dict.fromkeys(resume_ids) if i not in found]
+        
+        print(f"📄 Batch fetched {len(resumes)} resume details ({len(missing)} missing)")
+        return jsonify({
+            "success": True,
+            "count": len(resumes),
+            "resumes": resumes,
+            "missing": missing
+        }), 200
         
+    except Exception as e:
+        print(f"❌ Error getting resume batch: {e}")
+        return jsonify({"success": False, "error": str(e)}), 500
+
+def buffer_counter_increment(resume_id, views=0, downloads=0):
+    """
+    Buffer a view/download increment and return the resume's new
+    (views, downloads) totals, or None if the resume does not exist.
+    The database is only read the first time a resume's counts are needed
+    (or again if they were evicted before the increment landed).
+    """
+    if counter_buffer.is_known(resume_id):
+        totals = counter_buffer.increment(resume_id, views=views, downloads=downloads)
+        if totals is not None:
+            return totals
+        # Evicted since is_known(): the delta is buffered, re-read the base
+        views = downloads = 0
+    
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
         cursor.execute("""
-            UPDATE Resumes 
-            SET visitor_count = ISNULL(visitor_count, 0) + 1,
-                UpdatedDate = GETDATE()
-            WHERE ResumeID = ?
+            SELECT ISNULL(visitor_count, 0), ISNULL(download_count, 0)
+            FROM Resumes WHERE ResumeID = ?
         """, (resume_id,))
-        conn.commit()
-        
-        # Get updated count
-        cursor.execute("SELECT ISNULL(visitor_count, 0) FROM Resumes WHERE ResumeID = ?", (resume_id,))
-        new_count = cursor.fetchone()[0]
-        
+        row = cursor.fetchone()
         cursor.close()
-        conn.close()
+    if not row:
+        return None
+    return counter_buffer.increment(resume_id, views=views, downloads=downloads, observed=(row[0], row[1]))
+
+@app.route('/api/increment-view/<int:resume_id>', methods=['POST'])
+def increment_view_count(resume_id):
+    """Increment visitor count for a resume (buffered, flushed in batches)"""
+    try:
+        totals = buffer_counter_increment(resume_id, views=1)
+        if totals is None:
+            return jsonify({"success": False, "error": "Resume not found"}), 404
+        new_count = totals[0]
         
         print(f"👁️  View count incremented for resume {resume_id}. New count: {new_count}")
         return jsonify({"success": True, "new_count": new_count}), 200
@@ -914,26 +1337,12 @@ def increment_view_count(resume_id):
 
 @app.route('/api/increment-download/<int:resume_id>', methods=['POST'])
 def increment_download_count(resume_id):
-    """Increment download count for a resume"""
+    """Increment download count for a resume (buffered, flushed in batches)"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            UPDATE Resumes 
-            SET download_count = ISNULL(download_count, 0) + 1,
-                UpdatedDate = GETDATE()
-            WHERE ResumeID = ?
-        """, (resume_id,))
-        
-        # Get updated count
-        cursor.execute("SELECT ISNULL(download_count, 0) FROM Resumes WHERE ResumeID = ?", (resume_id,))
-        result = cursor.fetchone()
-        new_count = result[0] if result else 0
-        
-        conn.commit()
-        cursor.close()
-        conn.close()
+        totals = buffer_counter_increment(resume_id, downloads=1)
+        if totals is None:
+            return jsonify({"success": False, "error": "Resume not found"}), 404
+        new_count = totals[1]
         
         print(f"⬇️  Resume {resume_id} downloaded. Download count: {new_count}")
         
@@ -951,18 +1360,23 @@ def increment_download_count(resume_id):
 def delete_resume(resume_id):
     """Delete a resume"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute("SELECT ResumeID FROM Resumes WHERE ResumeID = ?", (resume_id,))
-        if not cursor.fetchone():
-            return jsonify({"success": False, "error": "Resume not found"}), 404
+            cursor.execute("SELECT CreatedDate FROM Resumes WHERE ResumeID = ?", (resume_id,))
+            row = cursor.fetchone()
+            if not row:
+                return jsonify({"success": False, "error": "Resume not found"}), 404
         
-        cursor.execute("DELETE FROM Resumes WHERE ResumeID = ?", (resume_id,))
+            cursor.execute("DELETE FROM Resumes WHERE ResumeID = ?", (resume_id,))
+            if row[0]:
+                rollups.bump(cursor, rollups.RESUMES_CREATED, -1, on_date=row[0])
         
-        conn.commit()
-        cursor.close()
-        conn.close()
+            conn.commit()
+            cursor.close()
+        counter_buffer.discard(resume_id)
+        analytics_cache.invalidate()
+        matching_engine.invalidate()
         
         print(f"🗑️  Resume {resume_id} deleted successfully")
         
@@ -976,80 +1390,276 @@ def delete_resume(resume_id):
 # JOB POSTING ENDPOINTS
 # ============================================================
 
+JOB_SELECT_COLUMNS = """
+        j.JobID, j.JobTitle, j.JobDescription, j.EducationRequirement,
+        j.ExperienceYears, j.JobType, j.SalaryPackage, j.JobLocation,
+        j.ApplicationDeadline, j.Benefits, j.ContactEmail, j.JobStatus,
+        j.PostedDate, c.CompanyName, c.CompanyID,
+        s.SectorName, s.SectorID,
+        co.CourseName, co.CourseID,
+        ci.CityName, ci.CityID,
+        st.StateName, st.StateID,
+        cn.CountryName, cn.CountryID
+"""
+
+JOB_FROM_SQL = """
+    FROM Jobs j
+    INNER JOIN Companies c ON j.CompanyID = c.CompanyID
+    LEFT JOIN Sectors s ON j.SectorID = s.SectorID
+    LEFT JOIN Courses co ON j.CourseID = co.CourseID
+    LEFT JOIN Cities ci ON j.CityID = ci.CityID
+    LEFT JOIN States st ON ci.StateID = st.StateID
+    LEFT JOIN Countries cn ON st.CountryID = cn.CountryID
+"""
+
+JOB_SELECT_SQL = "SELECT" + JOB_SELECT_COLUMNS + JOB_FROM_SQL
+
+# sort name -> (never-NULL SQL sort key, key type, default direction)
+# Salary is free text ("6 LPA", "5-7 LPA"), so it sorts by its leading number
+JOB_SORTS = {
+    'posted': ("ISNULL(j.PostedDate, '19000101')", 'date', 'desc'),
+    'deadline': ("ISNULL(j.ApplicationDeadline, '99991231')", 'date', 'asc'),
+    'experience': ("ISNULL(j.ExperienceYears, 0)", 'number', 'asc'),
+    'salary': (
+        "ISNULL(TRY_CAST(LEFT(j.SalaryPackage, PATINDEX('%[^0-9.]%', j.SalaryPackage + 'x') - 1)"
+        " AS DECIMAL(18, 4)), -1)",
+        'number', 'desc'
+    )
+}
+JOB_SORT_CASTS = {'date': 'CAST(? AS DATETIME)', 'number': 'CAST(? AS DECIMAL(18, 4))'}
+
+# SQL Server allows at most 2100 parameters per statement
+SQL_PARAM_CHUNK = 2000
+
+def chunked(items, size=SQL_PARAM_CHUNK):
+    """Yield successive slices of `items` no longer than `size`"""
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+def fetch_job_skills(cursor, job_ids):
+    """Fetch skills for many jobs at once - returns {JobID: [skill, ...]}"""
+    skills_by_job = {job_id: [] for job_id in job_ids}
+    for chunk in chunked(list(skills_by_job)):
+        placeholders = ', '.join('?' * len(chunk))
+        cursor.execute(f"""
+            SELECT js.JobID, sk.SkillName, sk.SkillID
+            FROM JobSkills js
+            INNER JOIN JobSkillsMaster sk ON js.SkillID = sk.SkillID
+            WHERE js.JobID IN ({placeholders})
+        """, chunk)
+        for job_id, skill_name, skill_id in cursor.fetchall():
+            skills_by_job[job_id].append({'skillId': skill_id, 'skillName': skill_name})
+    return skills_by_job
+
+def job_row_to_dict(row, skills):
+    """Map a JOB_SELECT_SQL row (plus its skills) to the API job shape"""
+    return {
+        'jobId': row[0],
+        'jobTitle': row[1],
+        'jobDescription': row[2],
+        'educationRequirement': row[3],
+        'experienceYears': float(row[4]),
+        'jobType': row[5],
+        'salaryPackage': row[6],
+        'jobLocation': row[7],
+        'applicationDeadline': row[8].isoformat() if row[8] else None,
+        'benefits': row[9],
+        'contactEmail': row[10],
+        'jobStatus': row[11],
+        'postedDate': row[12].isoformat() if row[12] else None,
+        'companyName': row[13],
+        'companyId': row[14],
+        'sectorName': row[15],
+        'sectorId': row[16],
+        'courseName': row[17],
+        'courseId': row[18],
+        'cityName': row[19],
+        'cityId': row[20],
+        'stateName': row[21],
+        'stateId': row[22],
+        'countryName': row[23],
+        'countryId': row[24],
+        'skills': skills
+    }
+
+def rows_to_jobs(cursor, rows):
+    """Map job rows to API dicts, loading all their skills in one batch"""
+    skills_by_job = fetch_job_skills(cursor, [row[0] for row in rows])
+    return [job_row_to_dict(row, skills_by_job[row[0]]) for row in rows]
+
+def job_sort_value(value, kind):
+    """Comparable, JSON-safe form of a sort key (dates as ISO strings)"""
+    if kind == 'date':
+        if isinstance(value, datetime):
+            return value.isoformat(sep=' ', timespec='milliseconds')
+        return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+    if kind == 'number':
+        return Decimal(str(value))
+    return float(value)
+
+def encode_job_cursor(sort, value, job_id):
+    """Opaque keyset cursor for a (sort key, JobID) position"""
+    raw = json.dumps([sort, str(value), job_id])
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+def decode_job_cursor(cursor_token, sort):
+    """Inverse of encode_job_cursor - raises ValueError if malformed or for another sort"""
+    try:
+        cursor_sort, value, job_id = json.loads(base64.urlsafe_b64decode(cursor_token.encode('ascii')))
+        if cursor_sort != sort:
+            raise ValueError(f"cursor belongs to sort '{cursor_sort}'")
+        kind = JOB_SORTS[sort][1] if sort in JOB_SORTS else 'score'
+        if kind == 'date':
+            datetime.fromisoformat(value)
+        return job_sort_value(value, kind), int(job_id)
+    except (TypeError, ValueError, ArithmeticError, binascii.Error) as e:
+        raise ValueError(f'Invalid cursor: {e}')
+
+def parse_job_page_args(args, default_sort, sorts):
+    """
+    Read sort/order/limit/offset/cursor query parameters.
+    Returns a page dict; limit is None (everything) unless limit, offset
+    or cursor was given. Raises ValueError on bad input.
+    """
+    sort = args.get('sort', '').strip() or default_sort
+    if sort not in sorts:
+        raise ValueError(f"Unknown sort '{sort}' (use one of: {', '.join(sorts)})")
+    
+    order = args.get('order', '').strip().lower()
+    if order and order not in ('asc', 'desc'):
+        raise ValueError("order must be 'asc' or 'desc'")
+    default_order = JOB_SORTS[sort][2] if sort in JOB_SORTS else 'desc'
+    
+    cursor_token = args.get('cursor', '').strip()
+    limit = args.get('limit', type=int)
+    offset = args.get('offset', type=int)
+    if limit is not None or offset is not None or cursor_token:
+        limit = max(1, min(limit or Config.JOB_PAGE_DEFAULT_LIMIT, Config.JOB_PAGE_MAX_LIMIT))
+    
+    return {
+        'sort': sort,
+        'descending': (order or default_order) == 'desc',
+        'limit': limit,
+        'offset': 0 if cursor_token else max(0, offset or 0),
+        'after': decode_job_cursor(cursor_token, sort) if cursor_token else None
+    }
+
+def fetch_jobs_page(cursor, where, params, page):
+    """
+    One page of JOB_SELECT_SQL rows sorted in SQL.
+    The total comes from COUNT(*) OVER () in the same query.
+    Returns (rows, total, next_cursor); total is None on cursor pages.
+    """
+    key_sql, kind, _ = JOB_SORTS[page['sort']]
+    direction = 'DESC' if page['descending'] else 'ASC'
+    conditions = list(where)
+    params = list(params)
+    
+    if page['after'] is not None:
+        op = '<' if page['descending'] else '>'
+        cast = JOB_SORT_CASTS[kind]
+        conditions.append(f"({key_sql} {op} {cast} OR ({key_sql} = {cast} AND j.JobID {op} ?))")
+        value, job_id = page['after']
+        params.extend([str(value), str(value), job_id])
+    
+    where_sql = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = (
+        f"SELECT{JOB_SELECT_COLUMNS}, {key_sql} AS SortKey, COUNT(*) OVER () AS TotalCount"
+        f"{JOB_FROM_SQL}{where_sql} ORDER BY SortKey {direction}, j.JobID {direction}"
+    )
+    if page['limit'] is not None:
+        query += " OFFSET ? ROWS FETCH NEXT ? ROWS ONLY"
+        params.extend([page['offset'], page['limit'] + 1])
+    
+    cursor.execute(query, params)
+    rows = cursor.fetchall()
+    
+    total = None
+    if page['after'] is None:
+        if rows:
+            total = rows[0][26]
+        elif page['offset']:
+            cursor.execute(f"SELECT COUNT(*){JOB_FROM_SQL}{where_sql}", params[:-2])
+            total = cursor.fetchone()[0]
+        else:
+            total = 0
+    
+    next_cursor = None
+    if page['limit'] is not None and len(rows) > page['limit']:
+        rows = rows[:page['limit']]
+        next_cursor = encode_job_cursor(page['sort'], job_sort_value(rows[-1][25], kind), rows[-1][0])
+    return rows, total, next_cursor
+
+def page_ranked_jobs(keyed_ids, page):
+    """
+    Sort and page (sort value, JobID) pairs in Python.
+    Returns (page JobIDs, total, next_cursor); total is None on cursor pages.
+    """
+    descending = page['descending']
+    keyed_ids = sorted(keyed_ids, reverse=descending)
+    total = len(keyed_ids)
+    if page['after'] is not None:
+        after = page['after']
+        keyed_ids = [k for k in keyed_ids if (k < after if descending else k > after)]
+        total = None
+    
+    if page['limit'] is None:
+        return [job_id for _, job_id in keyed_ids], total, None
+    
+    window = keyed_ids[page['offset']:page['offset'] + page['limit'] + 1]
+    next_cursor = None
+    if len(window) > page['limit']:
+        window = window[:page['limit']]
+        next_cursor = encode_job_cursor(page['sort'], window[-1][0], window[-1][1])
+    return [job_id for _, job_id in window], total, next_cursor
+
+def fetch_jobs_by_ids(cursor, job_ids):
+    """JOB_SELECT_SQL rows for the given JobIDs, in the order given"""
+    rows = []
+    for chunk in chunked(job_ids):
+        placeholders = ', '.join('?' * len(chunk))
+        cursor.execute(JOB_SELECT_SQL + f" WHERE j.JobID IN ({placeholders})", chunk)
+        rows.extend(cursor.fetchall())
+    position = {job_id: i for i, job_id in enumerate(job_ids)}
+    rows.sort(key=lambda row: position[row[0]])
+    return rows
+
+def job_page_response(jobs, total, next_cursor, **extra):
+    """Standard JSON body for job lists"""
+    result = {
+        'success': True,
+        'jobs': jobs,
+        'count': len(jobs),
+        'total': total,
+        'next_cursor': next_cursor
+    }
+    result.update(extra)
+    return jsonify(result)
+
 @app.route('/api/jobs', methods=['GET'])
 def get_jobs():
-    """Get all jobs with company, skills, and master data information"""
+    """
+    Get jobs with company, skills, and master data information.
+    Optional query parameters:
+      sort=posted|deadline|experience|salary  (default: posted)
+      order=asc|desc                          (default depends on sort)
+      limit=N, offset=N                       page size (capped) and offset
+      cursor=...                              next_cursor from the previous page
+    Without limit/offset/cursor every job is returned, as before.
+    """
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT 
-                j.JobID, j.JobTitle, j.JobDescription, j.EducationRequirement,
-                j.ExperienceYears, j.JobType, j.SalaryPackage, j.JobLocation,
-                j.ApplicationDeadline, j.Benefits, j.ContactEmail, j.JobStatus,
-                j.PostedDate, c.CompanyName, c.CompanyID,
-                s.SectorName, s.SectorID,
-                co.CourseName, co.CourseID,
-                ci.CityName, ci.CityID,
-                st.StateName, st.StateID,
-                cn.CountryName, cn.CountryID
-            FROM Jobs j
-            INNER JOIN Companies c ON j.CompanyID = c.CompanyID
-            LEFT JOIN Sectors s ON j.SectorID = s.SectorID
-            LEFT JOIN Courses co ON j.CourseID = co.CourseID
-            LEFT JOIN Cities ci ON j.CityID = ci.CityID
-            LEFT JOIN States st ON ci.StateID = st.StateID
-            LEFT JOIN Countries cn ON st.CountryID = cn.CountryID
-            ORDER BY j.PostedDate DESC
-        """)
+        try:
+            page = parse_job_page_args(request.args, 'posted', JOB_SORTS)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         
-        jobs = []
-        for row in cursor.fetchall():
-            job_id = row[0]
-            
-            # FIXED: Changed from Skills to JobSkillsMaster
-            cursor.execute("""
-                SELECT sk.SkillName, sk.SkillID
-                FROM JobSkills js
-                INNER JOIN JobSkillsMaster sk ON js.SkillID = sk.SkillID
-                WHERE js.JobID = ?
-            """, (job_id,))
-            
-            skills = [{'skillId': skill_row[1], 'skillName': skill_row[0]} for skill_row in cursor.fetchall()]
-            
-            jobs.append({
-                'jobId': job_id,
-                'jobTitle': row[1],
-                'jobDescription': row[2],
-                'educationRequirement': row[3],
-                'experienceYears': float(row[4]),
-                'jobType': row[5],
-                'salaryPackage': row[6],
-                'jobLocation': row[7],
-                'applicationDeadline': row[8].isoformat() if row[8] else None,
-                'benefits': row[9],
-                'contactEmail': row[10],
-                'jobStatus': row[11],
-                'postedDate': row[12].isoformat() if row[12] else None,
-                'companyName': row[13],
-                'companyId': row[14],
-                'sectorName': row[15],
-                'sectorId': row[16],
-                'courseName': row[17],
-                'courseId': row[18],
-                'cityName': row[19],
-                'cityId': row[20],
-                'stateName': row[21],
-                'stateId': row[22],
-                'countryName': row[23],
-                'countryId': row[24],
-                'skills': skills
-            })
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            rows, total, next_cursor = fetch_jobs_page(cursor, [], [], page)
+            jobs = rows_to_jobs(cursor, rows)
         
-        conn.close()
         print(f"📋 Retrieved {len(jobs)} jobs from database")
-        return jsonify({'success': True, 'jobs': jobs, 'count': len(jobs)}), 200
+        return job_page_response(jobs, total, next_cursor), 200
         
     except Exception as e:
         print(f"❌ Error in get_jobs: {str(e)}")
@@ -1059,76 +1669,16 @@ def get_jobs():
 def get_job(job_id):
     """Get a specific job by ID"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT 
-                j.JobID, j.JobTitle, j.JobDescription, j.EducationRequirement,
-                j.ExperienceYears, j.JobType, j.SalaryPackage, j.JobLocation,
-                j.ApplicationDeadline, j.Benefits, j.ContactEmail, j.JobStatus,
-                j.PostedDate, c.CompanyName, c.CompanyID,
-                s.SectorName, s.SectorID,
-                co.CourseName, co.CourseID,
-                ci.CityName, ci.CityID,
-                st.StateName, st.StateID,
-                cn.CountryName, cn.CountryID
-            FROM Jobs j
-            INNER JOIN Companies c ON j.CompanyID = c.CompanyID
-            LEFT JOIN Sectors s ON j.SectorID = s.SectorID
-            LEFT JOIN Courses co ON j.CourseID = co.CourseID
-            LEFT JOIN Cities ci ON j.CityID = ci.CityID
-            LEFT JOIN States st ON ci.StateID = st.StateID
-            LEFT JOIN Countries cn ON st.CountryID = cn.CountryID
-            WHERE j.JobID = ?
-        """, (job_id,))
-        
-        row = cursor.fetchone()
-        
-        if not row:
-            conn.close()
-            return jsonify({'success': False, 'error': 'Job not found'}), 404
-        
-        # FIXED: Changed from Skills to JobSkillsMaster
-        cursor.execute("""
-            SELECT sk.SkillName, sk.SkillID
-            FROM JobSkills js
-            INNER JOIN JobSkillsMaster sk ON js.SkillID = sk.SkillID
-            WHERE js.JobID = ?
-        """, (job_id,))
-        
-        skills = [{'skillId': skill_row[1], 'skillName': skill_row[0]} for skill_row in cursor.fetchall()]
-        
-        job = {
-            'jobId': row[0],
-            'jobTitle': row[1],
-            'jobDescription': row[2],
-            'educationRequirement': row[3],
-            'experienceYears': float(row[4]),
-            'jobType': row[5],
-            'salaryPackage': row[6],
-            'jobLocation': row[7],
-            'applicationDeadline': row[8].isoformat() if row[8] else None,
-            'benefits': row[9],
-            'contactEmail': row[10],
-            'jobStatus': row[11],
-            'postedDate': row[12].isoformat() if row[12] else None,
-            'companyName': row[13],
-            'companyId': row[14],
-            'sectorName': row[15],
-            'sectorId': row[16],
-            'courseName': row[17],
-            'courseId': row[18],
-            'cityName': row[19],
-            'cityId': row[20],
-            'stateName': row[21],
-            'stateId': row[22],
-            'countryName': row[23],
-            'countryId': row[24],
-            'skills': skills
-        }
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(JOB_SELECT_SQL + " WHERE j.JobID = ?", (job_id,))
+            row = cursor.fetchone()
+            
+            if not row:
+                return jsonify({'success': False, 'error': 'Job not found'}), 404
+            
+            job = rows_to_jobs(cursor, [row])[0]
         
-        conn.close()
         return jsonify({'success': True, 'job': job}), 200
         
     except Exception as e:
@@ -1189,93 +1739,19 @@ def create_job():
         conn = get_db_connection()
         cursor = conn.cursor()
 
-        # 1. Handle Company (Get ID or Create)
-        cursor.execute("SELECT CompanyID FROM Companies WHERE CompanyName = ?", (company_name,))
-        comp_row = cursor.fetchone()
-        if comp_row:
-            company_id = comp_row[0]
-        else:
-            cursor.execute(
-                "INSERT INTO Companies (CompanyName) OUTPUT INSERTED.CompanyID VALUES (?)", 
-                (company_name,)
-            )
-            company_id = cursor.fetchone()[0]
-            print(f"✅ Created new company: {company_name} (ID: {company_id})")
-
-        # 2. Get or create Sector ID
-        sector_id = None
-        if sector:
-            cursor.execute("SELECT SectorID FROM Sectors WHERE SectorName = ?", (sector,))
-            sector_row = cursor.fetchone()
-            if sector_row:
-                sector_id = sector_row[0]
-            else:
-                cursor.execute(
-                    "INSERT INTO Sectors (SectorName, IsActive) OUTPUT INSERTED.SectorID VALUES (?, 1)", 
-                    (sector,)
-                )
-                sector_id = cursor.fetchone()[0]
-                print(f"✅ Created new sector: {sector} (ID: {sector_id})")
-
-        # 3. Get or create Course ID
-        course_id = None
-        if course:
-            cursor.execute("SELECT CourseID FROM Courses WHERE CourseName = ?", (course,))
-            course_row = cursor.fetchone()
-            if course_row:
-                course_id = course_row[0]
-            else:
-                cursor.execute(
-                    "INSERT INTO Courses (CourseName, IsActive) OUTPUT INSERTED.CourseID VALUES (?, 1)", 
-                    (course,)
-                )
-                course_id = cursor.fetchone()[0]
-                print(f"✅ Created new course: {course} (ID: {course_id})")
-
-        # 4. Get or create City/State/Country IDs
+        # 1-4. Company, Sector, Course and City/State/Country IDs - from the
+        # master data cache, with a MERGE per name only on a cache miss
+        master_cache.ensure_loaded(cursor)
+        masters = master_cache.session()
+        company_id = masters.get_or_create(cursor, 'company', company_name)
+        sector_id = masters.get_or_create(cursor, 'sector', sector) if sector else None
+        course_id = masters.get_or_create(cursor, 'course', course) if course else None
+        
         city_id = None
         if city and state and country:
-            # Get or create Country
-            cursor.execute("SELECT CountryID FROM Countries WHERE CountryName = ?", (country,))
-            country_row = cursor.fetchone()
-            if country_row:
-                country_id = country_row[0]
-            else:
-                cursor.execute(
-                    "INSERT INTO Countries (CountryName, IsActive) OUTPUT INSERTED.CountryID VALUES (?, 1)", 
-                    (country,)
-                )
-                country_id = cursor.fetchone()[0]
-            
-            # Get or create State
-            cursor.execute(
-                "SELECT StateID FROM States WHERE StateName = ? AND CountryID = ?", 
-                (state, country_id)
-            )
-            state_row = cursor.fetchone()
-            if state_row:
-                state_id = state_row[0]
-            else:
-                cursor.execute(
-                    "INSERT INTO States (StateName, CountryID, IsActive) OUTPUT INSERTED.StateID VALUES (?, ?, 1)", 
-                    (state, country_id)
-                )
-                state_id = cursor.fetchone()[0]
-            
-            # Get or create City
-            cursor.execute(
-                "SELECT CityID FROM Cities WHERE CityName = ? AND StateID = ?", 
-                (city, state_id)
-            )
-            city_row = cursor.fetchone()
-            if city_row:
-                city_id = city_row[0]
-            else:
-                cursor.execute(
-                    "INSERT INTO Cities (CityName, StateID, IsActive) OUTPUT INSERTED.CityID VALUES (?, ?, 1)", 
-                    (city, state_id)
-                )
-                city_id = cursor.fetchone()[0]
+            country_id = masters.get_or_create(cursor, 'country', country)
+            state_id = masters.get_or_create(cursor, 'state', state, country_id)
+            city_id = masters.get_or_create(cursor, 'city', city, state_id)
 
         # 5. Insert the Job
         cursor.execute("""
@@ -1297,32 +1773,37 @@ def create_job():
         job_id = cursor.fetchone()[0]
         print(f"✅ Job {job_id} created successfully!")
 
-        # 6. Handle Skills - FIXED: Using JobSkillsMaster instead of Skills
-        if skills_text:
-            # Split by comma and clean up
-            skill_names = [s.strip() for s in skills_text.split(',') if s.strip()]
-            
-            for skill_name in skill_names:
-                # Get or create skill in JobSkillsMaster (NOT Skills table)
-                cursor.execute("SELECT SkillID FROM JobSkillsMaster WHERE SkillName = ?", (skill_name,))
-                skill_row = cursor.fetchone()
-                
-                if skill_row:
-                    skill_id = skill_row[0]
-                    print(f"📌 Found existing skill: {skill_name} (ID: {skill_id})")
-                else:
-                    cursor.execute(
-                        "INSERT INTO JobSkillsMaster (SkillName, IsActive) OUTPUT INSERTED.SkillID VALUES (?, 1)", 
-                        (skill_name,)
-                    )
-                    skill_id = cursor.fetchone()[0]
-                    print(f"✅ Created new skill in JobSkillsMaster: {skill_name} (ID: {skill_id})")
-                
-                # Link job to skill
-                cursor.execute("INSERT INTO JobSkills (JobID, SkillID) VALUES (?, ?)", (job_id, skill_id))
-                print(f"✅ Linked skill {skill_name} to job {job_id}")
+        # 6. Handle Skills - canonical names mapped onto JobSkillsMaster IDs
+        # (cached; any new skills are created by a single MERGE)
+        skill_normalizer.ensure_loaded(cursor)
+        skill_names = skill_normalizer.canonical_list((skills_text or '').split(','))
+        skill_ids, new_skills = skill_normalizer.master_skill_ids(cursor, skill_names)
+        job_skills = [(skill_ids[name], name) for name in skill_names]
+        if job_skills:
+            cursor.fast_executemany = True
+            cursor.executemany(
+                "INSERT INTO JobSkills (JobID, SkillID) VALUES (?, ?)",
+                [(job_id, skill_id) for skill_id, _ in job_skills]
+            )
+            cursor.fast_executemany = False
+            print(f"✅ Linked {len(job_skills)} skills to job {job_id} ({len(new_skills)} new)")
 
+        rollups.bump(cursor, rollups.JOBS_POSTED)
         conn.commit()
+        if masters.created or new_skills:
+            master_data.invalidate()
+        masters.publish()
+        skill_normalizer.publish(new_skills)
+        analytics_cache.invalidate()
+        matching_engine.invalidate()
+        job_search_index.add_job(job_id, title, description, company_name, skill_names, {
+            'sector': (sector_id, sector),
+            'course': (course_id, course),
+            'jobType': (job_type or None, job_type),
+            'city': (city_id, city),
+            'experience': float(experience) if experience else 0.0,
+            'skill': job_skills
+        })
         print(f"🎉 Job posting complete! Job ID: {job_id}")
         
         return jsonify({
@@ -1342,22 +1823,77 @@ def create_job():
         if conn:
             conn.close()
 
+def record_imported_jobs(cursor, jobs):
+    """job_import hook inside each chunk's transaction"""
+    rollups.bump(cursor, rollups.JOBS_POSTED, len(jobs))
+
+def publish_imported_jobs(jobs):
+    """job_import hook after each chunk commits"""
+    for job in jobs:
+        job_search_index.add_job(job['jobId'], job['title'], job['description'], job['company'],
+                                 job['skillNames'], {
+            'sector': (job['sectorId'], job['sector']),
+            'course': (job['courseId'], job['course']),
+            'jobType': (job['jobType'] or None, job['jobType']),
+            'city': (job['cityId'], job['city']),
+            'experience': job['experience'],
+            'skill': job['skillPairs']
+        })
+
+def finish_job_import(totals):
+    if totals['imported']:
+        analytics_cache.invalidate()
+        matching_engine.invalidate()
+        master_data.invalidate()
+
+@app.route('/api/jobs/import', methods=['POST'])
+def import_jobs():
+    """
+    Bulk import jobs from a streamed CSV (header row required) or NDJSON body.
+    Records use the POST /api/jobs fields; in CSV, skills are separated by
+    , ; or |. ?format=csv|ndjson (default: from the Content-Type),
+    ?chunkSize= (default Config.JOB_IMPORT_CHUNK_SIZE). The response is
+    streamed NDJSON with one result per record and a final summary line.
+    """
+    fmt = request.args.get('format', '').lower() or ('csv' if 'csv' in (request.content_type or '') else 'ndjson')
+    if fmt not in ('csv', 'ndjson'):
+        return jsonify({'success': False, 'error': "format must be 'csv' or 'ndjson'"}), 400
+    chunk_size = request.args.get('chunkSize', Config.JOB_IMPORT_CHUNK_SIZE, type=int)
+    chunk_size = max(1, min(chunk_size, Config.JOB_IMPORT_MAX_CHUNK_SIZE))
+    stream = request.stream
+    
+    def generate():
+        results = job_import.import_jobs(
+            get_db_connection, job_import.read_records(stream, fmt), master_cache, skill_normalizer,
+            chunk_size, before_commit=record_imported_jobs, after_commit=publish_imported_jobs
+        )
+        for result in results:
+            if 'summary' in result:
+                finish_job_import(result['summary'])
+            yield json.dumps(result) + '\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
 @app.route('/api/jobs/<int:job_id>', methods=['DELETE'])
 def delete_job(job_id):
     """Delete a job posting"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
         
-        cursor.execute("SELECT JobID FROM Jobs WHERE JobID = ?", (job_id,))
-        if not cursor.fetchone():
-            conn.close()
-            return jsonify({'success': False, 'error': 'Job not found'}), 404
+            cursor.execute("SELECT PostedDate FROM Jobs WHERE JobID = ?", (job_id,))
+            row = cursor.fetchone()
+            if not row:
+                return jsonify({'success': False, 'error': 'Job not found'}), 404
         
-        cursor.execute("DELETE FROM Jobs WHERE JobID = ?", (job_id,))
+            cursor.execute("DELETE FROM Jobs WHERE JobID = ?", (job_id,))
+            if row[0]:
+                rollups.bump(cursor, rollups.JOBS_POSTED, -1, on_date=row[0])
         
-        conn.commit()
-        conn.close()
+            conn.commit()
+        analytics_cache.invalidate()
+        matching_engine.invalidate()
+        job_search_index.remove_job(job_id)
         
         print(f"🗑️  Job {job_id} deleted successfully")
         return jsonify({'success': True, 'message': 'Job deleted successfully'}), 200
@@ -1366,9 +1902,23 @@ def delete_job(job_id):
         print(f"❌ Error in delete_job: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+def ensure_job_search_index(cursor):
+    """Build the job search index on first use (e.g. when not started via __main__)"""
+    if not job_search_index.loaded:
+        job_search_index.load(cursor)
+
 @app.route('/api/jobs/search', methods=['GET'])
 def search_jobs():
-    """Search and filter jobs"""
+    """
+    Search and filter jobs.
+    `keyword` is answered from the in-memory index (every word must match,
+    best BM25 score first); the other filters are applied in SQL to the
+    matching JobIDs only. A keyword made only of stop words falls back to
+    a LIKE match on title, description and company. `facets=1` adds per-facet counts over all results
+    (their `value` is what the matching filter parameter takes).
+    Takes the same sort/order/limit/offset/cursor parameters as GET
+    /api/jobs, plus sort=relevance (the default when searching by keyword).
+    """
     try:
         keyword = request.args.get('keyword', '').strip()
         location = request.args.get('location', '').strip()
@@ -1377,146 +1927,234 @@ def search_jobs():
         experience_max = request.args.get('experienceMax', type=float)
         sector_id = request.args.get('sectorId', type=int)
         course_id = request.args.get('courseId', type=int)
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        query = """
-            SELECT DISTINCT
-                j.JobID, j.JobTitle, j.JobDescription, j.EducationRequirement,
-                j.ExperienceYears, j.JobType, j.SalaryPackage, j.JobLocation,
-                j.ApplicationDeadline, j.Benefits, j.ContactEmail, j.JobStatus,
-                j.PostedDate, c.CompanyName, c.CompanyID,
-                s.SectorName, s.SectorID,
-                co.CourseName, co.CourseID,
-                ci.CityName, ci.CityID,
-                st.StateName, st.StateID,
-                cn.CountryName, cn.CountryID
-            FROM Jobs j
-            INNER JOIN Companies c ON j.CompanyID = c.CompanyID
-            LEFT JOIN Sectors s ON j.SectorID = s.SectorID
-            LEFT JOIN Courses co ON j.CourseID = co.CourseID
-            LEFT JOIN Cities ci ON j.CityID = ci.CityID
-            LEFT JOIN States st ON ci.StateID = st.StateID
-            LEFT JOIN Countries cn ON st.CountryID = cn.CountryID
-            WHERE j.JobStatus = 'Open'
-        """
-        
+        city_id = request.args.get('cityId', type=int)
+        skill_id = request.args.get('skillId', type=int)
+        include_facets = request.args.get('facets', '').lower() in ('1', 'true', 'yes')
+        use_index = bool(tokenize(keyword))
+        
+        sorts = dict(JOB_SORTS, relevance=None) if use_index else JOB_SORTS
+        try:
+            page = parse_job_page_args(request.args, 'relevance' if use_index else 'posted', sorts)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        
+        where = ["j.JobStatus = 'Open'"]
         params = []
         
-        if keyword:
-            query += " AND (j.JobTitle LIKE ? OR j.JobDescription LIKE ? OR c.CompanyName LIKE ?)"
-            search_term = f'%{keyword}%'
-            params.extend([search_term, search_term, search_term])
+        if keyword and not use_index:
+            where.append(
+                "(j.JobTitle LIKE ? OR j.JobDescription LIKE ? OR EXISTS ("
+                "SELECT 1 FROM Companies kc WHERE kc.CompanyID = j.CompanyID AND kc.CompanyName LIKE ?))"
+            )
+            params.extend([f'%{keyword}%'] * 3)
         
         if location:
-            query += " AND j.JobLocation LIKE ?"
+            where.append("j.JobLocation LIKE ?")
             params.append(f'%{location}%')
         
         if job_type:
-            query += " AND j.JobType = ?"
+            where.append("j.JobType = ?")
             params.append(job_type)
         
         if experience_min is not None:
-            query += " AND j.ExperienceYears >= ?"
+            where.append("j.ExperienceYears >= ?")
             params.append(experience_min)
         
         if experience_max is not None:
-            query += " AND j.ExperienceYears <= ?"
+            where.append("j.ExperienceYears <= ?")
             params.append(experience_max)
         
         if sector_id:
-            query += " AND j.SectorID = ?"
+            where.append("j.SectorID = ?")
             params.append(sector_id)
         
         if course_id:
-            query += " AND j.CourseID = ?"
+            where.append("j.CourseID = ?")
             params.append(course_id)
         
-        query += " ORDER BY j.PostedDate DESC"
+        if city_id:
+            where.append("j.CityID = ?")
+            params.append(city_id)
         
-        cursor.execute(query, params)
+        if skill_id:
+            where.append("EXISTS (SELECT 1 FROM JobSkills fs WHERE fs.JobID = j.JobID AND fs.SkillID = ?)")
+            params.append(skill_id)
         
-        jobs = []
-        for row in cursor.fetchall():
-            job_id = row[0]
+        where_sql = " WHERE " + " AND ".join(where)
+        result_ids = None
+        
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
             
-            # FIXED: Changed from Skills to JobSkillsMaster
-            cursor.execute("""
-                SELECT sk.SkillName, sk.SkillID
-                FROM JobSkills js
-                INNER JOIN JobSkillsMaster sk ON js.SkillID = sk.SkillID
-                WHERE js.JobID = ?
-            """, (job_id,))
+            if use_index:
+                ensure_job_search_index(cursor)
+                scores = dict(job_search_index.search(keyword))
+                
+                # Filter the matches in SQL (ids and sort keys only), then
+                # sort/page in Python and load full rows for this page only
+                sort_sql = JOB_SORTS[page['sort']][0] if page['sort'] in JOB_SORTS else 'NULL'
+                kind = JOB_SORTS[page['sort']][1] if page['sort'] in JOB_SORTS else 'score'
+                keyed_ids = []
+                for chunk in chunked(list(scores), SQL_PARAM_CHUNK - len(params)):
+                    placeholders = ', '.join('?' * len(chunk))
+                    cursor.execute(
+                        f"SELECT j.JobID, {sort_sql} FROM Jobs j{where_sql} AND j.JobID IN ({placeholders})",
+                        params + chunk
+                    )
+                    for job_id, sort_value in cursor.fetchall():
+                        value = scores[job_id] if kind == 'score' else sort_value
+                        keyed_ids.append((job_sort_value(value, kind), job_id))
+                
+                result_ids = [job_id for _, job_id in keyed_ids]
+                page_ids, total, next_cursor = page_ranked_jobs(keyed_ids, page)
+                rows = fetch_jobs_by_ids(cursor, page_ids)
+            else:
+                rows, total, next_cursor = fetch_jobs_page(cursor, where, params, page)
+                if include_facets:
+                    if page['limit'] is None:
+                        result_ids = [row[0] for row in rows]
+                    else:
+                        cursor.execute(f"SELECT j.JobID FROM Jobs j{where_sql}", params)
+                        result_ids = [row[0] for row in cursor.fetchall()]
             
-            skills = [{'skillId': skill_row[1], 'skillName': skill_row[0]} for skill_row in cursor.fetchall()]
+            jobs = rows_to_jobs(cursor, rows)
             
-            jobs.append({
-                'jobId': row[0],
-                'jobTitle': row[1],
-                'jobDescription': row[2],
-                'educationRequirement': row[3],
-                'experienceYears': float(row[4]),
-                'jobType': row[5],
-                'salaryPackage': row[6],
-                'jobLocation': row[7],
-                'applicationDeadline': row[8].isoformat() if row[8] else None,
-                'benefits': row[9],
-                'contactEmail': row[10],
-                'jobStatus': row[11],
-                'postedDate': row[12].isoformat() if row[12] else None,
-                'companyName': row[13],
-                'companyId': row[14],
-                'sectorName': row[15],
-                'sectorId': row[16],
-                'courseName': row[17],
-                'courseId': row[18],
-                'cityName': row[19],
-                'cityId': row[20],
-                'stateName': row[21],
-                'stateId': row[22],
-                'countryName': row[23],
-                'countryId': row[24],
-                'skills': skills
-            })
+            if include_facets:
+                ensure_job_search_index(cursor)
+        
+        extra = {}
+        if include_facets:
+            extra['facets'] = job_search_index.facet_counts(result_ids)
         
-        conn.close()
         print(f"🔍 Search returned {len(jobs)} jobs")
-        return jsonify({'success': True, 'jobs': jobs, 'count': len(jobs)}), 200
+        return job_page_response(jobs, total, next_cursor, **extra), 200
         
     except Exception as e:
         print(f"❌ Error in search_jobs: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# ============================================================
+# MATCHING ENDPOINTS
+# ============================================================
+
+def match_k():
+    """Requested number of matches, clamped to Config.MATCH_MAX_K"""
+    k = request.args.get('k', Config.MATCH_DEFAULT_K, type=int)
+    return max(1, min(k, Config.MATCH_MAX_K))
+
+@app.route('/api/jobs/<int:job_id>/candidates', methods=['GET'])
+def get_job_candidates(job_id):
+    """Best matching resumes for an open job (?k=N)"""
+    if not matching.AVAILABLE:
+        return jsonify({'success': False, 'error': 'Matching requires numpy and scipy'}), 503
+    try:
+        matches = matching_engine.candidates_for_job(job_id, match_k())
+        if matches is None:
+            return jsonify({'success': False, 'error': 'Open job not found'}), 404
+        
+        if matches:
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                placeholders = ', '.join('?' * len(matches))
+                cursor.execute(f"""
+                    SELECT r.ResumeID, r.ResumeTitle, p.FullName, p.Email, p.Location
+                    FROM Resumes r
+                    LEFT JOIN PersonalInformation p ON r.ResumeID = p.ResumeID
+                    WHERE r.ResumeID IN ({placeholders})
+                """, [m['resumeId'] for m in matches])
+                details = {row[0]: row for row in cursor.fetchall()}
+                cursor.close()
+            
+            # Resumes deleted since the last rebuild drop out here
+            matches = [m for m in matches if m['resumeId'] in details]
+            for m in matches:
+                _, title, name, email, location = details[m['resumeId']]
+                m.update({'title': title, 'name': name, 'email': email, 'location': location})
+        
+        return jsonify({'success': True, 'jobId': job_id, 'candidates': matches, 'count': len(matches)}), 200
+        
+    except Exception as e:
+        print(f"❌ Error in get_job_candidates: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/resumes/<int:resume_id>/job-matches', methods=['GET'])
+def get_resume_job_matches(resume_id):
+    """Best matching open jobs for a resume (?k=N)"""
+    if not matching.AVAILABLE:
+        return jsonify({'success': False, 'error': 'Matching requires numpy and scipy'}), 503
+    try:
+        matches = matching_engine.jobs_for_resume(resume_id, match_k())
+        if matches is None:
+            return jsonify({'success': False, 'error': 'Resume not found'}), 404
+        
+        jobs = []
+        if matches:
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                rows = fetch_jobs_by_ids(cursor, [m['jobId'] for m in matches])
+                jobs = rows_to_jobs(cursor, rows)
+            
+            by_id = {m['jobId']: m for m in matches}
+            for job in jobs:
+                job['match'] = {key: value for key, value in by_id[job['jobId']].items() if key != 'jobId'}
+        
+        return jsonify({'success': True, 'resumeId': resume_id, 'jobs': jobs, 'count': len(jobs)}), 200
+        
+    except Exception as e:
+        print(f"❌ Error in get_resume_job_matches: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 # ============================================================
 # MASTER DATA ENDPOINTS
 # ============================================================
+# Served from the in-memory master_data snapshot. Every list carries an
+# ETag; a matching If-None-Match gets an empty 304.
+
+def not_modified(etag):
+    """True if the client's If-None-Match already holds this ETag"""
+    return etag in request.if_none_match
+
+def master_list_response(name, field=None, value=None):
+    """One snapshot list (optionally filtered on field == value) with its ETag"""
+    snapshot = master_data.current()
+    etag = snapshot.etag(name, value)
+    if not_modified(etag):
+        response = Response(status=304)
+    else:
+        items = snapshot.lists[name]
+        if value is not None:
+            items = [item for item in items if item[field] == value]
+        response = jsonify({'success': True, name: items})
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+@app.route('/api/master-data/bootstrap', methods=['GET'])
+def get_master_data_bootstrap():
+    """Every master list in one payload (gzip-compressed when the client accepts it)"""
+    try:
+        etag, body, compressed = master_data.bootstrap()
+        if not_modified(etag):
+            response = Response(status=304)
+        elif 'gzip' in request.accept_encodings:
+            response = Response(compressed, mimetype='application/json')
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['Vary'] = 'Accept-Encoding'
+        return response
+        
+    except Exception as e:
+        print(f"❌ Error in get_master_data_bootstrap: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/sectors', methods=['GET'])
 def get_sectors():
     """Get all sectors"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT SectorID, SectorName, Description, IsActive 
-            FROM Sectors 
-            WHERE IsActive = 1 
-            ORDER BY SectorName
-        """)
-        
-        sectors = []
-        for row in cursor.fetchall():
-            sectors.append({
-                'id': row[0],
-                'name': row[1],
-                'description': row[2] if row[2] else '',  # Handle NULL
-                'isActive': row[3]
-            })
-        
-        conn.close()
-        return jsonify({'success': True, 'sectors': sectors}), 200
+        return master_list_response('sectors')
         
     except Exception as e:
         print(f"❌ Error in get_sectors: {str(e)}")
@@ -1526,28 +2164,7 @@ def get_sectors():
 def get_courses():
     """Get all courses"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT CourseID, CourseName, CourseType, Duration, IsActive 
-            FROM Courses 
-            WHERE IsActive = 1 
-            ORDER BY CourseName
-        """)
-        
-        courses = []
-        for row in cursor.fetchall():
-            courses.append({
-                'id': row[0],
-                'name': row[1],
-                'type': row[2] if row[2] else '',  # Handle NULL
-                'duration': row[3] if row[3] else '',  # Handle NULL
-                'isActive': row[4]
-            })
-        
-        conn.close()
-        return jsonify({'success': True, 'courses': courses}), 200
+        return master_list_response('courses')
         
     except Exception as e:
         print(f"❌ Error in get_courses: {str(e)}")
@@ -1557,58 +2174,40 @@ def get_courses():
 def get_skills():
     """Get all skills from JOBS master table"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        return master_list_response('skills')
         
-        # CHANGED: Now reads from JobSkillsMaster instead of Skills
-        cursor.execute("""
-            SELECT SkillID, SkillName, Category, IsActive 
-            FROM JobSkillsMaster 
-            WHERE IsActive = 1 
-            ORDER BY SkillName
-        """)
-        
-        skills = []
-        for row in cursor.fetchall():
-            skills.append({
-                'id': row[0],
-                'name': row[1],
-                'category': row[2] if row[2] else '',  # Handle NULL
-                'isActive': row[3]
-            })
+    except Exception as e:
+        print(f"❌ Error in get_skills: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/skills/renormalize', methods=['POST'])
+def renormalize_skills():
+    """Merge duplicate skills and rename stored skills to their canonical names"""
+    try:
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            result = renormalize(cursor, skill_normalizer)
+            conn.commit()
+            
+            # Skill names/IDs changed underneath the search index and matcher
+            job_search_index.load(cursor)
+            cursor.close()
+        analytics_cache.invalidate()
+        matching_engine.invalidate()
+        master_data.invalidate()
         
-        conn.close()
-        return jsonify({'success': True, 'skills': skills}), 200
+        print(f"🏷️  Skills re-normalized: {result}")
+        return jsonify({'success': True, **result}), 200
         
     except Exception as e:
-        print(f"❌ Error in get_skills: {str(e)}")
+        print(f"❌ Error in renormalize_skills: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/countries', methods=['GET'])
 def get_countries():
     """Get all countries"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT CountryID, CountryName, CountryCode, IsActive 
-            FROM Countries 
-            WHERE IsActive = 1 
-            ORDER BY CountryName
-        """)
-        
-        countries = []
-        for row in cursor.fetchall():
-            countries.append({
-                'id': row[0],
-                'name': row[1],
-                'code': row[2] if row[2] else '',  # Handle NULL
-                'isActive': row[3]
-            })
-        
-        conn.close()
-        return jsonify({'success': True, 'countries': countries}), 200
+        return master_list_response('countries')
         
     except Exception as e:
         print(f"❌ Error in get_countries: {str(e)}")
@@ -1619,37 +2218,7 @@ def get_states():
     """Get all states (optionally filtered by country)"""
     try:
         country_id = request.args.get('countryId', type=int)
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        if country_id:
-            cursor.execute("""
-                SELECT StateID, StateName, StateCode, CountryID, IsActive 
-                FROM States 
-                WHERE IsActive = 1 AND CountryID = ?
-                ORDER BY StateName
-            """, (country_id,))
-        else:
-            cursor.execute("""
-                SELECT StateID, StateName, StateCode, CountryID, IsActive 
-                FROM States 
-                WHERE IsActive = 1 
-                ORDER BY StateName
-            """)
-        
-        states = []
-        for row in cursor.fetchall():
-            states.append({
-                'id': row[0],
-                'name': row[1],
-                'code': row[2] if row[2] else '',  # Handle NULL
-                'countryId': row[3],
-                'isActive': row[4]
-            })
-        
-        conn.close()
-        return jsonify({'success': True, 'states': states}), 200
+        return master_list_response('states', 'countryId', country_id or None)
         
     except Exception as e:
         print(f"❌ Error in get_states: {str(e)}")
@@ -1660,36 +2229,7 @@ def get_cities():
     """Get all cities (optionally filtered by state)"""
     try:
         state_id = request.args.get('stateId', type=int)
-        
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        if state_id:
-            cursor.execute("""
-                SELECT CityID, CityName, StateID, IsActive 
-                FROM Cities 
-                WHERE IsActive = 1 AND StateID = ?
-                ORDER BY CityName
-            """, (state_id,))
-        else:
-            cursor.execute("""
-                SELECT CityID, CityName, StateID, IsActive 
-                FROM Cities 
-                WHERE IsActive = 1 
-                ORDER BY CityName
-            """)
-        
-        cities = []
-        for row in cursor.fetchall():
-            cities.append({
-                'id': row[0],
-                'name': row[1],
-                'stateId': row[2],
-                'isActive': row[3]
-            })
-        
-        conn.close()
-        return jsonify({'success': True, 'cities': cities}), 200
+        return master_list_response('cities', 'stateId', state_id or None)
         
     except Exception as e:
         print(f"❌ Error in get_cities: {str(e)}")
@@ -1699,24 +2239,52 @@ def get_cities():
 def get_companies():
     """Get all companies"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
+        return master_list_response('companies')
+        
+    except Exception as e:
+        print(f"❌ Error in get_companies: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+# ============================================================
+# GEO ENDPOINTS
+# ============================================================
+
+@app.route('/api/geo/autocomplete', methods=['GET'])
+def geo_autocomplete():
+    """
+    Countries, states, cities and pincode areas whose name (or any word of
+    it) or pincode starts with ?q=. Optional ?type=country|state|city|pincode
+    and ?limit=.
+    """
+    try:
+        query = request.args.get('q', '').strip()
+        place_type = request.args.get('type') or None
+        if place_type and place_type not in PLACE_TYPES:
+            return jsonify({'success': False, 'error': f"type must be one of: {', '.join(PLACE_TYPES)}"}), 400
+        limit = request.args.get('limit', Config.GEO_AUTOCOMPLETE_DEFAULT_LIMIT, type=int)
+        limit = max(1, min(limit, Config.GEO_AUTOCOMPLETE_MAX_LIMIT))
         
-        cursor.execute("SELECT CompanyID, CompanyName, CreatedAt FROM Companies ORDER BY CompanyName")
+        places = geo_index.sync(master_data.current()).autocomplete(query, limit, place_type) if query else []
+        return jsonify({'success': True, 'query': query, 'places': places}), 200
         
-        companies = []
-        for row in cursor.fetchall():
-            companies.append({
-                'companyId': row[0],
-                'companyName': row[1],
-                'createdAt': row[2].isoformat() if row[2] else None
-            })
+    except Exception as e:
+        print(f"❌ Error in geo_autocomplete: {str(e)}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/geo/pincode/<code>', methods=['GET'])
+def geo_pincode(code):
+    """Area, city, state and country of a pincode"""
+    try:
+        if not code.isdigit():
+            return jsonify({'success': False, 'error': 'Pincode must be numeric'}), 400
         
-        conn.close()
-        return jsonify({'success': True, 'companies': companies}), 200
+        place = geo_index.sync(master_data.current()).pincode(code)
+        if not place:
+            return jsonify({'success': False, 'error': 'Pincode not found'}), 404
+        return jsonify({'success': True, 'place': place}), 200
         
     except Exception as e:
-        print(f"❌ Error in get_companies: {str(e)}")
+        print(f"❌ Error in geo_pincode: {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
 # ============================================================
@@ -1730,22 +2298,31 @@ if __name__ == '__main__':
     print(f"🖥️  Server: {Config.DB_SERVER}")
     print("="*70)
     
-    # Test database connection
+    # Test database connection (and open the pool's minimum connections)
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM Users")
-        user_count = cursor.fetchone()[0]
-        cursor.execute("SELECT COUNT(*) FROM Resumes")
-        resume_count = cursor.fetchone()[0]
-        cursor.execute("SELECT COUNT(*) FROM Jobs")
-        job_count = cursor.fetchone()[0]
-        print("✅ Database connected!")
-        print(f"   Users: {user_count}")
-        print(f"   Resumes: {resume_count}")
-        print(f"   Jobs: {job_count}")
-        cursor.close()
-        conn.close()
+        db_pool.warm_up()
+        ensure_schema_once(get_db_connection, prepare_database)
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            master_cache.load(cursor)
+            skill_normalizer.load(cursor)
+            availability_filter.load(cursor)
+            job_search_index.load(cursor)
+            cursor.close()
+            
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM Users")
+            user_count = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM Resumes")
+            resume_count = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM Jobs")
+            job_count = cursor.fetchone()[0]
+            print("✅ Database connected!")
+            print(f"   Users: {user_count}")
+            print(f"   Resumes: {resume_count}")
+            print(f"   Jobs: {job_count}")
+            cursor.close()
+        geo_index.sync(master_data.current())
     except Exception as e:
         print(f"⚠️  Database warning: {e}")
     
@@ -1754,18 +2331,25 @@ if __name__ == '__main__':
     print("   POST   /api/register")
     print("   POST   /api/login")
     print("   POST   /api/logout")
+    print("   POST   /api/verify")
     print("   POST   /api/check-username")
     print("   POST   /api/check-email")
+    print("   POST   /api/check-availability")
+    print("   (also under /api/auth/* - register, login, logout, verify, check-*, health)")
     print("\n   USER MANAGEMENT:")
     print("   GET    /api/get-all-users")
     print("   GET    /api/get-user/<id>")
     print("\n   ANALYTICS:")
     print("   GET    /api/analytics/overview")
     print("   GET    /api/analytics/timeline")
+    print("   GET    /api/analytics/experience-distribution")
     print("\n   RESUME MANAGEMENT:")
     print("   POST   /api/save-resume")
+    print("   POST   /api/resumes/bulk")
     print("   GET    /api/get-resumes")
     print("   GET    /api/get-resume/<id>")
+    print("   GET    /api/resumes/batch?ids=")
+    print("   POST   /api/resumes/batch")
     print("   POST   /api/increment-view/<id>")
     print("   POST   /api/increment-download/<id>")
     print("   DELETE /api/delete-resume/<id>")
@@ -1773,17 +2357,26 @@ if __name__ == '__main__':
     print("   GET    /api/jobs")
     print("   GET    /api/jobs/<id>")
     print("   POST   /api/jobs")
+    print("   POST   /api/jobs/import")
     print("   PUT    /api/jobs/<id>")
     print("   DELETE /api/jobs/<id>")
     print("   GET    /api/jobs/search")
+    print("\n   MATCHING:")
+    print("   GET    /api/jobs/<id>/candidates")
+    print("   GET    /api/resumes/<id>/job-matches")
     print("\n   MASTER DATA:")
     print("   GET    /api/sectors")
     print("   GET    /api/courses")
     print("   GET    /api/skills")
+    print("   POST   /api/skills/renormalize")
     print("   GET    /api/countries")
     print("   GET    /api/states")
     print("   GET    /api/cities")
     print("   GET    /api/companies")
+    print("   GET    /api/master-data/bootstrap")
+    print("\n   GEO:")
+    print("   GET    /api/geo/autocomplete?q=")
+    print("   GET    /api/geo/pincode/<code>")
     print("\n   UTILITIES:")
     print("   GET    /api/health")
     print("\n" + "="*70)
@@ -0,0 +1,81 @@
+"""
+Benchmark: resume detail fetch, sequential vs single-batch
+Compares p50/p99 latency of the two get_resume_details strategies:
+  - sequential : header + 4 section queries (5 round trips)
+  - batch      : one multi-statement batch read with nextset() (1 round trip)
+Both strategies are checked to return identical resumes.
+
+Run from the backend folder:  python benchmarks/bench_resume_detail.py [iterations] [sample_size]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend import Config, get_db_connection, RESUME_DETAIL_STRATEGIES
+
+
+def percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def sample_resume_ids(cursor, sample_size):
+    cursor.execute("SELECT TOP (?) ResumeID FROM Resumes ORDER BY NEWID()", (sample_size,))
+    return [row[0] for row in cursor.fetchall()]
+
+
+def run(cursor, fetch_detail, resume_ids, iterations):
+    """Return latencies in ms, sorted ascending"""
+    timings = []
+    for _ in range(iterations):
+        for resume_id in resume_ids:
+            start = time.perf_counter()
+            fetch_detail(cursor, resume_id)
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return timings
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    sample_size = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    print("\n" + "="*70)
+    print("⏱️  RESUME DETAIL FETCH BENCHMARK")
+    print("="*70)
+    print(f"🖥️  Server:   {Config.DB_SERVER}")
+    print(f"📊 Database: {Config.DB_NAME}")
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        resume_ids = sample_resume_ids(cursor, sample_size)
+        if not resume_ids:
+            print("⚠️  No resumes in database - nothing to benchmark")
+            return
+
+        # Same response shape from both strategies
+        for resume_id in resume_ids:
+            results = {name: fetch(cursor, resume_id) for name, fetch in RESUME_DETAIL_STRATEGIES.items()}
+            if results['sequential'] != results['batch']:
+                print(f"❌ Strategies disagree for resume {resume_id}")
+                return
+
+        print(f"📄 {len(resume_ids)} resumes x {iterations} iterations per strategy")
+        print("="*70)
+        print(f"{'strategy':<12}{'p50 ms':>10}{'p99 ms':>10}{'mean ms':>10}")
+
+        for name, fetch_detail in RESUME_DETAIL_STRATEGIES.items():
+            run(cursor, fetch_detail, resume_ids[:5], 1)  # warm-up
+            timings = run(cursor, fetch_detail, resume_ids, iterations)
+            print(f"{name:<12}{percentile(timings, 50):>10.2f}{percentile(timings, 99):>10.2f}"
+                  f"{sum(timings) / len(timings):>10.2f}")
+        cursor.close()
+
+    print("="*70 + "\n")
+
+
+if __name__ == '__main__':
+    main()
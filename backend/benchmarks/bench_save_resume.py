@@ -0,0 +1,153 @@
+"""
+Benchmark: save_resume child-table inserts, row-by-row vs batched
+Compares round trips and wall time per resume for:
+  - row-by-row : one cursor.execute INSERT per child row (old behaviour)
+  - batched    : one fast_executemany per child table (insert_resume)
+Every resume is inserted inside a transaction that is rolled back,
+so the benchmark leaves no data behind.
+
+Run from the backend folder:  python benchmarks/bench_save_resume.py [iterations]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend import (
+    Config, get_db_connection, insert_resume,
+    build_resume_child_rows, RESUME_CHILD_INSERTS
+)
+
+
+class CountingCursor:
+    """Cursor wrapper that counts statements sent to the server"""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self.round_trips = 0
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name, value):
+        if name in ('_cursor', 'round_trips'):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._cursor, name, value)
+
+    def execute(self, sql, *params):
+        self.round_trips += 1
+        return self._cursor.execute(sql, *params)
+
+    def executemany(self, sql, rows):
+        # fast_executemany ships the whole parameter array in one batch
+        self.round_trips += 1 if self._cursor.fast_executemany else len(rows)
+        return self._cursor.executemany(sql, rows)
+
+
+def insert_resume_row_by_row(cursor, data):
+    """The pre-batching strategy: one INSERT per child row"""
+    cursor.execute("""
+        INSERT INTO Resumes (ResumeTitle, Status, CreatedDate, UpdatedDate, visitor_count, download_count)
+        OUTPUT INSERTED.ResumeID
+        VALUES (?, 'Active', GETDATE(), GETDATE(), 0, 0)
+    """, (f"{data.get('name', 'Untitled')} - Resume",))
+    resume_id = cursor.fetchone()[0]
+
+    cursor.execute("""
+        INSERT INTO PersonalInformation
+        (ResumeID, FullName, Email, PhoneNumber, DateOfBirth, Location,
+         PhotoPath, LinkedInURL, GitHubURL, CareerObjective, CreatedDate, UpdatedDate)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, GETDATE(), GETDATE())
+    """, (resume_id, data['name'], data['email'], data['phone'], data['dob'],
+          data['location'], '', '', '', data['objective']))
+
+    for table, rows in build_resume_child_rows(resume_id, data).items():
+        for row in rows:
+            cursor.execute(RESUME_CHILD_INSERTS[table], row)
+    return resume_id
+
+
+def sample_resume():
+    """A 'rich' resume: 40+ child rows"""
+    return {
+        'name': 'Benchmark Candidate',
+        'email': 'bench@example.com',
+        'phone': '9876543210',
+        'dob': '1995-01-01',
+        'location': 'Bengaluru',
+        'objective': 'Benchmarking save_resume',
+        'experience': [
+            {'company': f'Company {i}', 'jobRole': 'Engineer',
+             'startDate': f'20{10 + i}-01-01', 'endDate': f'20{11 + i}-06-30'}
+            for i in range(5)
+        ],
+        'education': [
+            {'college': f'College {i}', 'university': 'University', 'course': 'B.Tech',
+             'year': str(2010 + i), 'cgpa': '8.5'}
+            for i in range(3)
+        ],
+        'projects': [
+            {'title': f'Project {i}', 'link': '', 'company': '', 'description': 'x' * 200}
+            for i in range(6)
+        ],
+        'personalSkills': [f'Personal {i}' for i in range(5)],
+        'professionalSkills': [f'Professional {i}' for i in range(5)],
+        'technicalSkills': [f'Technical {i}' for i in range(10)],
+        'certifications': [f'Certification {i}' for i in range(4)],
+        'hobbies': [f'Hobby {i}' for i in range(4)]
+    }
+
+
+def run(strategy, iterations, data):
+    """Return (round_trips_per_resume, avg_ms, p50_ms, max_ms)"""
+    timings = []
+    trips = 0
+    with get_db_connection() as conn:
+        for _ in range(iterations):
+            cursor = CountingCursor(conn.cursor())
+            start = time.perf_counter()
+            if strategy == 'batched':
+                insert_resume(cursor, data)
+            else:
+                insert_resume_row_by_row(cursor, data)
+            timings.append((time.perf_counter() - start) * 1000)
+            trips = cursor.round_trips
+            conn.rollback()
+            cursor.close()
+    timings.sort()
+    return trips, sum(timings) / len(timings), timings[len(timings) // 2], timings[-1]
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    data = sample_resume()
+    child_rows = sum(len(rows) for rows in build_resume_child_rows(0, data).values())
+
+    print("\n" + "="*70)
+    print("⏱️  SAVE_RESUME INSERT BENCHMARK")
+    print("="*70)
+    print(f"🖥️  Server:     {Config.DB_SERVER}")
+    print(f"📊 Database:   {Config.DB_NAME}")
+    print(f"📄 Child rows: {child_rows} per resume, {iterations} iterations")
+    print("="*70)
+    print(f"{'strategy':<12}{'round trips':>12}{'avg ms':>10}{'p50 ms':>10}{'max ms':>10}")
+
+    results = {}
+    for strategy in ('row-by-row', 'batched'):
+        results[strategy] = run(strategy, iterations, data)
+        trips, avg, p50, worst = results[strategy]
+        print(f"{strategy:<12}{trips:>12}{avg:>10.2f}{p50:>10.2f}{worst:>10.2f}")
+
+    before, after = results['row-by-row'], results['batched']
+    print("="*70)
+    print(f"✅ Round trips: {before[0]} → {after[0]}   "
+          f"Avg time: {before[1]:.2f} ms → {after[1]:.2f} ms "
+          f"({before[1] / after[1]:.1f}x)")
+    print("="*70 + "\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,113 @@
+"""
+In-process caching helpers for the Resume Builder & Job Portal backend
+- TTLCache: thread-safe key/value cache with per-entry time-to-live
+- Optional stale-while-revalidate: expired entries are still served for
+  `stale_ttl` seconds while one background thread recomputes them
+"""
+
+import threading
+import time
+
+
+class TTLCache:
+    """Thread-safe in-memory cache whose entries expire after `ttl` seconds"""
+
+    _MISSING = object()
+
+    def __init__(self, ttl=60, max_entries=256, stale_ttl=0):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries = {}       # key -> (value, expires_at)
+        self._refreshing = set()
+        self._generation = 0     # bumped by invalidate() so late refreshes are dropped
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the cached value, or `default` if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                if time.monotonic() >= expires_at + self.stale_ttl:
+                    del self._entries[key]
+                return default
+            return value
+
+    def set(self, key, value, ttl=None):
+        with self._lock:
+            self._set_locked(key, value, ttl)
+
+    def get_or_set(self, key, compute, ttl=None):
+        """Return the cached value, computing and storing it on a miss"""
+        value = self.get(key, self._MISSING)
+        if value is self._MISSING:
+            value = compute()
+            self.set(key, value, ttl)
+        return value
+
+    def get_or_refresh(self, key, compute, ttl=None):
+        """
+        Stale-while-revalidate lookup. Fresh entries are returned directly;
+        entries expired less than `stale_ttl` ago are returned while a
+        background thread recomputes them; anything older is computed inline.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            now = time.monotonic()
+            if entry is not None:
+                value, expires_at = entry
+                if now < expires_at:
+                    return value
+                if now < expires_at + self.stale_ttl:
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        threading.Thread(
+                            target=self._refresh, args=(key, compute, ttl, self._generation),
+                            name='cache-refresh', daemon=True
+                        ).start()
+                    return value
+            generation = self._generation
+
+        value = compute()
+        with self._lock:
+            if generation == self._generation:
+                self._set_locked(key, value, ttl)
+        return value
+
+    def invalidate(self, key=None):
+        """Drop one key, or everything when key is None"""
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def _refresh(self, key, compute, ttl, generation):
+        try:
+            value = compute()
+            with self._lock:
+                if generation == self._generation:
+                    self._set_locked(key, value, ttl)
+        except Exception as e:
+            print(f"⚠️  Background cache refresh failed for {key!r}: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _set_locked(self, key, value, ttl):
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            self._evict()
+        self._entries[key] = (value, time.monotonic() + (self.ttl if ttl is None else ttl))
+
+    def _evict(self):
+        # Drop dead entries first, then the entry closest to expiry
+        now = time.monotonic()
+        for key in [k for k, (_, exp) in self._entries.items() if exp + self.stale_ttl <= now]:
+            del self._entries[key]
+        if len(self._entries) >= self.max_entries:
+            oldest = min(self._entries, key=lambda k: self._entries[k][1])
+            del self._entries[oldest]
@@ -0,0 +1,196 @@
+"""
+Write-behind counters for resume views and downloads
+- Increments are acknowledged immediately and coalesced per ResumeID
+- A background thread flushes them to Resumes.visitor_count/download_count
+  in batched UPDATEs, on an interval or once enough resumes are pending
+- Pending deltas can be read back so API responses stay accurate
+- Hooks run inside the flush transaction and after it commits
+"""
+
+import threading
+from collections import OrderedDict
+
+# 3 parameters per row, SQL Server allows 2100 per statement
+FLUSH_ROWS_PER_STATEMENT = 600
+
+
+class CounterBuffer:
+    """Coalescing, periodically flushed buffer of (views, downloads) deltas"""
+
+    def __init__(self, get_connection, flush_interval=5.0, max_pending=500,
+                 max_known=10000, on_flush=None, before_commit=None):
+        self._get_connection = get_connection
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.max_known = max_known
+        self._on_flush = on_flush            # (views, downloads) flushed - after commit
+        self._before_commit = before_commit  # (cursor, views, downloads) - inside the flush transaction
+
+        self._pending = {}               # resume_id -> [views, downloads] not yet flushed
+        self._inflight = {}              # deltas currently being written
+        self._known = OrderedDict()      # resume_id -> [views, downloads] last persisted
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread = None
+
+    # ---------- recording ----------
+
+    def increment(self, resume_id, views=0, downloads=0, observed=None):
+        """
+        Buffer an increment. Returns the resume's (views, downloads) totals
+        including pending deltas, or None if its persisted counts are unknown.
+        `observed` is (views, downloads) just read from the database; it is
+        recorded under the same lock, so the totals can't be evicted in between.
+        """
+        self._ensure_started()
+        with self._lock:
+            if observed is not None and resume_id not in self._known:
+                self._remember_locked(resume_id, *observed)
+            delta = self._pending.setdefault(resume_id, [0, 0])
+            delta[0] += views
+            delta[1] += downloads
+            if len(self._pending) >= self.max_pending:
+                self._wake.set()
+            return self._totals_locked(resume_id)
+
+    def is_known(self, resume_id):
+        with self._lock:
+            return resume_id in self._known
+
+    # ---------- reading ----------
+
+    def pending(self, resume_id):
+        """(views, downloads) accepted but not yet persisted for one resume"""
+        with self._lock:
+            return self._pending_locked(resume_id)
+
+    def pending_totals(self):
+        """(views, downloads) accepted but not yet persisted across all resumes"""
+        with self._lock:
+            views = downloads = 0
+            for source in (self._inflight, self._pending):
+                for v, d in source.values():
+                    views += v
+                    downloads += d
+            return views, downloads
+
+    def discard(self, resume_id):
+        """Forget a resume (e.g. after it was deleted)"""
+        with self._lock:
+            self._pending.pop(resume_id, None)
+            self._known.pop(resume_id, None)
+
+    # ---------- flushing ----------
+
+    def flush(self):
+        """Write every pending delta to the database; returns rows updated"""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                self._inflight, self._pending = self._pending, {}
+                batch = list(self._inflight.items())
+
+            try:
+                persisted = self._write(batch)
+            except Exception as e:
+                # Put the deltas back so the next flush retries them
+                with self._lock:
+                    for resume_id, (v, d) in self._inflight.items():
+                        delta = self._pending.setdefault(resume_id, [0, 0])
+                        delta[0] += v
+                        delta[1] += d
+                    self._inflight = {}
+                print(f"⚠️  Counter flush failed, will retry: {e}")
+                return 0
+
+            with self._lock:
+                for resume_id, views, downloads in persisted:
+                    self._remember_locked(resume_id, views, downloads)
+                self._inflight = {}
+
+            if self._on_flush:
+                self._on_flush(sum(v for _, (v, _) in batch), sum(d for _, (_, d) in batch))
+            return len(persisted)
+
+    def stop(self):
+        """Stop the flusher thread and write out everything still pending"""
+        self._stopping = True
+        self._wake.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=self.flush_interval + 5)
+        self.flush()
+
+    # ---------- internals ----------
+
+    def _write(self, batch):
+        """Apply deltas with one UPDATE ... FROM (VALUES ...) per chunk"""
+        persisted = []
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for i in range(0, len(batch), FLUSH_ROWS_PER_STATEMENT):
+                chunk = batch[i:i + FLUSH_ROWS_PER_STATEMENT]
+                values = ', '.join('(?, ?, ?)' for _ in chunk)
+                params = [p for resume_id, (v, d) in chunk for p in (resume_id, v, d)]
+                cursor.execute(f"""
+                    UPDATE r
+                    SET visitor_count = ISNULL(r.visitor_count, 0) + d.Views,
+                        download_count = ISNULL(r.download_count, 0) + d.Downloads,
+                        UpdatedDate = GETDATE()
+                    OUTPUT INSERTED.ResumeID,
+                           ISNULL(INSERTED.visitor_count, 0),
+                           ISNULL(INSERTED.download_count, 0)
+                    FROM Resumes r
+                    INNER JOIN (VALUES {values}) AS d(ResumeID, Views, Downloads)
+                        ON r.ResumeID = d.ResumeID
+                """, params)
+                persisted.extend(tuple(row) for row in cursor.fetchall())
+
+            if self._before_commit:
+                found = {row[0] for row in persisted}
+                self._before_commit(
+                    cursor,
+                    sum(v for resume_id, (v, _) in batch if resume_id in found),
+                    sum(d for resume_id, (_, d) in batch if resume_id in found)
+                )
+            conn.commit()
+            cursor.close()
+        return persisted
+
+    def _run(self):
+        while not self._stopping:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if not self._stopping:
+                self.flush()
+
+    def _ensure_started(self):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name='counter-flusher', daemon=True)
+                    self._thread.start()
+
+    def _pending_locked(self, resume_id):
+        views = downloads = 0
+        for source in (self._inflight, self._pending):
+            if resume_id in source:
+                views += source[resume_id][0]
+                downloads += source[resume_id][1]
+        return views, downloads
+
+    def _totals_locked(self, resume_id):
+        base = self._known.get(resume_id)
+        if base is None:
+            return None
+        self._known.move_to_end(resume_id)
+        views, downloads = self._pending_locked(resume_id)
+        return base[0] + views, base[1] + downloads
+
+    def _remember_locked(self, resume_id, views, downloads):
+        self._known[resume_id] = [int(views), int(downloads)]
+        self._known.move_to_end(resume_id)
+        while len(self._known) > self.max_known:
+            self._known.popitem(last=False)
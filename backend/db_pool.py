@@ -0,0 +1,226 @@
+"""
+Database connection pool for the Resume Builder & Job Portal backend
+- Bounded pool (min/max size) of pyodbc connections
+- Checkout timeout when every connection is busy
+- Health check on borrow for connections that sat idle
+- Max lifetime recycling so long-lived connections are refreshed
+"""
+
+import threading
+import time
+from collections import deque
+
+import pyodbc
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection could be checked out within the timeout"""
+
+
+class PooledConnection:
+    """
+    Wrapper around a pyodbc connection checked out from a ConnectionPool.
+    close() hands the connection back to the pool instead of closing it, so
+    existing `conn.close()` call sites keep working. Use it as a context
+    manager to guarantee the connection is returned on every code path:
+
+        with get_db_connection() as conn:
+            cursor = conn.cursor()
+            ...
+    """
+
+    def __init__(self, pool, raw_conn, created_at):
+        self._pool = pool
+        self._conn = raw_conn
+        self._created_at = created_at
+
+    def __getattr__(self, name):
+        if self._conn is None:
+            raise pyodbc.ProgrammingError("Connection has been returned to the pool")
+        return getattr(self._conn, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    @property
+    def closed(self):
+        return self._conn is None
+
+    def close(self):
+        """Return the connection to the pool (idempotent)"""
+        if self._conn is None:
+            return
+        raw_conn, self._conn = self._conn, None
+        self._pool._release(raw_conn, self._created_at)
+
+    def invalidate(self):
+        """Discard the underlying connection instead of reusing it"""
+        if self._conn is None:
+            return
+        raw_conn, self._conn = self._conn, None
+        self._pool._discard(raw_conn)
+
+
+class ConnectionPool:
+    """Thread-safe bounded pool of pyodbc connections"""
+
+    def __init__(self, connection_string, min_size=2, max_size=10,
+                 checkout_timeout=10.0, max_lifetime=1800.0,
+                 health_check_after=30.0, connect_timeout=5):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+
+        # connection_string may be a str or a callable returning one, so that
+        # Config changes made after the pool is created are still honoured
+        self._connection_string = connection_string
+        self.min_size = min_size
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_after = health_check_after
+        self.connect_timeout = connect_timeout
+
+        self._idle = deque()      # (raw_conn, created_at, returned_at)
+        self._size = 0            # idle + checked out
+        self._closed = False
+        self._cond = threading.Condition(threading.Lock())
+
+    # ---------- public API ----------
+
+    def connection(self, timeout=None):
+        """Check out a connection, waiting up to `timeout` seconds"""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+
+        while True:
+            raw_conn, created_at, returned_at = self._acquire_slot(deadline)
+
+            if raw_conn is None:
+                # We reserved a slot for a brand new connection
+                try:
+                    raw_conn = self._connect()
+                except Exception:
+                    self._free_slot()
+                    raise
+                return PooledConnection(self, raw_conn, time.monotonic())
+
+            if self._is_expired(created_at) or not self._is_healthy(raw_conn, returned_at):
+                self._discard(raw_conn)
+                continue
+
+            return PooledConnection(self, raw_conn, created_at)
+
+    def warm_up(self):
+        """Open connections until min_size are available"""
+        while True:
+            with self._cond:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                raw_conn = self._connect()
+            except Exception:
+                self._free_slot()
+                raise
+            now = time.monotonic()
+            with self._cond:
+                self._idle.append((raw_conn, now, now))
+                self._cond.notify()
+
+    def close_all(self):
+        """Close every idle connection and refuse further checkouts"""
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for raw_conn, _, _ in idle:
+            self._close_quietly(raw_conn)
+
+    def stats(self):
+        """Snapshot of pool usage"""
+        with self._cond:
+            return {
+                'size': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'max_size': self.max_size
+            }
+
+    # ---------- internals ----------
+
+    def _connect(self):
+        conn_string = self._connection_string
+        if callable(conn_string):
+            conn_string = conn_string()
+        return pyodbc.connect(conn_string, timeout=self.connect_timeout)
+
+    def _acquire_slot(self, deadline):
+        """Pop an idle connection, or reserve room for a new one"""
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolTimeoutError("Connection pool is closed")
+                if self._idle:
+                    # LIFO keeps the warmest connections in use
+                    return self._idle.pop()
+                if self._size < self.max_size:
+                    self._size += 1
+                    return None, None, None
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeoutError(
+                        f"Timed out after {self.checkout_timeout}s waiting for a database connection"
+                    )
+                self._cond.wait(remaining)
+
+    def _free_slot(self):
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    def _is_expired(self, created_at):
+        return self.max_lifetime and time.monotonic() - created_at > self.max_lifetime
+
+    def _is_healthy(self, raw_conn, returned_at):
+        if time.monotonic() - returned_at < self.health_check_after:
+            return True
+        try:
+            cursor = raw_conn.cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+            return True
+        except pyodbc.Error:
+            return False
+
+    def _release(self, raw_conn, created_at):
+        # Never hand an open transaction to the next borrower
+        try:
+            raw_conn.rollback()
+        except pyodbc.Error:
+            self._discard(raw_conn)
+            return
+
+        with self._cond:
+            if not self._closed and not self._is_expired(created_at):
+                self._idle.append((raw_conn, created_at, time.monotonic()))
+                self._cond.notify()
+                return
+        self._discard(raw_conn)
+
+    def _discard(self, raw_conn):
+        self._close_quietly(raw_conn)
+        self._free_slot()
+
+    @staticmethod
+    def _close_quietly(raw_conn):
+        try:
+            raw_conn.close()
+        except pyodbc.Error:
+            pass
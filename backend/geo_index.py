@@ -0,0 +1,191 @@
+"""
+In-memory geo index for location lookups
+- country -> state -> city tree built from the master data snapshot
+  (Countries/States/Cities) plus the userform/data JSON seed files
+- pincode -> (area, city, state, country) hash from pincodes.json
+- prefix trie over place names and pincodes for autocomplete; every trie
+  node keeps its best matches overall and per place type, so a lookup
+  (filtered or not) is one walk down the query
+- Rebuilt only when the master data snapshot version changes
+"""
+
+import json
+import os
+import threading
+
+from master_cache import name_key
+
+# Matches kept per trie node (overall and per place type); autocomplete
+# limits are capped to this
+NODE_MATCH_LIMIT = 50
+
+# Autocomplete ranks countries, then states, then cities, then pincode areas
+PLACE_TYPES = ('country', 'state', 'city', 'pincode')
+
+
+def read_seed(seed_dir, filename):
+    """Rows of one JSON seed file, or [] if it is missing"""
+    path = os.path.join(seed_dir, filename)
+    if not os.path.exists(path):
+        print(f"⚠️  Geo seed file not found: {path}")
+        return []
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+class GeoIndex:
+    """Country/state/city tree, pincode hash and autocomplete trie"""
+
+    def __init__(self, seed_dir, seed_country='India'):
+        self.seed_dir = seed_dir
+        self.seed_country = seed_country
+        self.version = None
+        self._seeds = None
+        # (pincodes, trie) - replaced as a whole on rebuild; a trie node is
+        # [children, matches, {place type: matches}]
+        self._data = ({}, [{}, [], {}])
+        self._lock = threading.Lock()
+
+    def sync(self, snapshot):
+        """Rebuild from a MasterDataSnapshot if its version moved on; returns self"""
+        if snapshot.version != self.version:
+            with self._lock:
+                if snapshot.version != self.version:
+                    self._build(snapshot.lists, snapshot.version)
+        return self
+
+    def pincode(self, code):
+        """{'pincode', 'area', 'city', 'state', 'country', ...} or None"""
+        return self._data[0].get(code.strip())
+
+    def autocomplete(self, query, limit=10, place_type=None):
+        """Places whose name (or any word of it) or pincode starts with `query`"""
+        node = self._data[1]
+        for char in name_key(query):
+            node = node[0].get(char)
+            if node is None:
+                return []
+        matches = node[2].get(place_type, []) if place_type else node[1]
+        return matches[:limit]
+
+    def _build(self, lists, version):
+        if self._seeds is None:
+            self._seeds = {name: read_seed(self.seed_dir, f'{name}.json')
+                           for name in ('states', 'cities', 'pincodes')}
+        seeds = self._seeds
+
+        # ---------- tree ----------
+        countries, states_by_id = {}, {}
+        country_by_name, state_by_code, state_by_name, city_by_name = {}, {}, {}, {}
+
+        def add_country(country_id, name, code):
+            node = {'id': country_id, 'name': name, 'code': code, 'states': {}}
+            countries[country_id if country_id is not None else ('seed', name_key(name))] = node
+            country_by_name.setdefault(name_key(name), node)
+            return node
+
+        def add_state(country, state_id, name, code):
+            node = {'id': state_id, 'name': name, 'code': code, 'country': country, 'cities': {}}
+            country['states'][state_id if state_id is not None else ('seed', name_key(name))] = node
+            if code:
+                state_by_code.setdefault((id(country), code.upper()), node)
+            state_by_name.setdefault((id(country), name_key(name)), node)
+            return node
+
+        def add_city(state, city_id, name):
+            node = {'id': city_id, 'name': name, 'state': state}
+            state['cities'][city_id if city_id is not None else ('seed', name_key(name))] = node
+            city_by_name.setdefault(name_key(name), node)
+            return node
+
+        for c in lists.get('countries', []):
+            add_country(c['id'], c['name'], c['code'])
+        for s in lists.get('states', []):
+            country = countries.get(s['countryId'])
+            if country:
+                states_by_id[s['id']] = add_state(country, s['id'], s['name'], s['code'])
+        for c in lists.get('cities', []):
+            state = states_by_id.get(c['stateId'])
+            if state:
+                add_city(state, c['id'], c['name'])
+
+        # Seed files only cover the seed country; rows already in the DB win
+        seed_country = country_by_name.get(name_key(self.seed_country)) or \
+            add_country(None, self.seed_country, '')
+        seed_key = id(seed_country)
+        for s in seeds['states']:
+            if not state_by_code.get((seed_key, s['code'].upper())) and \
+                    not state_by_name.get((seed_key, name_key(s['name']))):
+                add_state(seed_country, None, s['name'], s['code'])
+        # Seed cities only carry a state code; DB states without a code are
+        # matched on the seed state's name instead
+        seed_state_names = {s['code'].upper(): name_key(s['name']) for s in seeds['states']}
+        for c in seeds['cities']:
+            code = c['stateCode'].upper()
+            state = state_by_code.get((seed_key, code)) or \
+                state_by_name.get((seed_key, seed_state_names.get(code)))
+            if state and name_key(c['capital']) not in city_by_name:
+                add_city(state, None, c['capital'])
+
+        # ---------- pincodes ----------
+        pincodes = {}
+        for p in seeds['pincodes']:
+            city = city_by_name.get(name_key(p['city']))
+            state = city['state'] if city else None
+            pincodes[str(p['pincode'])] = {
+                'type': 'pincode',
+                'pincode': str(p['pincode']),
+                'area': p['area'],
+                'city': city['name'] if city else p['city'],
+                'cityId': city['id'] if city else None,
+                'state': state['name'] if state else None,
+                'stateId': state['id'] if state else None,
+                'country': state['country']['name'] if state else None,
+                'countryId': state['country']['id'] if state else None
+            }
+
+        # ---------- trie ----------
+        trie = [{}, [], {}]
+
+        def keep(matches, match):
+            if len(matches) < NODE_MATCH_LIMIT and (not matches or matches[-1] is not match):
+                matches.append(match)
+
+        def insert(key, match):
+            node = trie
+            for char in key:
+                node = node[0].setdefault(char, [{}, [], {}])
+                keep(node[1], match)
+                keep(node[2].setdefault(match['type'], []), match)
+
+        def insert_name(name, match):
+            words = name_key(name).split(' ')
+            for i in range(len(words)):
+                insert(' '.join(words[i:]), match)
+
+        # Inserted in rank order so each node's matches are already ranked
+        ordered = lambda nodes: sorted(nodes, key=lambda n: n['name'])
+        all_states = [s for c in countries.values() for s in c['states'].values()]
+        all_cities = [c for s in all_states for c in s['cities'].values()]
+        for c in ordered(countries.values()):
+            insert_name(c['name'], {'type': 'country', 'id': c['id'], 'name': c['name'], 'code': c['code']})
+        for s in ordered(all_states):
+            insert_name(s['name'], {
+                'type': 'state', 'id': s['id'], 'name': s['name'], 'code': s['code'],
+                'country': s['country']['name'], 'countryId': s['country']['id']
+            })
+        for c in ordered(all_cities):
+            insert_name(c['name'], {
+                'type': 'city', 'id': c['id'], 'name': c['name'],
+                'state': c['state']['name'], 'stateId': c['state']['id'],
+                'country': c['state']['country']['name'], 'countryId': c['state']['country']['id']
+            })
+        for code in sorted(pincodes):
+            match = dict(pincodes[code], name=f"{pincodes[code]['area']} ({code})")
+            insert(code, match)
+            insert_name(match['area'], match)
+
+        self._data = (pincodes, trie)
+        self.version = version
+        print(f"🗺️  Geo index built: {len(countries)} countries, {len(all_states)} states, "
+              f"{len(all_cities)} cities, {len(pincodes)} pincodes")
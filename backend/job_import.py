@@ -0,0 +1,310 @@
+"""
+Bulk job import from CSV or NDJSON feeds
+- Each record carries the same fields POST /api/jobs reads (title, company,
+  sector, course, city/state/country, skills, package, deadline, ...)
+- Per chunk, master data and skills are resolved set-based, jobs go through
+  a #JobImport staging table (fast_executemany) into one MERGE that returns
+  RowNum -> JobID, and JobSkills are written with fast_executemany
+- A chunk that fails is retried record by record so every error is reported
+  against its own line
+
+Run this file directly to import a feed file:
+
+    python job_import.py jobs.csv [chunk_size]
+    python job_import.py jobs.ndjson [chunk_size]
+"""
+
+import csv
+import json
+import re
+from datetime import date
+
+REQUIRED_FIELDS = ('title', 'company', 'sector', 'course')
+SKILL_SEPARATOR_RE = re.compile(r'[,;|]')
+
+STAGING_TABLE_SQL = """
+    CREATE TABLE #JobImport (
+        RowNum INT NOT NULL PRIMARY KEY,
+        CompanyID INT NOT NULL,
+        JobTitle NVARCHAR(4000),
+        JobDescription NVARCHAR(MAX),
+        EducationRequirement NVARCHAR(4000),
+        ExperienceYears FLOAT,
+        JobType NVARCHAR(4000),
+        SalaryPackage NVARCHAR(4000),
+        JobLocation NVARCHAR(4000),
+        ApplicationDeadline DATE,
+        Benefits NVARCHAR(MAX),
+        ContactEmail NVARCHAR(4000),
+        SectorID INT,
+        CourseID INT,
+        CityID INT
+    )
+"""
+
+STAGING_INSERT_SQL = """
+    INSERT INTO #JobImport (
+        RowNum, CompanyID, JobTitle, JobDescription, EducationRequirement,
+        ExperienceYears, JobType, SalaryPackage, JobLocation, ApplicationDeadline,
+        Benefits, ContactEmail, SectorID, CourseID, CityID
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# ON 1 = 0 makes every staging row an insert; OUTPUT maps RowNum -> JobID
+MERGE_JOBS_SQL = """
+    MERGE Jobs AS t
+    USING #JobImport AS s ON 1 = 0
+    WHEN NOT MATCHED THEN INSERT (
+        CompanyID, JobTitle, JobDescription, EducationRequirement,
+        ExperienceYears, JobType, SalaryPackage, JobLocation,
+        ApplicationDeadline, Benefits, ContactEmail, JobStatus, PostedDate,
+        SectorID, CourseID, CityID
+    ) VALUES (
+        s.CompanyID, s.JobTitle, s.JobDescription, s.EducationRequirement,
+        s.ExperienceYears, s.JobType, s.SalaryPackage, s.JobLocation,
+        s.ApplicationDeadline, s.Benefits, s.ContactEmail, 'Open', GETDATE(),
+        s.SectorID, s.CourseID, s.CityID
+    )
+    OUTPUT s.RowNum, INSERTED.JobID;
+"""
+
+
+# ---------- parsing ----------
+
+def read_records(lines, fmt):
+    """
+    Yield (line_no, record, error) for every record of a CSV or NDJSON feed.
+    `lines` may yield bytes or str; CSV needs a header row with field names.
+    """
+    lines = (line.decode('utf-8-sig') if isinstance(line, bytes) else line for line in lines)
+
+    if fmt == 'csv':
+        reader = csv.DictReader(lines)
+        for row in reader:
+            record = {(k or '').strip(): v for k, v in row.items() if k}
+            if any((v or '').strip() for v in record.values()):
+                yield reader.line_num, record, None
+        return
+
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield line_no, None, f'Invalid JSON: {e}'
+            continue
+        if not isinstance(record, dict):
+            yield line_no, None, 'Each line must be a JSON object'
+            continue
+        yield line_no, record, None
+
+
+def job_from_record(data):
+    """Normalize one feed record the way create_job reads its payload - raises ValueError"""
+    def text(key):
+        return str(data.get(key) or '').strip()
+
+    job = {key: text(key) for key in (
+        'title', 'company', 'sector', 'jobType', 'description', 'course',
+        'country', 'state', 'city', 'package', 'email', 'benefits'
+    )}
+
+    missing = [key for key in REQUIRED_FIELDS if not job[key]]
+    if missing:
+        raise ValueError(f"Missing required fields: {', '.join(missing)}")
+
+    try:
+        job['experience'] = float(data.get('experience') or 0)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid experience: {data.get('experience')!r}")
+
+    deadline = text('deadline')
+    if deadline:
+        try:
+            date.fromisoformat(deadline[:10])
+        except ValueError:
+            raise ValueError(f"Invalid deadline (expected YYYY-MM-DD): {deadline!r}")
+    job['deadline'] = deadline[:10] or None
+
+    skills = data.get('skills') or []
+    if isinstance(skills, str):
+        skills = SKILL_SEPARATOR_RE.split(skills)
+    job['skills'] = [str(s) for s in skills]
+
+    job['location'] = ', '.join(part for part in (job['city'], job['state'], job['country']) if part)
+    return job
+
+
+# ---------- writing ----------
+
+def insert_job_batch(cursor, jobs, masters, normalizer):
+    """
+    Insert parsed jobs with set-based master data resolution (caller commits).
+    Fills in each job's resolved IDs ('jobId', 'companyId', 'sectorId',
+    'courseId', 'cityId', 'skillPairs') and returns the new skills to
+    publish to `normalizer` after commit.
+    """
+    masters.get_or_create_many(cursor, 'company', [(j['company'], None) for j in jobs])
+    masters.get_or_create_many(cursor, 'sector', [(j['sector'], None) for j in jobs])
+    masters.get_or_create_many(cursor, 'course', [(j['course'], None) for j in jobs])
+
+    for j in jobs:
+        j['countryId'] = j['stateId'] = None
+    located = [j for j in jobs if j['city'] and j['state'] and j['country']]
+    masters.get_or_create_many(cursor, 'country', [(j['country'], None) for j in located])
+    for j in located:
+        j['countryId'] = masters.lookup('country', j['country'])
+    masters.get_or_create_many(cursor, 'state', [(j['state'], j['countryId']) for j in located])
+    for j in located:
+        j['stateId'] = masters.lookup('state', j['state'], j['countryId'])
+    masters.get_or_create_many(cursor, 'city', [(j['city'], j['stateId']) for j in located])
+
+    all_skills = []
+    for j in jobs:
+        j['companyId'] = masters.lookup('company', j['company'])
+        j['sectorId'] = masters.lookup('sector', j['sector'])
+        j['courseId'] = masters.lookup('course', j['course'])
+        j['cityId'] = masters.lookup('city', j['city'], j['stateId']) if j['stateId'] else None
+        j['skillNames'] = normalizer.canonical_list(j['skills'])
+        all_skills.extend(j['skillNames'])
+    skill_ids, new_skills = normalizer.master_skill_ids(cursor, list(dict.fromkeys(all_skills)))
+
+    cursor.execute("IF OBJECT_ID('tempdb..#JobImport') IS NOT NULL DROP TABLE #JobImport")
+    cursor.execute(STAGING_TABLE_SQL)
+    cursor.fast_executemany = True
+    try:
+        cursor.executemany(STAGING_INSERT_SQL, [
+            (
+                row_num, j['companyId'], j['title'], j['description'], j['course'],
+                j['experience'], j['jobType'], j['package'], j['location'], j['deadline'],
+                j['benefits'], j['email'], j['sectorId'], j['courseId'], j['cityId']
+            )
+            for row_num, j in enumerate(jobs)
+        ])
+
+        cursor.execute(MERGE_JOBS_SQL)
+        for row_num, job_id in cursor.fetchall():
+            jobs[row_num]['jobId'] = job_id
+
+        links = []
+        for j in jobs:
+            j['skillPairs'] = [(skill_ids[name], name) for name in j['skillNames']]
+            links.extend((j['jobId'], skill_id) for skill_id, _ in j['skillPairs'])
+        if links:
+            cursor.executemany("INSERT INTO JobSkills (JobID, SkillID) VALUES (?, ?)", links)
+    finally:
+        cursor.fast_executemany = False
+    cursor.execute("DROP TABLE #JobImport")
+    return new_skills
+
+
+def import_jobs(get_connection, records, master_cache, normalizer, chunk_size=500,
+                before_commit=None, after_commit=None):
+    """
+    Import (line_no, record, error) tuples from read_records() in chunks.
+    Yields {'line', 'success', 'jobId' | 'error'} per record, then
+    {'summary': {'imported', 'failed'}}.
+    before_commit(cursor, jobs) runs inside each chunk's transaction and
+    after_commit(jobs) once it is committed.
+    """
+    totals = {'imported': 0, 'failed': 0}
+
+    def write(conn, cursor, pending):
+        """Insert and commit one batch; returns what publish() needs"""
+        masters = master_cache.session()
+        jobs = [job for _, job in pending]
+        new_skills = insert_job_batch(cursor, jobs, masters, normalizer)
+        if before_commit:
+            before_commit(cursor, jobs)
+        conn.commit()
+        return masters, new_skills, jobs
+
+    def publish(masters, new_skills, jobs):
+        """
+        Post-commit cache/index updates. The rows are already committed, so
+        a failure here is logged and never causes a retry (that would insert
+        them twice).
+        """
+        try:
+            masters.publish()
+            normalizer.publish(new_skills)
+            if after_commit:
+                after_commit(jobs)
+        except Exception as e:
+            print(f"   ⚠️  Job import post-commit update failed: {e}")
+
+    def flush(conn, cursor, pending):
+        """Commit one chunk; on failure retry its records one by one"""
+        try:
+            committed = write(conn, cursor, pending)
+        except Exception as e:
+            conn.rollback()
+            print(f"   ⚠️  Job import chunk failed ({e}), retrying {len(pending)} records individually")
+        else:
+            publish(*committed)
+            totals['imported'] += len(pending)
+            for line_no, job in pending:
+                yield {'line': line_no, 'success': True, 'jobId': job['jobId']}
+            return
+
+        for line_no, job in pending:
+            try:
+                committed = write(conn, cursor, [(line_no, job)])
+            except Exception as e:
+                conn.rollback()
+                totals['failed'] += 1
+                yield {'line': line_no, 'success': False, 'error': str(e)}
+                continue
+            publish(*committed)
+            totals['imported'] += 1
+            yield {'line': line_no, 'success': True, 'jobId': job['jobId']}
+
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        master_cache.ensure_loaded(cursor)
+        normalizer.ensure_loaded(cursor)
+
+        pending = []
+        for line_no, record, error in records:
+            if error is None:
+                try:
+                    pending.append((line_no, job_from_record(record)))
+                except ValueError as e:
+                    error = str(e)
+            if error is not None:
+                totals['failed'] += 1
+                yield {'line': line_no, 'success': False, 'error': error}
+                continue
+
+            if len(pending) >= chunk_size:
+                yield from flush(conn, cursor, pending)
+                pending = []
+
+        if pending:
+            yield from flush(conn, cursor, pending)
+        cursor.close()
+
+    print(f"📦 Job import finished: {totals['imported']} imported, {totals['failed']} failed")
+    yield {'summary': totals}
+
+
+if __name__ == '__main__':
+    import sys
+    from backend import (Config, get_db_connection, master_cache, skill_normalizer,
+                         record_imported_jobs, publish_imported_jobs, finish_job_import)
+
+    path = sys.argv[1]
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else Config.JOB_IMPORT_CHUNK_SIZE
+    fmt = 'csv' if path.lower().endswith('.csv') else 'ndjson'
+
+    with open(path, encoding='utf-8-sig', newline='') as feed:
+        for result in import_jobs(get_db_connection, read_records(feed, fmt), master_cache,
+                                  skill_normalizer, chunk_size, record_imported_jobs,
+                                  publish_imported_jobs):
+            if 'summary' in result:
+                finish_job_import(result['summary'])
+                print(f"✅ {result['summary']}")
+            elif not result['success']:
+                print(f"❌ Line {result['line']}: {result['error']}")
@@ -0,0 +1,163 @@
+"""
+Write-through name -> ID cache for the job master tables
+(Companies, Sectors, Courses, Countries, States, Cities)
+- Warmed from the database at startup, so the common case needs no query
+- Misses are resolved with one MERGE ... WITH (HOLDLOCK) per name, which
+  returns the existing row or creates it without racing other writers
+- IDs created inside a transaction are only published to the cache once
+  the caller has committed (see MasterDataSession.publish)
+"""
+
+import threading
+
+# Source rows of one MERGE carry 1-2 parameters each; SQL Server allows 2100
+MERGE_PARAMS_PER_STATEMENT = 2000
+
+# kind -> (table, id column, name column, parent id column, extra insert columns)
+MASTER_TABLES = {
+    'company': ('Companies', 'CompanyID', 'CompanyName', None, ''),
+    'sector': ('Sectors', 'SectorID', 'SectorName', None, 'IsActive'),
+    'course': ('Courses', 'CourseID', 'CourseName', None, 'IsActive'),
+    'country': ('Countries', 'CountryID', 'CountryName', None, 'IsActive'),
+    'state': ('States', 'StateID', 'StateName', 'CountryID', 'IsActive'),
+    'city': ('Cities', 'CityID', 'CityName', 'StateID', 'IsActive')
+}
+
+
+def name_key(name):
+    """Match SQL Server's case-insensitive, trailing-space-insensitive comparison"""
+    return ' '.join((name or '').split()).casefold()
+
+
+def merge_sql(kind, rows=1):
+    """MERGE returning the ID of every (name[, parent]) source row, existing or new"""
+    table, id_col, name_col, parent_col, extra_col = MASTER_TABLES[kind]
+    source_cols = f"{name_col}, {parent_col}" if parent_col else name_col
+    placeholders = '(?, ?)' if parent_col else '(?)'
+    match = f"t.{name_col} = s.{name_col}"
+    if parent_col:
+        match += f" AND t.{parent_col} = s.{parent_col}"
+    insert_cols = source_cols + (f", {extra_col}" if extra_col else '')
+    insert_vals = ', '.join(f"s.{c.strip()}" for c in source_cols.split(',')) + (', 1' if extra_col else '')
+    output_cols = f"s.{name_col}" + (f", s.{parent_col}" if parent_col else '')
+    return f"""
+        MERGE {table} WITH (HOLDLOCK) AS t
+        USING (VALUES {', '.join([placeholders] * rows)}) AS s({source_cols})
+            ON {match}
+        WHEN MATCHED THEN UPDATE SET t.{name_col} = t.{name_col}
+        WHEN NOT MATCHED THEN INSERT ({insert_cols}) VALUES ({insert_vals})
+        OUTPUT {output_cols}, INSERTED.{id_col}, $action;
+    """
+
+
+class MasterDataCache:
+    """Process-wide {kind: {(parent_id, name_key): id}} cache"""
+
+    def __init__(self):
+        self._ids = {kind: {} for kind in MASTER_TABLES}
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def load(self, cursor):
+        """(Re)load every master table"""
+        ids = {}
+        for kind, (table, id_col, name_col, parent_col, _) in MASTER_TABLES.items():
+            cursor.execute(
+                f"SELECT {id_col}, {name_col}, {parent_col or 'NULL'} FROM {table} ORDER BY {id_col}"
+            )
+            entries = {}
+            for row_id, name, parent_id in cursor.fetchall():
+                entries.setdefault((parent_id, name_key(name)), row_id)
+            ids[kind] = entries
+        with self._lock:
+            self._ids = ids
+            self.loaded = True
+        print("🗂️  Master data cache loaded: " +
+              ', '.join(f"{len(entries)} {kind}" for kind, entries in ids.items()))
+
+    def ensure_loaded(self, cursor):
+        if not self.loaded:
+            self.load(cursor)
+
+    def get(self, kind, name, parent_id=None):
+        with self._lock:
+            return self._ids[kind].get((parent_id, name_key(name)))
+
+    def publish(self, entries):
+        """Cache committed (kind, name, parent_id, id) entries"""
+        with self._lock:
+            for kind, name, parent_id, row_id in entries:
+                self._ids[kind].setdefault((parent_id, name_key(name)), row_id)
+
+    def invalidate(self):
+        """Forget everything (e.g. after master rows were deleted); reloaded on next use"""
+        with self._lock:
+            self._ids = {kind: {} for kind in MASTER_TABLES}
+            self.loaded = False
+
+    def session(self):
+        return MasterDataSession(self)
+
+
+class MasterDataSession:
+    """
+    Get-or-create within one transaction. Call publish() after commit so
+    newly created IDs reach the shared cache; discard the session on rollback.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.created = []    # (kind, name, parent_id, id) written in this transaction
+        self._local = {}     # IDs resolved via the database in this transaction
+
+    def get_or_create(self, cursor, kind, name, parent_id=None):
+        """ID of the named row (under parent_id for states/cities), creating it if needed"""
+        self.get_or_create_many(cursor, kind, [(name, parent_id)])
+        return self.lookup(kind, name, parent_id)
+
+    def get_or_create_many(self, cursor, kind, items):
+        """
+        Resolve many (name, parent_id) pairs; cache misses go to the
+        database in set-based MERGEs. Read the IDs back with lookup().
+        """
+        parent_col = MASTER_TABLES[kind][3]
+        missing = {}
+        for name, parent_id in items:
+            if name and self.lookup(kind, name, parent_id) is None:
+                missing.setdefault((parent_id, name_key(name)), (name, parent_id))
+        missing = list(missing.values())
+
+        per_statement = MERGE_PARAMS_PER_STATEMENT // (2 if parent_col else 1)
+        for i in range(0, len(missing), per_statement):
+            chunk = missing[i:i + per_statement]
+            params = [p for name, parent_id in chunk for p in ((name, parent_id) if parent_col else (name,))]
+            cursor.execute(merge_sql(kind, len(chunk)), params)
+
+            resolved = {}
+            for row in cursor.fetchall():
+                key = (row[1] if parent_col else None, name_key(row[0]))
+                row_id, inserted = resolved.get(key, (None, False, None))[:2]
+                resolved[key] = (row[-2] if row_id is None else min(row_id, row[-2]),
+                                 inserted or row[-1] == 'INSERT', row[0])
+
+            existing = []
+            for (parent_id, key), (row_id, inserted, name) in resolved.items():
+                self._local[(kind, parent_id, key)] = row_id
+                if inserted:
+                    self.created.append((kind, name, parent_id, row_id))
+                    print(f"✅ Created new {kind}: {name} (ID: {row_id})")
+                else:
+                    # Existed but was not cached yet (e.g. added by another process)
+                    existing.append((kind, name, parent_id, row_id))
+            self.cache.publish(existing)
+
+    def lookup(self, kind, name, parent_id=None):
+        """ID from the shared cache or this session, without touching the database"""
+        row_id = self.cache.get(kind, name, parent_id)
+        if row_id is None:
+            row_id = self._local.get((kind, parent_id, name_key(name)))
+        return row_id
+
+    def publish(self):
+        self.cache.publish(self.created)
+        self.created = []
@@ -0,0 +1,122 @@
+"""
+Versioned in-memory snapshot of the master data lists
+(sectors, courses, skills, countries, states, cities, companies)
+- All lists are read in one round trip and kept until invalidated or older
+  than `ttl` seconds; the version number only moves when content changes
+- Each list has a content-hash ETag so clients can revalidate with
+  If-None-Match and get a 304 instead of the list
+- The combined bootstrap payload is serialized and gzipped once per version
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+import time
+
+# list name -> (query, row -> dict); the shapes match the original endpoints
+MASTER_LISTS = {
+    'sectors': (
+        "SELECT SectorID, SectorName, Description, IsActive FROM Sectors WHERE IsActive = 1 ORDER BY SectorName",
+        lambda r: {'id': r[0], 'name': r[1], 'description': r[2] or '', 'isActive': r[3]}
+    ),
+    'courses': (
+        "SELECT CourseID, CourseName, CourseType, Duration, IsActive FROM Courses WHERE IsActive = 1 ORDER BY CourseName",
+        lambda r: {'id': r[0], 'name': r[1], 'type': r[2] or '', 'duration': r[3] or '', 'isActive': r[4]}
+    ),
+    'skills': (
+        "SELECT SkillID, SkillName, Category, IsActive FROM JobSkillsMaster WHERE IsActive = 1 ORDER BY SkillName",
+        lambda r: {'id': r[0], 'name': r[1], 'category': r[2] or '', 'isActive': r[3]}
+    ),
+    'countries': (
+        "SELECT CountryID, CountryName, CountryCode, IsActive FROM Countries WHERE IsActive = 1 ORDER BY CountryName",
+        lambda r: {'id': r[0], 'name': r[1], 'code': r[2] or '', 'isActive': r[3]}
+    ),
+    'states': (
+        "SELECT StateID, StateName, StateCode, CountryID, IsActive FROM States WHERE IsActive = 1 ORDER BY StateName",
+        lambda r: {'id': r[0], 'name': r[1], 'code': r[2] or '', 'countryId': r[3], 'isActive': r[4]}
+    ),
+    'cities': (
+        "SELECT CityID, CityName, StateID, IsActive FROM Cities WHERE IsActive = 1 ORDER BY CityName",
+        lambda r: {'id': r[0], 'name': r[1], 'stateId': r[2], 'isActive': r[3]}
+    ),
+    'companies': (
+        "SELECT CompanyID, CompanyName, CreatedAt FROM Companies ORDER BY CompanyName",
+        lambda r: {'companyId': r[0], 'companyName': r[1], 'createdAt': r[2].isoformat() if r[2] else None}
+    )
+}
+
+
+def content_hash(value):
+    return hashlib.sha1(json.dumps(value, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+
+class MasterDataSnapshot:
+    """Thread-safe, lazily reloaded snapshot of every master list"""
+
+    def __init__(self, get_connection, ttl=300):
+        self._get_connection = get_connection
+        self.ttl = ttl
+        self.version = 0
+        self.lists = {}
+        self._hashes = {}        # list name -> content hash
+        self._bootstrap = None   # (etag, json bytes, gzip bytes) for this version
+        self._loaded_at = None
+        self._stale = True
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Reload on next access (call after master rows were added or changed)"""
+        self._stale = True
+
+    def current(self):
+        """Reload if stale or expired; returns self for chaining"""
+        if self._stale or time.monotonic() - self._loaded_at >= self.ttl:
+            with self._lock:
+                if self._stale or time.monotonic() - self._loaded_at >= self.ttl:
+                    self._reload()
+        return self
+
+    def etag(self, name, *variant):
+        """ETag for one list (plus any filter values applied to it)"""
+        suffix = ''.join(f'-{v}' for v in variant if v is not None)
+        return f'{name}-{self._hashes[name]}{suffix}'
+
+    def bootstrap(self):
+        """(etag, json bytes, gzip bytes) of every list in one payload"""
+        self.current()
+        with self._lock:
+            if self._bootstrap is None:
+                payload = dict(self.lists, success=True, version=self.version)
+                body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+                etag = f"bootstrap-{content_hash(self._hashes)}"
+                self._bootstrap = (etag, body, gzip.compress(body, compresslevel=6))
+            return self._bootstrap
+
+    def _reload(self):
+        # Cleared before reading so an invalidate() during the read still counts
+        self._stale = False
+        names = list(MASTER_LISTS)
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SET NOCOUNT ON; " + "; ".join(MASTER_LISTS[n][0] for n in names))
+                lists = {}
+                for i, name in enumerate(names):
+                    if i:
+                        cursor.nextset()
+                    lists[name] = [MASTER_LISTS[name][1](row) for row in cursor.fetchall()]
+                cursor.close()
+        except Exception:
+            self._stale = True
+            raise
+
+        hashes = {name: content_hash(items) for name, items in lists.items()}
+        if hashes != self._hashes:
+            self.version += 1
+            self.lists = lists
+            self._hashes = hashes
+            self._bootstrap = None
+            print(f"📚 Master data snapshot v{self.version}: " +
+                  ', '.join(f"{len(items)} {name}" for name, items in lists.items()))
+        self._loaded_at = time.monotonic()
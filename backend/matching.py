@@ -0,0 +1,349 @@
+"""
+Resume <-> job matching engine
+- Resumes and open jobs are encoded as sparse skill vectors over one shared
+  vocabulary (TF-IDF weighted, L2 normalised), so one sparse matrix-vector
+  product scores a job against every resume (or a resume against every job)
+- Skill cosine is blended with experience fit (years vs. ExperienceYears)
+  and course fit (Education.Course vs. the job's course)
+- The matrices are rebuilt from the database in the background once data
+  has changed, while the previous snapshot keeps serving requests
+
+Needs numpy and scipy; `AVAILABLE` is False when they are not installed.
+"""
+
+import threading
+import time
+
+from skills import clean_name, skill_key
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = sparse = None
+
+AVAILABLE = np is not None
+
+# Resume skill rows count for less when they are soft skills
+SKILL_TYPE_WEIGHTS = {'technical': 1.0, 'professional': 0.8, 'personal': 0.3}
+DEFAULT_SKILL_TYPE_WEIGHT = 0.8
+
+
+def normalize_key(text):
+    """Case/whitespace-insensitive key for course names"""
+    return ' '.join((text or '').lower().split())
+
+
+class MatchSnapshot:
+    """Immutable matrices and id maps built from one database read"""
+
+    def __init__(self, vocabulary, resume_ids, resume_rows, resume_years, resume_courses,
+                 job_ids, job_rows, job_years, job_courses, course_names):
+        self.vocabulary = vocabulary                  # skill index -> display name
+        self.resume_ids = np.asarray(resume_ids)
+        self.job_ids = np.asarray(job_ids)
+        self.resume_pos = {rid: i for i, rid in enumerate(resume_ids)}
+        self.job_pos = {jid: i for i, jid in enumerate(job_ids)}
+        # Highest ids read: anything above was created after this snapshot
+        self.max_resume_id = max(resume_ids, default=0)
+        self.max_job_id = max(job_ids, default=0)
+        self.resume_years = np.asarray(resume_years, dtype=np.float64)
+        self.job_years = np.asarray(job_years, dtype=np.float64)
+        self.job_courses = np.asarray(job_courses, dtype=np.int64)   # course index or -1
+        self.course_names = course_names
+
+        # Binary resume x course matrix (column slices for job -> candidates)
+        course_matrix = _weighted_matrix(resume_courses, len(resume_ids), len(course_names))
+        self.resume_courses_csr = course_matrix
+        self.resume_courses_csc = course_matrix.tocsc()
+
+        # TF-IDF over resumes and jobs together, rows L2-normalised
+        resumes = _weighted_matrix(resume_rows, len(resume_ids), len(vocabulary))
+        jobs = _weighted_matrix(job_rows, len(job_ids), len(vocabulary))
+        doc_freq = np.bincount(resumes.indices, minlength=len(vocabulary)) + \
+            np.bincount(jobs.indices, minlength=len(vocabulary))
+        doc_count = len(resume_ids) + len(job_ids)
+        idf = np.log((1 + doc_count) / (1 + doc_freq)) + 1
+        self.resumes = _l2_normalize(resumes @ sparse.diags(idf))
+        self.jobs = _l2_normalize(jobs @ sparse.diags(idf))
+        self.built_at = time.time()
+
+
+class MatchingEngine:
+    """Bulk resume/job scorer backed by a periodically rebuilt snapshot"""
+
+    def __init__(self, get_connection, skill_weight=0.7, experience_weight=0.2,
+                 course_weight=0.1, refresh_interval=60):
+        self._get_connection = get_connection
+        self.skill_weight = skill_weight
+        self.experience_weight = experience_weight
+        self.course_weight = course_weight
+        self.refresh_interval = refresh_interval
+        self._snapshot = None
+        self._dirty = False
+        self._rebuilding = False
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+
+    # ---------- snapshot management ----------
+
+    def invalidate(self):
+        """Mark the data as changed; the next lookup schedules a rebuild"""
+        self._dirty = True
+
+    def refresh(self):
+        """Rebuild the snapshot now (blocking)"""
+        with self._build_lock:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                self._dirty = False
+                snapshot = self._build(cursor)
+                cursor.close()
+            self._snapshot = snapshot
+        print(f"🧮 Matching engine loaded: {len(snapshot.resume_ids)} resumes, "
+              f"{len(snapshot.job_ids)} jobs, {len(snapshot.vocabulary)} skills")
+        return snapshot
+
+    def snapshot(self):
+        """Current snapshot; built inline the first time, in the background once stale"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.refresh()
+        if self._dirty and time.time() - snapshot.built_at >= self.refresh_interval:
+            with self._lock:
+                if not self._rebuilding:
+                    self._rebuilding = True
+                    threading.Thread(target=self._background_refresh, name='matching-refresh',
+                                     daemon=True).start()
+        return snapshot
+
+    def _locate(self, kind, key):
+        """
+        (snapshot, row) for a 'job' or 'resume' id. Rebuilds inline only for
+        an id newer than the snapshot; other unknown ids wait for the
+        background refresh.
+        """
+        snap = self.snapshot()
+        pos = getattr(snap, f'{kind}_pos').get(key)
+        if pos is None and self._dirty and key > getattr(snap, f'max_{kind}_id'):
+            snap = self.refresh()
+            pos = getattr(snap, f'{kind}_pos').get(key)
+        return snap, pos
+
+    def _background_refresh(self):
+        try:
+            self.refresh()
+        except Exception as e:
+            print(f"⚠️  Matching engine refresh failed: {e}")
+        finally:
+            with self._lock:
+                self._rebuilding = False
+
+    # ---------- scoring ----------
+
+    def candidates_for_job(self, job_id, k=20):
+        """
+        Top-k resumes for an open job: [{'resumeId', 'score', ...}, ...],
+        or None if the job is not in the snapshot.
+        """
+        snap, pos = self._locate('job', job_id)
+        if pos is None:
+            return None
+
+        job_vector = snap.jobs[pos]
+        skill = (snap.resumes @ job_vector.T).toarray().ravel()
+
+        required = snap.job_years[pos]
+        experience = np.ones_like(snap.resume_years) if required <= 0 else \
+            np.minimum(snap.resume_years / required, 1.0)
+
+        course_idx = snap.job_courses[pos]
+        if course_idx < 0:
+            course = np.ones_like(skill)
+        else:
+            course = snap.resume_courses_csc[:, course_idx].toarray().ravel()
+
+        scores = self._blend(skill, experience, course, require_skill=job_vector.nnz > 0)
+        job_skills = set(job_vector.indices)
+        return [
+            {
+                'resumeId': int(snap.resume_ids[i]),
+                'score': round(float(scores[i]), 4),
+                'skillScore': round(float(skill[i]), 4),
+                'experienceFit': round(float(experience[i]), 4),
+                'courseFit': round(float(course[i]), 4),
+                'matchedSkills': _matched(snap, snap.resumes, i, job_skills)
+            }
+            for i in _top_k(scores, k)
+        ]
+
+    def jobs_for_resume(self, resume_id, k=20):
+        """
+        Top-k open jobs for a resume: [{'jobId', 'score', ...}, ...],
+        or None if the resume is not in the snapshot.
+        """
+        snap, pos = self._locate('resume', resume_id)
+        if pos is None:
+            return None
+
+        resume_vector = snap.resumes[pos]
+        skill = (snap.jobs @ resume_vector.T).toarray().ravel()
+
+        years = snap.resume_years[pos]
+        required = snap.job_years
+        experience = np.where(required <= 0, 1.0, np.minimum(years / np.maximum(required, 1e-9), 1.0))
+
+        resume_courses = snap.resume_courses_csr[pos].indices
+        course = np.where(
+            snap.job_courses < 0, 1.0,
+            np.isin(snap.job_courses, resume_courses).astype(np.float64)
+        )
+
+        scores = self._blend(skill, experience, course, require_skill=resume_vector.nnz > 0)
+        resume_skills = set(resume_vector.indices)
+        return [
+            {
+                'jobId': int(snap.job_ids[i]),
+                'score': round(float(scores[i]), 4),
+                'skillScore': round(float(skill[i]), 4),
+                'experienceFit': round(float(experience[i]), 4),
+                'courseFit': round(float(course[i]), 4),
+                'matchedSkills': _matched(snap, snap.jobs, i, resume_skills)
+            }
+            for i in _top_k(scores, k)
+        ]
+
+    def _blend(self, skill, experience, course, require_skill):
+        scores = (self.skill_weight * skill + self.experience_weight * experience
+                  + self.course_weight * course)
+        if require_skill:
+            # Without a single shared skill it is not a match
+            scores = np.where(skill > 0, scores, -np.inf)
+        return scores
+
+    # ---------- loading ----------
+
+    def _build(self, cursor):
+        vocabulary, skill_index = [], {}
+        course_names, course_index = [], {}
+
+        def skill_id(name):
+            key = skill_key(name)
+            if key not in skill_index:
+                skill_index[key] = len(vocabulary)
+                vocabulary.append(clean_name(name))
+            return skill_index[key]
+
+        # Open jobs first: their courses define the course vocabulary
+        cursor.execute("""
+            SELECT j.JobID, ISNULL(j.ExperienceYears, 0),
+                   ISNULL(co.CourseName, j.EducationRequirement)
+            FROM Jobs j
+            LEFT JOIN Courses co ON j.CourseID = co.CourseID
+            WHERE j.JobStatus = 'Open'
+        """)
+        job_ids, job_years, job_courses = [], [], []
+        for job_id, years, course in cursor.fetchall():
+            job_ids.append(job_id)
+            job_years.append(float(years))
+            key = normalize_key(course)
+            if key and key not in course_index:
+                course_index[key] = len(course_names)
+                course_names.append(course.strip())
+            job_courses.append(course_index.get(key, -1) if key else -1)
+        job_pos = {jid: i for i, jid in enumerate(job_ids)}
+
+        cursor.execute("""
+            SELECT js.JobID, sk.SkillName
+            FROM JobSkills js
+            INNER JOIN JobSkillsMaster sk ON js.SkillID = sk.SkillID
+            INNER JOIN Jobs j ON j.JobID = js.JobID
+            WHERE j.JobStatus = 'Open'
+        """)
+        job_rows = [{} for _ in job_ids]
+        for job_id, skill_name in cursor.fetchall():
+            if skill_key(skill_name):
+                job_rows[job_pos[job_id]][skill_id(skill_name)] = 1.0
+
+        # Resumes with total work experience in years
+        cursor.execute("""
+            SELECT r.ResumeID,
+                   ISNULL(SUM(DATEDIFF(month, w.DateOfJoin, ISNULL(w.LastWorkingDate, GETDATE()))), 0) / 12.0
+            FROM Resumes r
+            LEFT JOIN WorkExperience w ON w.ResumeID = r.ResumeID
+            GROUP BY r.ResumeID
+        """)
+        resume_ids, resume_years = [], []
+        for resume_id, years in cursor.fetchall():
+            resume_ids.append(resume_id)
+            resume_years.append(max(float(years or 0), 0.0))
+        resume_pos = {rid: i for i, rid in enumerate(resume_ids)}
+
+        cursor.execute("SELECT ResumeID, SkillType, SkillName FROM Skills")
+        resume_rows = [{} for _ in resume_ids]
+        for resume_id, skill_type, skill_name in cursor.fetchall():
+            pos = resume_pos.get(resume_id)
+            if pos is None or not skill_key(skill_name):
+                continue
+            weight = SKILL_TYPE_WEIGHTS.get(normalize_key(skill_type), DEFAULT_SKILL_TYPE_WEIGHT)
+            row = resume_rows[pos]
+            idx = skill_id(skill_name)
+            row[idx] = max(row.get(idx, 0.0), weight)
+
+        # A resume course fits a job course when it contains it ("b.tech" in "b.tech cse")
+        cursor.execute("SELECT DISTINCT ResumeID, Course FROM Education WHERE Course IS NOT NULL")
+        matches_by_course = {}
+        resume_courses = [set() for _ in resume_ids]
+        for resume_id, course in cursor.fetchall():
+            pos = resume_pos.get(resume_id)
+            key = normalize_key(course)
+            if pos is None or not key:
+                continue
+            if key not in matches_by_course:
+                matches_by_course[key] = [i for k, i in course_index.items() if k in key]
+            resume_courses[pos].update(matches_by_course[key])
+
+        return MatchSnapshot(
+            vocabulary, resume_ids, resume_rows, resume_years,
+            [{i: 1.0 for i in courses} for courses in resume_courses],
+            job_ids, job_rows, job_years, job_courses, course_names
+        )
+
+
+# ---------- helpers ----------
+
+def _weighted_matrix(rows, n_rows, n_cols):
+    """CSR matrix from a list of {column: weight} dicts"""
+    indptr = [0]
+    indices, data = [], []
+    for row in rows:
+        indices.extend(row.keys())
+        data.extend(row.values())
+        indptr.append(len(indices))
+    return sparse.csr_matrix(
+        (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int64), indptr),
+        shape=(n_rows, n_cols)
+    )
+
+
+def _l2_normalize(matrix):
+    matrix = sparse.csr_matrix(matrix)
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return (sparse.diags(1.0 / norms) @ matrix).tocsr()
+
+
+def _top_k(scores, k):
+    """Indices of the k best finite scores, best first"""
+    valid = np.flatnonzero(np.isfinite(scores))
+    if not len(valid) or k <= 0:
+        return []
+    if len(valid) > k:
+        valid = valid[np.argpartition(-scores[valid], k - 1)[:k]]
+    return valid[np.lexsort((valid, -scores[valid]))].tolist()
+
+
+def _matched(snap, matrix, row, other_skills):
+    """Display names of skills shared by `row` of `matrix` and `other_skills`"""
+    start, end = matrix.indptr[row], matrix.indptr[row + 1]
+    return [snap.vocabulary[i] for i in sorted(set(matrix.indices[start:end]) & other_skills)]
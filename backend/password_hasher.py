@@ -0,0 +1,89 @@
+"""
+Bounded worker pool for bcrypt password hashing
+- bcrypt releases the GIL, so a few worker threads keep hashing off the
+  request threads while capping how much CPU auth traffic can take
+- Calls beyond `max_queue` in flight are rejected straight away
+  (PasswordHasherBusy) instead of piling up behind a login burst
+- Each call waits at most `timeout` seconds (PasswordHasherBusy)
+- Hashes whose cost differs from `rounds` are re-hashed in the
+  background after a successful login
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
+import bcrypt
+
+
+class PasswordHasherBusy(Exception):
+    """The hashing queue is full or the call timed out - retry later"""
+
+
+def hash_cost(hashed):
+    """bcrypt cost factor of a stored hash ('$2b$12$...' -> 12), or None"""
+    try:
+        return int(hashed.split('$')[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+class PasswordHasher:
+    """hash/verify on a dedicated, bounded thread pool"""
+
+    def __init__(self, rounds=12, workers=2, max_queue=32, timeout=5.0):
+        self.rounds = rounds
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='password-hasher')
+
+    def hash(self, password):
+        """bcrypt hash (str) of `password` at the configured cost"""
+        rounds = self.rounds
+        return self._call(lambda: bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8'))
+
+    def verify(self, password, hashed):
+        """True if `password` matches the stored hash"""
+        return self._call(lambda: bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8')))
+
+    def needs_rehash(self, hashed):
+        return hash_cost(hashed) != self.rounds
+
+    def rehash_in_background(self, password, store):
+        """
+        Hash `password` at the configured cost and pass the new hash to
+        store(hashed) on the worker thread. Skipped while the pool is busy -
+        the next login will try again.
+        """
+        def rehash():
+            new_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(self.rounds)).decode('utf-8')
+            try:
+                store(new_hash)
+            except Exception as e:
+                print(f"⚠️  Password rehash failed: {e}")
+
+        try:
+            self._submit(rehash)
+        except PasswordHasherBusy:
+            pass
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False)
+
+    def _submit(self, fn):
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy('Password hashing queue is full')
+        try:
+            future = self._executor.submit(fn)
+        except Exception:
+            self._slots.release()
+            raise
+        # The slot stays taken until the work finishes, even if the caller timed out
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def _call(self, fn):
+        future = self._submit(fn)
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            raise PasswordHasherBusy('Password hashing timed out')
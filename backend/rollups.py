@@ -0,0 +1,116 @@
+"""
+Daily rollup counters for the analytics timeline
+- One DailyRollups row per (metric, day)
+- Writers bump counters in their own transaction (incremental)
+- compact() rebuilds the fact-table metrics from Resumes/Jobs
+- read_series() aggregates daily rows into day/week/month buckets
+
+Run this file directly to rebuild the rollups:
+
+    python rollups.py [days]
+"""
+
+from datetime import date, timedelta
+
+RESUMES_CREATED = 'resumes_created'
+JOBS_POSTED = 'jobs_posted'
+VIEWS = 'views'
+DOWNLOADS = 'downloads'
+
+METRICS = (RESUMES_CREATED, JOBS_POSTED, VIEWS, DOWNLOADS)
+GRANULARITIES = ('day', 'week', 'month')
+
+# Metrics that can be recomputed from a fact table: metric -> (table, date column)
+FACT_SOURCES = {
+    RESUMES_CREATED: ('Resumes', 'CreatedDate'),
+    JOBS_POSTED: ('Jobs', 'PostedDate')
+}
+
+
+def bump(cursor, metric, amount=1, on_date=None):
+    """Add `amount` to a metric for `on_date` (default: today) - caller commits"""
+    if not amount:
+        return
+    day_expr = "CAST(GETDATE() AS DATE)" if on_date is None else "CAST(? AS DATE)"
+    params = ([] if on_date is None else [on_date]) + [metric, amount, amount]
+    cursor.execute(f"""
+        MERGE DailyRollups WITH (HOLDLOCK) AS t
+        USING (SELECT {day_expr} AS RollupDate, ? AS Metric) AS s
+            ON t.RollupDate = s.RollupDate AND t.Metric = s.Metric
+        WHEN MATCHED THEN UPDATE SET Value = t.Value + ?
+        WHEN NOT MATCHED THEN INSERT (RollupDate, Metric, Value) VALUES (s.RollupDate, s.Metric, ?);
+    """, params)
+
+
+def bump_counters(cursor, views, downloads):
+    """Record flushed view/download increments for today - caller commits"""
+    bump(cursor, VIEWS, views)
+    bump(cursor, DOWNLOADS, downloads)
+
+
+def compact(cursor, days=None):
+    """
+    Rebuild the fact-table metrics for the last `days` days (all history
+    when None) from Resumes and Jobs. Views and downloads only exist as
+    rollups and are left untouched. Caller commits.
+    """
+    for metric, (table, column) in FACT_SOURCES.items():
+        window = ""
+        params = [metric]
+        if days is not None:
+            window = " AND RollupDate >= CAST(DATEADD(day, -?, GETDATE()) AS DATE)"
+            params.append(days)
+        cursor.execute(f"DELETE FROM DailyRollups WHERE Metric = ?{window}", params)
+
+        window = ""
+        params = [metric]
+        if days is not None:
+            window = f" WHERE {column} >= CAST(DATEADD(day, -?, GETDATE()) AS DATE)"
+            params.append(days)
+        cursor.execute(f"""
+            INSERT INTO DailyRollups (RollupDate, Metric, Value)
+            SELECT CAST({column} AS DATE), ?, COUNT(*)
+            FROM {table}{window}
+            GROUP BY CAST({column} AS DATE)
+        """, params)
+
+
+def bucket_start(day, granularity):
+    """First day of the bucket containing `day`"""
+    if granularity == 'week':
+        return day - timedelta(days=day.weekday())
+    if granularity == 'month':
+        return day.replace(day=1)
+    return day
+
+
+def read_series(cursor, metric, days=30, granularity='day'):
+    """[{'date': 'YYYY-MM-DD', 'count': n}, ...] for the last `days` days, oldest first"""
+    cursor.execute("""
+        SELECT RollupDate, Value
+        FROM DailyRollups
+        WHERE Metric = ? AND RollupDate >= CAST(DATEADD(day, -?, GETDATE()) AS DATE)
+        ORDER BY RollupDate
+    """, (metric, days))
+
+    buckets = {}
+    for rollup_date, value in cursor.fetchall():
+        if isinstance(rollup_date, str):
+            rollup_date = date.fromisoformat(rollup_date)
+        key = bucket_start(rollup_date, granularity)
+        buckets[key] = buckets.get(key, 0) + value
+
+    return [{'date': str(key), 'count': count} for key, count in buckets.items() if count]
+
+
+if __name__ == '__main__':
+    import sys
+    from backend import get_db_connection
+
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        compact(cursor, days)
+        conn.commit()
+        cursor.close()
+    print(f"✅ Rollups rebuilt ({'all history' if days is None else f'last {days} days'})")
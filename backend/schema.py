@@ -0,0 +1,122 @@
+"""
+Schema additions required by the backend's performance features
+Each migration is idempotent, so ensure_schema() is safe to run on every
+startup; ensure_schema_once() applies them once per process, whichever
+server started it. Run this file directly to apply them by hand:
+
+    python schema.py
+"""
+
+import threading
+import time
+
+MIGRATIONS = [
+    ('DailyRollups table', """
+        IF OBJECT_ID('dbo.DailyRollups', 'U') IS NULL
+        CREATE TABLE dbo.DailyRollups (
+            RollupDate DATE NOT NULL,
+            Metric VARCHAR(32) NOT NULL,
+            Value INT NOT NULL CONSTRAINT DF_DailyRollups_Value DEFAULT 0,
+            CONSTRAINT PK_DailyRollups PRIMARY KEY (Metric, RollupDate)
+        )
+    """),
+    ('SkillSynonyms table', """
+        IF OBJECT_ID('dbo.SkillSynonyms', 'U') IS NULL
+        CREATE TABLE dbo.SkillSynonyms (
+            Alias NVARCHAR(100) NOT NULL CONSTRAINT PK_SkillSynonyms PRIMARY KEY,
+            CanonicalName NVARCHAR(100) NOT NULL
+        )
+    """),
+    # Owner of each resume (set by save_resume); replaces matching users to
+    # resumes through PersonalInformation.Email at query time. Existing
+    # resumes are backfilled once, when the column is added: the owner is
+    # the user registered with the resume's email (EXEC because the column
+    # does not exist yet when the batch is compiled).
+    ('Resumes.UserID column', """
+        IF COL_LENGTH('dbo.Resumes', 'UserID') IS NULL
+        BEGIN
+            ALTER TABLE dbo.Resumes ADD UserID INT NULL
+                CONSTRAINT FK_Resumes_Users FOREIGN KEY REFERENCES dbo.Users (UserId) ON DELETE SET NULL;
+            EXEC('
+                UPDATE r SET UserID = u.UserId
+                FROM dbo.Resumes r
+                INNER JOIN dbo.PersonalInformation p ON p.ResumeID = r.ResumeID
+                INNER JOIN dbo.Users u ON u.EmailId = p.Email
+            ');
+        END
+    """),
+    ('Resumes.UserID index', """
+        IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'IX_Resumes_UserID')
+        CREATE INDEX IX_Resumes_UserID ON dbo.Resumes (UserID, CreatedDate DESC)
+            INCLUDE (ResumeTitle)
+    """),
+]
+
+# Unique master data names, so concurrent get-or-create MERGEs cannot insert
+# the same name twice. Skipped while a table still holds duplicates (run
+# `python skills.py` for skills) or when the column cannot be indexed.
+UNIQUE_NAME_INDEXES = [
+    ('Companies', 'CompanyName', None),
+    ('Sectors', 'SectorName', None),
+    ('Courses', 'CourseName', None),
+    ('Countries', 'CountryName', None),
+    ('States', 'StateName', 'CountryID'),
+    ('Cities', 'CityName', 'StateID'),
+    ('JobSkillsMaster', 'SkillName', None),
+]
+
+for _table, _name_col, _parent_col in UNIQUE_NAME_INDEXES:
+    _cols = f"{_parent_col}, {_name_col}" if _parent_col else _name_col
+    MIGRATIONS.append((f'Unique {_table}.{_name_col}', f"""
+        IF NOT EXISTS (SELECT 1 FROM sys.indexes WHERE name = 'UX_{_table}_{_name_col}')
+           AND COL_LENGTH('dbo.{_table}', '{_name_col}') BETWEEN 1 AND 1700
+           AND NOT EXISTS (SELECT 1 FROM dbo.{_table} GROUP BY {_cols} HAVING COUNT(*) > 1)
+        CREATE UNIQUE INDEX UX_{_table}_{_name_col} ON dbo.{_table} ({_cols})
+    """))
+
+
+def ensure_schema(conn):
+    """Apply every migration (each one checks whether it is needed)"""
+    cursor = conn.cursor()
+    for name, sql in MIGRATIONS:
+        cursor.execute(sql)
+        conn.commit()
+    cursor.close()
+    print(f"✅ Schema up to date ({len(MIGRATIONS)} migrations checked)")
+
+
+_applied = False
+_retry_at = 0.0
+_apply_lock = threading.Lock()
+
+def ensure_schema_once(get_connection, after=None, retry_interval=30):
+    """
+    ensure_schema(), then after(conn), on the first call in this process.
+    After a failure, calls return at once until `retry_interval` seconds
+    have passed, so an unreachable database costs one timeout per interval.
+    Returns True once applied.
+    """
+    global _applied, _retry_at
+    if _applied:
+        return True
+    if time.monotonic() < _retry_at:
+        return False
+    with _apply_lock:
+        if not _applied and time.monotonic() >= _retry_at:
+            try:
+                with get_connection() as conn:
+                    ensure_schema(conn)
+                    if after:
+                        after(conn)
+            except Exception:
+                _retry_at = time.monotonic() + retry_interval
+                raise
+            _applied = True
+    return _applied
+
+
+if __name__ == '__main__':
+    from backend import get_db_connection
+
+    with get_db_connection() as conn:
+        ensure_schema(conn)
@@ -0,0 +1,328 @@
+"""
+In-memory inverted index for job search
+- Tokenizes title, description, company and skills of every open job
+- Keyword queries intersect posting lists (every term must match;
+  a term also matches words it is a prefix of, e.g. "develop" -> "developer")
+- Results are ranked with BM25, with title/company/skill matches weighted up
+- Updated incrementally as jobs are created and deleted
+- Facet counts (sector, course, job type, city, experience band, skill)
+  for any result set come from one pass of bitset intersections: every
+  job owns a bit position and every facet value keeps a bitset of its jobs
+"""
+
+import math
+import re
+import threading
+from bisect import bisect_left
+from collections import Counter
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+# Only function words - anything that can name a sector, skill or role
+# (e.g. 'IT') must stay searchable
+STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'is',
+    'of', 'on', 'or', 'the', 'to', 'we', 'with', 'you', 'your'
+})
+
+# How many times a token counts towards term frequency, per field
+FIELD_WEIGHTS = {'title': 3, 'company': 2, 'skills': 2, 'description': 1}
+
+# Prefix expansions score less than exact term matches
+PREFIX_MATCH_WEIGHT = 0.5
+MAX_PREFIX_EXPANSIONS = 50
+
+FACETS = ('sector', 'course', 'jobType', 'city', 'experience', 'skill')
+
+# Experience bands for the 'experience' facet: (label, min, max) in years, max inclusive
+EXPERIENCE_BANDS = [
+    ('0-1 years', 0, 1),
+    ('1-3 years', 1, 3),
+    ('3-5 years', 3, 5),
+    ('5-10 years', 5, 10),
+    ('10+ years', 10, None)
+]
+
+
+def experience_band(years):
+    """Index into EXPERIENCE_BANDS for a job's ExperienceYears"""
+    years = float(years or 0)
+    for i, (_, _, upper) in enumerate(EXPERIENCE_BANDS):
+        if upper is None or years <= upper:
+            return i
+    return len(EXPERIENCE_BANDS) - 1
+
+
+def tokenize(text):
+    """Lower-case word tokens without stop words"""
+    if not text:
+        return []
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOP_WORDS]
+
+
+class JobSearchIndex:
+    """Thread-safe BM25 inverted index over open jobs"""
+
+    def __init__(self, k1=1.2, b=0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings = {}      # token -> {job_id: weighted term frequency}
+        self._doc_terms = {}     # job_id -> Counter of weighted term frequencies
+        self._doc_len = {}       # job_id -> weighted document length
+        self._total_len = 0
+        self._sorted_terms = None
+        self._slots = {}         # job_id -> bit position
+        self._free_slots = []
+        self._facet_bits = {facet: {} for facet in FACETS}  # facet -> {(value, label): bitset}
+        self._doc_facets = {}    # job_id -> [(facet, (value, label)), ...]
+        self._lock = threading.RLock()
+        self._change_logs = []   # one list per load() in progress: changes to replay after it
+        self.loaded = False
+
+    def __len__(self):
+        return len(self._doc_len)
+
+    # ---------- building ----------
+
+    def load(self, cursor):
+        """
+        (Re)build the index from every open job in the database. Jobs added
+        or removed while the rows are being read are replayed afterwards.
+        """
+        changes = []
+        with self._lock:
+            self._change_logs.append(changes)
+        try:
+            jobs, skills = self._read_jobs(cursor)
+        except Exception:
+            with self._lock:
+                self._change_logs.remove(changes)
+            raise
+
+        with self._lock:
+            self._change_logs.remove(changes)
+            self._clear_locked()
+            for (job_id, title, description, company, sector_id, sector_name, course_id,
+                 course_name, job_type, city_id, city_name, experience) in jobs:
+                job_skills = skills.get(job_id, [])
+                facets = {
+                    'sector': (sector_id, sector_name),
+                    'course': (course_id, course_name),
+                    'jobType': (job_type, job_type),
+                    'city': (city_id, city_name),
+                    'experience': experience,
+                    'skill': job_skills
+                }
+                self._add_locked(job_id, title, description, company,
+                                 [name for _, name in job_skills], facets)
+            for args in changes:
+                self._remove_locked(args[0])
+                if len(args) > 1:
+                    self._add_locked(*args)
+            self.loaded = True
+        print(f"🔎 Job search index loaded: {len(self)} jobs, {len(self._postings)} terms")
+
+    def _read_jobs(self, cursor):
+        """(job rows, {job_id: [(SkillID, SkillName), ...]}) for every open job"""
+        cursor.execute("""
+            SELECT j.JobID, j.JobTitle, j.JobDescription, c.CompanyName,
+                   j.SectorID, s.SectorName, j.CourseID, co.CourseName,
+                   j.JobType, j.CityID, ci.CityName, j.ExperienceYears
+            FROM Jobs j
+            INNER JOIN Companies c ON j.CompanyID = c.CompanyID
+            LEFT JOIN Sectors s ON j.SectorID = s.SectorID
+            LEFT JOIN Courses co ON j.CourseID = co.CourseID
+            LEFT JOIN Cities ci ON j.CityID = ci.CityID
+            WHERE j.JobStatus = 'Open'
+        """)
+        jobs = cursor.fetchall()
+
+        cursor.execute("""
+            SELECT js.JobID, sk.SkillID, sk.SkillName
+            FROM JobSkills js
+            INNER JOIN JobSkillsMaster sk ON js.SkillID = sk.SkillID
+            INNER JOIN Jobs j ON j.JobID = js.JobID
+            WHERE j.JobStatus = 'Open'
+        """)
+        skills = {}
+        for job_id, skill_id, skill_name in cursor.fetchall():
+            skills.setdefault(job_id, []).append((skill_id, skill_name))
+        return jobs, skills
+
+    def _clear_locked(self):
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._doc_len.clear()
+        self._total_len = 0
+        self._sorted_terms = None
+        self._slots.clear()
+        self._free_slots.clear()
+        self._doc_facets.clear()
+        for bitsets in self._facet_bits.values():
+            bitsets.clear()
+
+    def add_job(self, job_id, title, description, company, skills, facets=None):
+        """
+        Index (or re-index) one job. `facets` maps sector/course/jobType/city
+        to an (id, name) pair, experience to ExperienceYears and skill to a
+        list of (SkillID, SkillName) pairs.
+        """
+        with self._lock:
+            self._remove_locked(job_id)
+            self._add_locked(job_id, title, description, company, skills, facets)
+            for changes in self._change_logs:
+                changes.append((job_id, title, description, company, skills, facets))
+
+    def remove_job(self, job_id):
+        with self._lock:
+            self._remove_locked(job_id)
+            for changes in self._change_logs:
+                changes.append((job_id,))
+
+    # ---------- querying ----------
+
+    def search(self, query):
+        """
+        Return [(job_id, score), ...] best first for jobs matching every
+        query term (exactly or by prefix).
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            doc_count = len(self._doc_len)
+            if not doc_count:
+                return []
+            avg_len = self._total_len / doc_count
+
+            # Per query term: {job_id: score contribution}
+            term_scores = []
+            for term in terms:
+                scores = {}
+                for token, weight in self._expand_locked(term):
+                    postings = self._postings[token]
+                    idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                    for job_id, tf in postings.items():
+                        norm = tf + self.k1 * (1 - self.b + self.b * self._doc_len[job_id] / avg_len)
+                        scores[job_id] = scores.get(job_id, 0.0) + weight * idf * tf * (self.k1 + 1) / norm
+                if not scores:
+                    return []
+                term_scores.append(scores)
+
+        # Intersect starting from the rarest term
+        term_scores.sort(key=len)
+        matches = set(term_scores[0])
+        for scores in term_scores[1:]:
+            matches &= scores.keys()
+            if not matches:
+                return []
+
+        ranked = [(job_id, sum(scores[job_id] for scores in term_scores)) for job_id in matches]
+        ranked.sort(key=lambda item: (-item[1], -item[0]))
+        return ranked
+
+    def facet_counts(self, job_ids):
+        """
+        {facet: [{'value', 'label', 'count'}, ...]} over the given jobs,
+        most common value first. Jobs that are not indexed are ignored.
+        """
+        with self._lock:
+            result_bits = 0
+            for job_id in job_ids:
+                slot = self._slots.get(job_id)
+                if slot is not None:
+                    result_bits |= 1 << slot
+
+            counts = {}
+            for facet, bitsets in self._facet_bits.items():
+                values = []
+                for (value, label), bits in bitsets.items():
+                    count = (bits & result_bits).bit_count()
+                    if count:
+                        entry = {'value': value, 'label': label, 'count': count}
+                        if facet == 'experience':
+                            entry['min'], entry['max'] = EXPERIENCE_BANDS[value][1:]
+                        values.append(entry)
+                values.sort(key=lambda entry: (-entry['count'], str(entry['label'])))
+                counts[facet] = values
+            return counts
+
+    # ---------- internals ----------
+
+    def _add_locked(self, job_id, title, description, company, skills, facets=None):
+        terms = Counter()
+        fields = {
+            'title': title,
+            'description': description,
+            'company': company,
+            'skills': ' '.join(skills or [])
+        }
+        for field, text in fields.items():
+            for token in tokenize(text):
+                terms[token] += FIELD_WEIGHTS[field]
+
+        for token, tf in terms.items():
+            if token not in self._postings:
+                self._postings[token] = {}
+                self._sorted_terms = None
+            self._postings[token][job_id] = tf
+        self._doc_terms[job_id] = terms
+        self._doc_len[job_id] = sum(terms.values())
+        self._total_len += self._doc_len[job_id]
+
+        slot = self._free_slots.pop() if self._free_slots else len(self._slots)
+        self._slots[job_id] = slot
+        doc_facets = []
+        for facet, value in (facets or {}).items():
+            if facet == 'experience':
+                band = experience_band(value)
+                doc_facets.append((facet, (band, EXPERIENCE_BANDS[band][0])))
+            elif facet == 'skill':
+                doc_facets.extend((facet, tuple(pair)) for pair in value)
+            elif value and value[0] is not None:
+                doc_facets.append((facet, tuple(value)))
+        for facet, key in doc_facets:
+            bitsets = self._facet_bits[facet]
+            bitsets[key] = bitsets.get(key, 0) | (1 << slot)
+        self._doc_facets[job_id] = doc_facets
+
+    def _remove_locked(self, job_id):
+        terms = self._doc_terms.pop(job_id, None)
+        if terms is None:
+            return
+        for token in terms:
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(job_id, None)
+                if not postings:
+                    del self._postings[token]
+                    self._sorted_terms = None
+        self._total_len -= self._doc_len.pop(job_id)
+
+        slot = self._slots.pop(job_id)
+        for facet, key in self._doc_facets.pop(job_id, []):
+            bitsets = self._facet_bits[facet]
+            bits = bitsets.get(key, 0) & ~(1 << slot)
+            if bits:
+                bitsets[key] = bits
+            else:
+                bitsets.pop(key, None)
+        self._free_slots.append(slot)
+
+    def _expand_locked(self, term):
+        """Index tokens matching `term`: [(token, weight), ...]"""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        expansions = []
+        if term in self._postings:
+            expansions.append((term, 1.0))
+        i = bisect_left(self._sorted_terms, term)
+        while i < len(self._sorted_terms) and len(expansions) < MAX_PREFIX_EXPANSIONS:
+            token = self._sorted_terms[i]
+            if not token.startswith(term):
+                break
+            if token != term:
+                expansions.append((token, PREFIX_MATCH_WEIGHT))
+            i += 1
+        return expansions
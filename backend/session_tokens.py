@@ -0,0 +1,100 @@
+"""
+Stateless signed session tokens
+- Issued at login: base64url(JSON claims) + '.' + base64url(HMAC-SHA256)
+  carrying userId, userType, expiry and a random token id
+- Verified in memory (signature, expiry, revocation) - no database lookup
+- Logout revokes a token by id in a bounded LRU; entries leave it once
+  their token has expired anyway
+- Without a configured key, one is generated once and kept in a file so
+  restarts and sibling worker processes accept each other's tokens
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+
+def b64encode(raw):
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode('ascii')
+
+
+def b64decode(text):
+    return base64.urlsafe_b64decode(text + '=' * (-len(text) % 4))
+
+
+def load_or_create_secret(path):
+    """Signing key stored at `path`; the first process to need it creates it"""
+    if not os.path.exists(path):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='ascii') as f:
+            f.write(secrets.token_hex(32))
+        try:
+            os.chmod(tmp_path, 0o600)
+            # link() fails if another process created the file first - theirs wins
+            os.link(tmp_path, path)
+        except FileExistsError:
+            pass
+        finally:
+            os.remove(tmp_path)
+    with open(path, encoding='ascii') as f:
+        return f.read().strip()
+
+
+class SessionTokens:
+    """HMAC token issuer/verifier with an in-memory revocation list"""
+
+    def __init__(self, secret, ttl=86400, max_revoked=10000):
+        self._key = secret.encode('utf-8') if isinstance(secret, str) else secret
+        self.ttl = ttl
+        self.max_revoked = max_revoked
+        self._revoked = OrderedDict()   # token id -> expiry, oldest first
+        self._lock = threading.Lock()
+
+    def issue(self, user_id, user_type):
+        """(token, expires_at) for a freshly logged-in user"""
+        expires_at = int(time.time()) + self.ttl
+        claims = {'uid': user_id, 'typ': user_type, 'exp': expires_at, 'jti': secrets.token_urlsafe(12)}
+        payload = b64encode(json.dumps(claims, separators=(',', ':')).encode('utf-8'))
+        return f"{payload}.{self._sign(payload)}", expires_at
+
+    def verify(self, token):
+        """Claims {'uid', 'typ', 'exp', 'jti'} of a valid token, else None"""
+        try:
+            payload, signature = token.split('.')
+            # Bytes: compare_digest rejects non-ASCII str with a TypeError
+            if not hmac.compare_digest(signature.encode(), self._sign(payload).encode()):
+                return None
+            claims = json.loads(b64decode(payload))
+            if claims.get('exp', 0) <= time.time():
+                return None
+        except (AttributeError, TypeError, ValueError):
+            return None
+        with self._lock:
+            if claims.get('jti') in self._revoked:
+                return None
+        return claims
+
+    def revoke(self, token):
+        """Reject `token` from now on; returns False if it was not valid"""
+        claims = self.verify(token)
+        if claims is None:
+            return False
+        now = time.time()
+        with self._lock:
+            self._revoked[claims['jti']] = claims['exp']
+            # Expired entries are dropped first; past the cap the oldest goes
+            while self._revoked:
+                jti, exp = next(iter(self._revoked.items()))
+                if exp > now and len(self._revoked) <= self.max_revoked:
+                    break
+                del self._revoked[jti]
+        return True
+
+    def _sign(self, payload):
+        return b64encode(hmac.new(self._key, payload.encode('ascii'), hashlib.sha256).digest())
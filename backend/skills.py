@@ -0,0 +1,272 @@
+"""
+Skill name canonicalization
+- skill_key(): normalized lookup key ("Python ", "python3", "PYTHON" -> "python")
+- SkillNormalizer: synonym table + JobSkillsMaster names cached in memory,
+  so both write paths map free text onto one canonical name / SkillID
+- renormalize(): bulk job that merges existing duplicate skills
+
+Run this file directly to re-normalize the stored skills:
+
+    python skills.py
+"""
+
+import re
+import threading
+
+# Short trailing version numbers after a word of 3+ letters ("python3",
+# "java 8", "html5", "angular 12", "python 3.10", "vue v2"). Longer numbers
+# are part of the name ("SQL 2019", "ISO 27001") and are kept.
+_VERSION_SUFFIX_RE = re.compile(r'(?<=[a-z]{3})\s*v?\d{1,2}(\.(\d{1,2}|x))*$')
+# Names whose short trailing number is not a version (compared without separators)
+NUMBERED_SKILLS = frozenset({
+    'web2', 'web3', 'web20', 'web30', 'ipv4', 'ipv6', 'base64', 'win32', 'win64',
+    'utf8', 'utf16', 'sha1', 'sha2'
+})
+# Separators that do not distinguish skills ("node.js" / "node js" / "nodejs")
+_SEPARATOR_RE = re.compile(r'[\s.\-_]+')
+
+# One parameter per row, SQL Server allows 2100 per statement
+MERGE_ROWS_PER_STATEMENT = 2000
+
+# Built-in synonyms (alias -> canonical name); rows in SkillSynonyms win over these
+DEFAULT_SYNONYMS = {
+    'py': 'Python',
+    'js': 'JavaScript',
+    'ecmascript': 'JavaScript',
+    'ts': 'TypeScript',
+    'react.js': 'React',
+    'reactjs': 'React',
+    'node': 'Node.js',
+    'golang': 'Go',
+    'postgres': 'PostgreSQL',
+    'mssql': 'SQL Server',
+    'ms sql server': 'SQL Server',
+    'ms excel': 'Excel',
+    'microsoft excel': 'Excel',
+    'ml': 'Machine Learning',
+    'k8s': 'Kubernetes'
+}
+
+
+def clean_name(name):
+    """Display form of a typed skill name (trimmed, single spaces)"""
+    return ' '.join((name or '').split()).strip(' ,;:')
+
+
+def skill_key(name):
+    """Normalized key used to decide whether two skill names are the same skill"""
+    key = clean_name(name).lower()
+    if _SEPARATOR_RE.sub('', key) not in NUMBERED_SKILLS:
+        key = _VERSION_SUFFIX_RE.sub('', key)
+    return _SEPARATOR_RE.sub('', key)
+
+
+class SkillNormalizer:
+    """Thread-safe alias/canonical-name/SkillID cache"""
+
+    def __init__(self, synonyms=None):
+        self._defaults = dict(DEFAULT_SYNONYMS if synonyms is None else synonyms)
+        self._canonical = {}   # key -> canonical display name
+        self._ids = {}         # key -> JobSkillsMaster.SkillID
+        self._lock = threading.Lock()
+        self.loaded = False
+
+    def load(self, cursor):
+        """(Re)load synonyms and the skill master table"""
+        cursor.execute("SELECT Alias, CanonicalName FROM SkillSynonyms")
+        synonyms = dict(self._defaults)
+        synonyms.update({alias: canonical for alias, canonical in cursor.fetchall()})
+
+        cursor.execute("SELECT SkillID, SkillName FROM JobSkillsMaster ORDER BY SkillID")
+        masters = cursor.fetchall()
+
+        aliases = {skill_key(alias): clean_name(name) for alias, name in synonyms.items()}
+
+        # key -> canonical name; canonical key -> SkillID (lowest SkillID names the skill)
+        canonical, ids = {}, {}
+        for skill_id, skill_name in masters:
+            key = skill_key(skill_name)
+            if not key:
+                continue
+            target = skill_key(aliases[key]) if key in aliases else key
+            canonical.setdefault(target, aliases.get(key) or clean_name(skill_name))
+            canonical.setdefault(key, canonical[target])
+            ids.setdefault(target, skill_id)
+        for alias_key, name in aliases.items():
+            canonical[alias_key] = canonical.setdefault(skill_key(name), name)
+
+        with self._lock:
+            self._canonical = canonical
+            self._ids = ids
+            self.loaded = True
+        print(f"🏷️  Skill dictionary loaded: {len(ids)} skills, {len(canonical)} names")
+
+    def ensure_loaded(self, cursor):
+        if not self.loaded:
+            self.load(cursor)
+
+    def canonical(self, name):
+        """Canonical display name for a typed skill, or None if blank"""
+        cleaned = clean_name(name)
+        if not cleaned:
+            return None
+        with self._lock:
+            return self._canonical.get(skill_key(cleaned), cleaned)
+
+    def canonical_list(self, names):
+        """Canonical names for `names`, blanks and duplicates removed, order kept"""
+        seen, result = set(), []
+        for name in names:
+            canonical = self.canonical(name)
+            if canonical and skill_key(canonical) not in seen:
+                seen.add(skill_key(canonical))
+                result.append(canonical)
+        return result
+
+    def master_skill_ids(self, cursor, names):
+        """
+        JobSkillsMaster.SkillID for canonical names, creating missing rows with
+        one set-based MERGE. Returns ({name: skill_id}, created) where created
+        lists (name, skill_id) pairs to pass to publish() after commit, so a
+        rolled-back insert never leaks into the cache.
+        """
+        ids, missing = {}, {}
+        with self._lock:
+            for name in names:
+                skill_id = self._ids.get(skill_key(name))
+                if skill_id is not None:
+                    ids[name] = skill_id
+                else:
+                    missing.setdefault(skill_key(name), name)
+
+        created = []
+        missing = list(missing.values())
+        for i in range(0, len(missing), MERGE_ROWS_PER_STATEMENT):
+            chunk = missing[i:i + MERGE_ROWS_PER_STATEMENT]
+            cursor.execute(f"""
+                MERGE JobSkillsMaster WITH (HOLDLOCK) AS t
+                USING (VALUES {', '.join(['(?)'] * len(chunk))}) AS s(SkillName)
+                    ON t.SkillName = s.SkillName
+                WHEN MATCHED THEN UPDATE SET t.SkillName = t.SkillName
+                WHEN NOT MATCHED THEN INSERT (SkillName, IsActive) VALUES (s.SkillName, 1)
+                OUTPUT s.SkillName, INSERTED.SkillID, $action;
+            """, chunk)
+            existing = []
+            for skill_name, skill_id, action in cursor.fetchall():
+                if skill_name in ids and ids[skill_name] <= skill_id:
+                    continue
+                ids[skill_name] = skill_id
+                (created if action == 'INSERT' else existing).append((skill_name, skill_id))
+            # Rows that already existed are committed - cache them straight away
+            self.publish(existing)
+
+        for name in names:
+            if name not in ids:   # same skill under a differently typed name
+                ids[name] = ids[next(n for n in ids if skill_key(n) == skill_key(name))]
+        return ids, created
+
+    def publish(self, entries):
+        """Cache committed (name, skill_id) pairs"""
+        with self._lock:
+            for name, skill_id in entries:
+                self._ids.setdefault(skill_key(name), skill_id)
+
+
+def renormalize(cursor, normalizer):
+    """
+    Merge duplicate skills in place (caller commits):
+    - JobSkillsMaster rows with the same key collapse onto the lowest SkillID,
+      which takes the canonical name; JobSkills links are moved over
+    - resume Skills rows are renamed to their canonical name and
+      duplicates within one resume/skill type are dropped
+    Returns {'mergedSkills', 'renamedSkills', 'resumeSkillsRenamed'}.
+    """
+    normalizer.load(cursor)
+
+    cursor.execute("SELECT SkillID, SkillName FROM JobSkillsMaster ORDER BY SkillID")
+    survivors, merges, renames = {}, [], []
+    for skill_id, skill_name in cursor.fetchall():
+        canonical = normalizer.canonical(skill_name)
+        if not canonical:
+            continue
+        key = skill_key(canonical)
+        if key in survivors:
+            merges.append((skill_id, survivors[key]))
+            continue
+        survivors[key] = skill_id
+        if canonical != skill_name:
+            renames.append((canonical, skill_id))
+
+    if merges:
+        cursor.execute("CREATE TABLE #SkillMerge (OldID INT PRIMARY KEY, NewID INT NOT NULL)")
+        cursor.fast_executemany = True
+        try:
+            cursor.executemany("INSERT INTO #SkillMerge (OldID, NewID) VALUES (?, ?)", merges)
+        finally:
+            cursor.fast_executemany = False
+
+        # Drop links that would duplicate after the merge (keep the survivor's,
+        # else the lowest old SkillID), move the rest, then drop the duplicates
+        cursor.execute("""
+            DELETE js
+            FROM JobSkills js
+            INNER JOIN #SkillMerge m ON js.SkillID = m.OldID
+            WHERE EXISTS (
+                SELECT 1
+                FROM JobSkills other
+                LEFT JOIN #SkillMerge om ON other.SkillID = om.OldID
+                WHERE other.JobID = js.JobID
+                  AND ISNULL(om.NewID, other.SkillID) = m.NewID
+                  AND (om.OldID IS NULL OR other.SkillID < js.SkillID)
+            )
+        """)
+        cursor.execute("""
+            UPDATE js SET SkillID = m.NewID
+            FROM JobSkills js
+            INNER JOIN #SkillMerge m ON js.SkillID = m.OldID
+        """)
+        cursor.execute("DELETE FROM JobSkillsMaster WHERE SkillID IN (SELECT OldID FROM #SkillMerge)")
+        cursor.execute("DROP TABLE #SkillMerge")
+
+    if renames:
+        cursor.executemany("UPDATE JobSkillsMaster SET SkillName = ? WHERE SkillID = ?", renames)
+
+    # Resume skills are free text: rename, then de-duplicate per resume and type
+    cursor.execute("SELECT DISTINCT SkillName FROM Skills WHERE SkillName IS NOT NULL")
+    resume_renames = []
+    for (skill_name,) in cursor.fetchall():
+        canonical = normalizer.canonical(skill_name)
+        if canonical and canonical != skill_name:
+            resume_renames.append((canonical, skill_name))
+    if resume_renames:
+        cursor.executemany(
+            "UPDATE Skills SET SkillName = ?, UpdatedDate = GETDATE() WHERE SkillName = ?",
+            resume_renames
+        )
+    cursor.execute("""
+        WITH Ranked AS (
+            SELECT ROW_NUMBER() OVER (
+                PARTITION BY ResumeID, SkillType, SkillName ORDER BY CreatedDate
+            ) AS rn
+            FROM Skills
+        )
+        DELETE FROM Ranked WHERE rn > 1
+    """)
+
+    normalizer.load(cursor)
+    return {
+        'mergedSkills': len(merges),
+        'renamedSkills': len(renames),
+        'resumeSkillsRenamed': len(resume_renames)
+    }
+
+
+if __name__ == '__main__':
+    from backend import get_db_connection, skill_normalizer
+
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        result = renormalize(cursor, skill_normalizer)
+        conn.commit()
+        cursor.close()
+    print(f"✅ Skills re-normalized: {result}")
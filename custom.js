@@ -1032,12 +1032,15 @@ async function saveResumeToDatabase() {
         
         console.log('📤 Sending data to MSSQL backend...');
         
-        // Send to backend
+        // Send to backend (the session token makes the logged-in user the owner)
+        const headers = { 'Content-Type': 'application/json' };
+        const sessionToken = JSON.parse(localStorage.getItem('user') || '{}').token;
+        if (sessionToken) {
+            headers['Authorization'] = `Bearer ${sessionToken}`;
+        }
         const response = await fetch(`${API_URL}/save-resume`, {
             method: 'POST',
-            headers: {
-                'Content-Type': 'application/json',
-            },
+            headers: headers,
             body: JSON.stringify(resumeData)
         });
         